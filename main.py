@@ -1,6 +1,7 @@
 # main.py
 import sys
 import os
+import time
 import pygame
 
 from dotenv import load_dotenv
@@ -17,36 +18,31 @@ else:
 # Core systems
 from src.core.game_logging import get_logger
 from src.core.audio_manager import AudioManager, get_audio_manager
-from src.core.font_manager import FontManager
-from src.core import collision_physics as collision
-from src.core import constants as C
+from src.core.sprite_cache import SpriteSheetCache
 from src.core.game_state import GameStateManager
 from src.core.input_handler import InputHandler
+from src.core.fixed_timestep import FixedTimestep, RenderInterpolator
+from src.core.performance import PerformanceMonitor, SessionProfile
+from src.core.tracing import start_tracing, get_tracer, trace_span
+from src.core.simulation import (
+    LevelSimulation, take_step_actions, ACTION_RESPAWN,
+    EVENT_PLAYER_DIED, EVENT_LEVEL_COMPLETE, EVENT_RESPAWNED
+)
+from src.core.replay import Replay, ReplayRecorder, new_seed, REPLAY_EXTENSION, FLAG_CHECKPOINTS
 
 # Utils
 from src.utils import settings as S
 from src.utils.progression import GameProgression, LevelManager
 from src.utils.save_system import SaveSystem
-from src.utils.background import ParallaxBackground
-
-# UI
-from src.ui.health_display import HealthDisplay
-from src.ui.enemy_health_display import EnemyHealthDisplay
-from src.ui.spin_charge_display import SpinChargeDisplay
-from src.ui.roll_stamina_display import RollStaminaDisplay
-from src.ui.checkpoint import Checkpoint
 
 # Rendering
 from src.rendering.menus import PauseMenu, DeathMenu
 from src.rendering.game_screens import show_title_screen, show_level_transition, show_story_cutscene
-from src.rendering.rendering import (
-    draw_level_complete_screen,
-    draw_spiky_hazard, draw_brick_platform, draw_icy_brick_platform,
-    draw_northern_lights_ground, draw_snowy_ground, draw_wooden_platform,
-    draw_death_screen, draw_game_hud, draw_debug_coordinates
-)
+from src.rendering.rendering import draw_level_complete_screen, draw_death_screen
+from src.rendering.level_renderer import LevelRenderer
 from src.rendering.particles import ParticleManager
-from src.rendering.screen_shake import ScreenShake, apply_preset
+from src.rendering.screen_shake import ScreenShake
+from src.rendering.presenter import Presenter
 
 logger = get_logger(__name__)
 
@@ -84,6 +80,9 @@ def main(progression):
     from src.core.config_loader import get_config
     config = get_config()
 
+    # Scales the render surface to the window (display.scaling: integer, fit or smooth)
+    presenter = Presenter(config.get('display.scaling', 'fit'))
+
     # --- GLOBAL SETTINGS ---
     SHOW_HITBOXES = config.get('debug.show_hitboxes', False)
     SHOW_COORDINATES = config.get('debug.show_coordinates', False)
@@ -100,6 +99,10 @@ def main(progression):
     SHOW_PLATFORMS = config.get('debug.show_platforms', True)
     SHOW_HAZARDS = config.get('debug.show_hazards', True)
     SHOW_GROUND = config.get('debug.show_ground', False)
+    SHOW_PERFORMANCE = config.get('debug.show_performance', False)
+    PROFILE_SESSION = config.get('debug.profile_session', False)
+    RECORD_REPLAYS = config.get('debug.record_replays', False)
+    REPLAY_FILE = config.get('debug.replay_file', '')
 
     # --- AUDIO MANAGER ---
     audio_manager = AudioManager(enable_music=ENABLE_MUSIC, enable_sound=ENABLE_SOUND)
@@ -119,68 +122,116 @@ def main(progression):
     particle_mgr = ParticleManager()
     screen_shake = ScreenShake()
 
-    # --- GAME STATS ---
-    coins_collected = 0
-    level_time = 0  # Time in frames (divide by 60 for seconds)
-
-    # --- BUILD LEVEL USING LEVEL MANAGER ---
-    bg_color, platforms, hazards, level_width, player, enemies, projectiles, coins, world_name, goal_npc, background_layers, moving_platforms, disappearing_platforms, appearing_platforms = \
-        LevelManager.load_level(progression.current_level, progression)
-
-    # Save the original static platforms (we'll rebuild the full list each frame with dynamic platforms)
-    static_platforms = platforms.copy()
-
-    # --- LOAD PARALLAX BACKGROUND (now level-specific) ---
-    background = ParallaxBackground(background_layers, level_width)
-
-    # --- CHECKPOINT SETUP ---
-    checkpoints = []
-    furthest_checkpoint_index = -1
-    last_checkpoint_position = (100, 300)  # Default spawn position
-    enemies_dead_at_checkpoint = set()  # Track which enemies were dead when checkpoint was reached
-
-    # Save initial enemy data for respawning at checkpoints
-    # Store: (enemy_object, initial_x, initial_y, initial_health)
-    initial_enemy_data = []
-    for enemy in enemies:
-        initial_enemy_data.append({
-            'enemy': enemy,
-            'x': enemy.rect.x,
-            'y': enemy.rect.y,
-            'health': enemy.health,
-            'max_health': enemy.max_health
-        })
-
-    if progression.checkpoints_enabled and progression.current_level in LevelManager.CHECKPOINTS:
-        ground_y = LevelManager.GROUND_Y.get(progression.current_level, 400)
-        for checkpoint_x in LevelManager.CHECKPOINTS[progression.current_level]:
-            # Place flag on the ground (pole bottom at ground, flag above)
-            checkpoint_y = ground_y - 40  # Flag pole is 40px tall
-            checkpoints.append(Checkpoint(checkpoint_x, checkpoint_y))
-
-    # --- HEALTH UI SETUP ---
-    health_ui = HealthDisplay()
-    enemy_health_ui = EnemyHealthDisplay()
-    roll_stamina_ui = RollStaminaDisplay()
-    spin_charge_ui = SpinChargeDisplay()
-
-    camera_x = 0
-
-    # --- ROLL SOUND TRACKING ---
-    roll_sound_channel = None  # Track if roll sound is playing
+    # --- PERFORMANCE MONITOR ---
+    performance_monitor = PerformanceMonitor()
+    performance_monitor.tracer = get_tracer()
+    performance_monitor.enabled = SHOW_PERFORMANCE or PROFILE_SESSION or performance_monitor.tracer is not None
+    if PROFILE_SESSION:
+        # One profile for the whole run of the game, written when it exits
+        profile_name = f"session_{time.strftime('%Y%m%d_%H%M%S')}.json"
+        performance_monitor.session = SessionProfile.get_session(
+            SaveSystem.SAVE_DIR / "profiles" / profile_name,
+            spike_budget_ms=config.get('debug.spike_budget_ms', 1000 / 30)
+        )
+    performance_monitor.overlay_scopes = config.get('debug.profile_scopes', 8)
+
+    # --- REPLAY PLAYBACK (debug: replay recorded input for this level instead of the keyboard) ---
+    replay = None
+    if REPLAY_FILE:
+        try:
+            replay = Replay.load(REPLAY_FILE)
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not load replay {REPLAY_FILE}: {e}")
+        if replay is not None and replay.level != progression.current_level:
+            logger.info(f"Replay {REPLAY_FILE} is for level {replay.level}, playing normally")
+            replay = None
+
+    if replay is not None:
+        simulation_options = replay.simulation_options()
+        if (replay.difficulty != progression.difficulty or
+                bool(replay.flags & FLAG_CHECKPOINTS) != progression.checkpoints_enabled):
+            logger.warning("Replay was recorded with different difficulty/checkpoint settings and may desync")
+    else:
+        simulation_options = {
+            'show_enemies': SHOW_ENEMIES,
+            'show_platforms': SHOW_PLATFORMS,
+            'show_hazards': SHOW_HAZARDS,
+            'invincible': DEBUG_INVINCIBILITY,
+            'seed': new_seed() if RECORD_REPLAYS else None,
+        }
+
+    with trace_span("level.load", 'load', level=progression.current_level):
+        # --- LEVEL SIMULATION (loads the level, owns gameplay state and the per-step update) ---
+        simulation = LevelSimulation(
+            progression, game_state, audio_manager, particle_mgr, screen_shake,
+            enable_sound=ENABLE_SOUND, performance_monitor=performance_monitor, **simulation_options
+        )
+        replay_frames = iter(replay) if replay is not None else None
+
+        # --- REPLAY RECORDING (every simulation step's input, saved when the level ends) ---
+        replay_recorder = None
+        if RECORD_REPLAYS and replay is None:
+            replay_name = f"level_{progression.current_level}_{time.strftime('%Y%m%d_%H%M%S')}{REPLAY_EXTENSION}"
+            try:
+                replay_recorder = ReplayRecorder(SaveSystem.SAVE_DIR / "replays" / replay_name, simulation)
+            except OSError as e:
+                logger.error(f"Could not record replay: {e}")
+        player, enemies, projectiles = simulation.player, simulation.enemies, simulation.projectiles
+        moving_platforms, goal_npc = simulation.moving_platforms, simulation.goal_npc
+
+        sprite_cache_info = SpriteSheetCache.get_cache_info()
+        logger.debug(f"Sprite sheet cache: {sprite_cache_info['size']} sheets, {sprite_cache_info['bytes'] // 1024} KB, "
+                     f"{sprite_cache_info['hits']} hits, {sprite_cache_info['misses']} misses")
+        logger.debug(f"Mirrored frames: {sprite_cache_info['mirrored_frames']} frames, "
+                     f"{sprite_cache_info['mirrored_bytes'] // 1024} KB, built in {sprite_cache_info['mirror_build_ms']:.1f}ms")
+
+        # --- LEVEL RENDERER (platform layers, culling indexes, background and health UI) ---
+        renderer = LevelRenderer(
+            simulation, particle_mgr, performance_monitor,
+            show_hitboxes=SHOW_HITBOXES,
+            show_coordinates=SHOW_COORDINATES,
+            show_enemies=SHOW_ENEMIES,
+            show_platforms=SHOW_PLATFORMS,
+            show_hazards=SHOW_HAZARDS,
+            use_static_layer=config.get('rendering.static_layer', True)
+        )
+
+    def spike_context():
+        """Game state attached to frames the session profile captures as spikes"""
+        return {
+            'level': progression.current_level,
+            'camera_x': round(simulation.camera_x),
+            'player': [simulation.player.rect.x, simulation.player.rect.y],
+            'enemies': sum(1 for enemy in simulation.enemies if not getattr(enemy, 'is_dead', False)),
+            'projectiles': len(simulation.projectiles),
+            'particles': particle_mgr.count(),
+            'sim_steps': sim_steps,
+        }
+    performance_monitor.context_provider = spike_context
 
     # --- LEVEL COMPLETE BUTTON TRACKING ---
     previous_cutscene_button = "continue"  # Track for hover sound
 
+    # --- FIXED TIMESTEP (simulate at S.FPS, render at display.render_fps) ---
+    timestep = FixedTimestep(S.FPS, config.get('display.max_catchup_steps', 5))
+    interpolator = RenderInterpolator() if config.get('display.interpolate', True) else None
+    render_fps = config.get('display.render_fps', S.FPS)
+    previous_camera_x = simulation.camera_x
+    pending_actions = []  # Jump/spin/respawn input waiting for the next simulation step
+    clock.tick()  # Don't count level loading as simulation time
+
     # --- GAME LOOP ---
     running = True
     while running:
-        dt = clock.tick(S.FPS)
+        dt = clock.tick(render_fps)
+        sim_steps = timestep.advance(dt)
+        performance_monitor.start_frame()
 
         # --- INPUT HANDLING (using InputHandler) ---
         command = input_handler.handle_events(
-            game_state, player, pause_menu, death_menu, audio_manager
+            game_state, pause_menu, death_menu, audio_manager
         )
+        pending_actions.extend(input_handler.actions)
 
         # --- WINDOW RESIZE HANDLING ---
         if input_handler.window_resized and input_handler.new_window_size:
@@ -194,680 +245,109 @@ def main(progression):
             display_screen = pygame.display.set_mode((display_width, display_height), pygame.RESIZABLE)
             logger.debug(f"Window resized: scale={S.current_display_scale:.2f}, size={display_width}x{display_height}, ratio=5:3")
 
+        if command in ("RESTART", "MAIN_MENU", "QUIT") and replay_recorder is not None:
+            replay_recorder.close()
+
         if command == "RESTART":
             return "RESTART"
         elif command == "MAIN_MENU":
             return "MAIN_MENU"
         elif command == "CHECKPOINT":
-            # Respawn at last checkpoint
-            if furthest_checkpoint_index >= 0:
-                checkpoint_x = checkpoints[furthest_checkpoint_index].x
-
-                # Respawn enemies that are after the checkpoint
-                for enemy_data in initial_enemy_data:
-                    enemy = enemy_data['enemy']
-                    # If enemy's initial position is after the checkpoint, respawn it
-                    # BUT skip enemies that were already dead when checkpoint was reached
-                    if enemy_data['x'] > checkpoint_x and id(enemy) not in enemies_dead_at_checkpoint:
-                        enemy.rect.x = enemy_data['x']
-                        enemy.rect.y = enemy_data['y']
-                        enemy.health = enemy_data['max_health']
-                        enemy.is_dead = False
-                        # Reset enemy state if it has these attributes
-                        if hasattr(enemy, 'death_animation_complete'):
-                            enemy.death_animation_complete = False
-                        if hasattr(enemy, 'death_complete'):
-                            enemy.death_complete = False
-                        if hasattr(enemy, 'velocity_x'):
-                            enemy.velocity_x = 0
-                        if hasattr(enemy, 'velocity_y'):
-                            enemy.velocity_y = 0
-                        # Reset animation frame to prevent index errors
-                        if hasattr(enemy, 'current_frame'):
-                            enemy.current_frame = 0
-                        if hasattr(enemy, 'animation_counter'):
-                            enemy.animation_counter = 0
-                        if hasattr(enemy, 'hurt_flash_timer'):
-                            enemy.hurt_flash_timer = 0
-                        # Re-add enemy to sprite group if it was removed (killed)
-                        if enemy not in enemies:
-                            enemies.add(enemy)
-
-                # Clear projectiles
-                projectiles.empty()
-
-                # Respawn player at checkpoint
-                player.rect.x, player.rect.y = last_checkpoint_position
-                player.health = player.max_health
-                player.is_dead = False
-                player.invincible = True
-                player.invincible_timer = player.invincible_duration
-                player.update_hitbox_position()
-                game_state.game_over = False
-                game_state.show_death_screen = False
-                game_state.death_animation_timer = 0
-                game_state.death_fade_alpha = 0
-                # Note: level_time continues - no reset!
-                # Resume music
-                if ENABLE_MUSIC and not DISABLE_ALL_AUDIO:
-                    audio_manager.play_music(f"level_{progression.current_level}")
+            # Respawn at last checkpoint (on the next simulation step)
+            pending_actions.append(ACTION_RESPAWN)
         elif command == "QUIT":
             running = False
 
-        # Check if player is dead
-        if player.health <= 0 and not game_state.game_over:
-            game_state.trigger_death()
-            # Update death menu to show checkpoint option if available
-            has_checkpoint = progression.checkpoints_enabled and furthest_checkpoint_index >= 0
-            death_menu.set_checkpoint_available(has_checkpoint)
-            if ENABLE_MUSIC and not DISABLE_ALL_AUDIO:
-                audio_manager.stop_music()  # Stop music on death
-            audio_manager.play_sound('death')  # Play death sound effect
-
-        # Handle death animation delay
-        game_state.update_death_animation()
-
-        # --- UPDATE (only if actively playing) ---
-        if game_state.is_playing:
-            # Increment level timer
-            level_time += 1
-            
-            keys = pygame.key.get_pressed()
-
-            player.update(keys)
+        # --- FIXED-RATE SIMULATION (whole steps, capped catch-up after stalls) ---
+        performance_monitor.start_update()
+        for _ in range(sim_steps):
+            # Remember the last simulated positions for render interpolation
+            previous_camera_x = simulation.camera_x
+            if interpolator is not None:
+                interpolator.snapshot(player, enemies, projectiles, moving_platforms)
+
+            # --- UPDATE (playing, or dead and waiting for the death menu) ---
+            if game_state.is_playing or game_state.game_over:
+                frame = next(replay_frames, None) if replay_frames is not None else None
+                if frame is not None:
+                    keys, step_actions = frame
+                    pending_actions.clear()  # Keyboard gameplay input is ignored during playback
+                else:
+                    keys = pygame.key.get_pressed()
+                    step_actions = take_step_actions(pending_actions)
+
+                if replay_recorder is not None:
+                    replay_recorder.record(keys, step_actions)
+                events = simulation.update(keys, step_actions)
+
+                if EVENT_RESPAWNED in events:
+                    # Note: level_time continues - no reset!
+                    # Resume music
+                    if ENABLE_MUSIC and not DISABLE_ALL_AUDIO:
+                        audio_manager.play_music(f"level_{progression.current_level}")
+
+                if EVENT_PLAYER_DIED in events:
+                    # Update death menu to show checkpoint option if available
+                    death_menu.set_checkpoint_available(simulation.has_checkpoint)
 
-            # --- ROLL SOUND HANDLING ---
-            if player.is_rolling:
-                # Start roll sound if not already playing
-                if roll_sound_channel is None or not roll_sound_channel.get_busy():
-                    if ENABLE_SOUND and not DISABLE_ALL_AUDIO:
-                        roll_sound_channel = audio_manager.play_sound('roll', loops=-1)  # Loop infinitely
-            else:
-                # Stop roll sound when not rolling
-                if roll_sound_channel is not None and roll_sound_channel.get_busy():
-                    if ENABLE_SOUND and not DISABLE_ALL_AUDIO:
-                        audio_manager.stop_sound('roll')
-                    roll_sound_channel = None
-
-            # --- UPDATE PARTICLE SYSTEM ---
-            particle_mgr.update()
-
-            # --- UPDATE SCREEN SHAKE ---
-            screen_shake.update()
-
-            # --- CHECK CHECKPOINTS ---
-            if progression.checkpoints_enabled:
-                for i, checkpoint in enumerate(checkpoints):
-                    if checkpoint.check_player_reached(player):
-                        furthest_checkpoint_index = i
-                        # Save the player's current Y position when they reach the checkpoint
-                        # This ensures they respawn at the same height they were at (on platform or ground)
-                        last_checkpoint_position = (checkpoint.x, player.rect.y)
-                        # Record which enemies are currently dead (so we don't respawn them)
-                        enemies_dead_at_checkpoint.clear()
-                        for enemy_data in initial_enemy_data:
-                            if getattr(enemy_data['enemy'], 'is_dead', False):
-                                enemies_dead_at_checkpoint.add(id(enemy_data['enemy']))
-                        # Optional: play checkpoint sound
-                        # audio_manager.play_sound('checkpoint')
-
-            # --- LEFT BOUNDARY WALL (prevent player from going off-screen left) ---
-            if player.rect.left < 0:
-                player.rect.left = 0
-                player.update_hitbox_position()
-
-            # --- CHECK LEVEL GOAL NPC ---
-            if goal_npc and not game_state.level_complete and player.hitbox.colliderect(goal_npc.trigger_zone):
-                # Check if player has collected enough coins for their difficulty level
-                coins_required = progression.get_coin_requirement(progression.current_level)
-                if coins_collected >= coins_required:
-                    game_state.trigger_level_complete()
-                    audio_manager.stop_music()  # Stop music on level complete
-                    audio_manager.play_sound('stage_clear')  # Play victory sound
+                if EVENT_LEVEL_COMPLETE in events:
                     # Complete the level in progression system
                     progression.complete_level(
                         level_num=progression.current_level,
-                        coins_collected=coins_collected,
-                        time_taken=level_time,
+                        coins_collected=simulation.coins_collected,
+                        time_taken=simulation.level_time,
                         deaths=0  # Not tracking deaths
                     )
 
-                    # Submit score to scoreboard
-                    SaveSystem.submit_score(
-                        username=current_username,
-                        level_num=progression.current_level,
-                        time_taken=level_time,
-                        coins_collected=coins_collected,
-                        difficulty=progression.difficulty,
-                        checkpoints_enabled=progression.checkpoints_enabled
-                    )
+                    # Submit score to scoreboard (local file plus the online leaderboard request)
+                    with trace_span("score.submit", 'io', level=progression.current_level):
+                        SaveSystem.submit_score(
+                            username=current_username,
+                            level_num=progression.current_level,
+                            time_taken=simulation.level_time,
+                            coins_collected=simulation.coins_collected,
+                            difficulty=progression.difficulty,
+                            checkpoints_enabled=progression.checkpoints_enabled
+                        )
 
                     # Save progress to disk
                     if SaveSystem.save_progress(progression, current_username):
                         print(f"💾 Progress saved! Level {progression.current_level} complete.")
-                # If not enough coins, nothing happens - player just stands there
-            
-            # --- CHECK HAZARDS FIRST (before platform collision adjusts position) ---
-            if SHOW_HAZARDS:  # Only check hazards if they're enabled
-                for hazard in hazards:
-                    if player.hitbox.colliderect(hazard):
-                        if not game_state.game_over and not DEBUG_INVINCIBILITY:  # Only trigger once (unless invincible)
-                            player.health = 0
-                            player.die()
-                            game_state.trigger_death()
-                            # Update death menu to show checkpoint option if available
-                            has_checkpoint = progression.checkpoints_enabled and furthest_checkpoint_index >= 0
-                            death_menu.set_checkpoint_available(has_checkpoint)
-                            audio_manager.stop_music()  # Stop music
-                            audio_manager.play_sound('death')  # Play death sound
-                        break
-
-            # --- CHECK FOR FALLING OFF THE MAP (pit death) ---
-            if player.rect.y > 550:  # Player has fallen below the screen (screen height = 600)
-                if not game_state.game_over and not DEBUG_INVINCIBILITY:
-                    player.health = 0
-                    player.die()
-                    game_state.trigger_death()
-                    # Update death menu to show checkpoint option if available
-                    has_checkpoint = progression.checkpoints_enabled and furthest_checkpoint_index >= 0
-                    death_menu.set_checkpoint_available(has_checkpoint)
-                    audio_manager.stop_music()  # Stop music
-                    audio_manager.play_sound('death')  # Play death sound
-
-            # --- PLATFORM COLLISION ---
-            player.on_ground = False  # Reset each frame
-
-            # Save vel_y before platform collision (for stomp detection later)
-            player_vel_y_before_platform_collision = player.vel_y
-
-            if SHOW_PLATFORMS:  # Only collide with platforms if they're enabled
-                player.on_ground = collision.check_platform_collision_player(player, platforms)
-            
-            # --- PRE-UPDATE ENEMY EDGE DETECTION ---
-            # ONLY stop enemies at GROUND-LEVEL edges (holes in the ground)
-            if SHOW_ENEMIES:
-                all_walkable = platforms  # Enemies pass through hazards, only collide with platforms
-
-                for enemy in enemies:
-                    # Skip if enemy is dead or doesn't have direction
-                    if getattr(enemy, 'is_dead', False) or not hasattr(enemy, 'direction'):
-                        continue
-
-                    # Reset edge flag
-                    enemy.at_platform_edge = False
-
-                    # Find the platform the enemy is currently standing on
-                    current_platform = None
-                    tolerance = 10
-
-                    for platform in all_walkable:
-                        if (enemy.hitbox.bottom >= platform.top - tolerance and
-                            enemy.hitbox.bottom <= platform.top + tolerance and
-                            enemy.hitbox.right > platform.left and
-                            enemy.hitbox.left < platform.right):
-                            current_platform = platform
-                            break
-
-                    if current_platform:
-                        # Only apply edge detection if enemy is on a GROUND platform
-                        # Ground platforms are typically at Y=400 (±30 pixels tolerance)
-                        is_ground_platform = abs(current_platform.top - 400) <= 30
-
-                        if is_ground_platform:
-                            # Check ahead in the direction the enemy will move
-                            look_ahead = enemy.hitbox.width // 2  # Look ahead half the enemy's width
-                            edge_buffer = 15  # Buffer zone to prevent oscillation at edges
-
-                            if enemy.direction == -1:  # Moving left
-                                # Check if we're at or past the left edge (with buffer)
-                                if enemy.hitbox.left <= current_platform.left + edge_buffer:
-                                    enemy.direction = 1
-                                    enemy.facing_right = True
-                                    enemy.at_platform_edge = True
-                            elif enemy.direction == 1:  # Moving right
-                                # Check if we're at or past the right edge (with buffer)
-                                if enemy.hitbox.right >= current_platform.right - edge_buffer:
-                                    enemy.direction = -1
-                                    enemy.facing_right = False
-                                    enemy.at_platform_edge = True
-
-                            # SPECIAL: Spiked Slimes should avoid walking onto hazards
-                            from src.entities.enemies.spiked_slime import SpikedSlime
-                            if isinstance(enemy, SpikedSlime) and SHOW_HAZARDS:
-                                # Check if there's a hazard ahead
-                                hazard_check_distance = 40
-
-                                for hazard in hazards:
-                                    # Check if hazard is ahead in movement direction
-                                    if enemy.direction == -1:  # Moving left
-                                        if (hazard.right >= enemy.hitbox.left - hazard_check_distance and
-                                            hazard.left < enemy.hitbox.left and
-                                            abs(hazard.top - enemy.hitbox.bottom) < 50):
-                                            # Hazard ahead! Turn around
-                                            enemy.direction = 1
-                                            enemy.facing_right = True
-                                            enemy.at_platform_edge = True
-                                            break
-                                    elif enemy.direction == 1:  # Moving right
-                                        if (hazard.left <= enemy.hitbox.right + hazard_check_distance and
-                                            hazard.right > enemy.hitbox.right and
-                                            abs(hazard.top - enemy.hitbox.bottom) < 50):
-                                            # Hazard ahead! Turn around
-                                            enemy.direction = -1
-                                            enemy.facing_right = False
-                                            enemy.at_platform_edge = True
-                                            break
-
-            # Update enemies (they add projectiles to the group)
-            if SHOW_ENEMIES:  # Only update enemies if they're enabled
-                for enemy in enemies:
-                    enemy.update(player=player, projectile_group=projectiles)
-
-            # --- ENEMY PLATFORM COLLISION ---
-            if SHOW_ENEMIES:  # Only handle enemy collisions if they're enabled
-                for enemy in enemies:
-                    # Skip if enemy is dead
-                    if getattr(enemy, 'is_dead', False):
-                        continue
-
-                    # Apply gravity if enemy has it
-                    if hasattr(enemy, 'vel_y'):
-                        enemy.vel_y += enemy.gravity
-                        enemy.rect.y += enemy.vel_y
-                    else:
-                        # Add gravity properties if they don't exist
-                        enemy.vel_y = 0
-                        enemy.gravity = 0.6
-
-                    # Kill enemies that fall below the screen (fell in a pit)
-                    if enemy.rect.top > S.WINDOW_HEIGHT + 100:
-                        enemy.is_dead = True
-                        # Enemy death sounds are handled by the enemy objects themselves
-                        continue  # Skip rest of processing for this enemy
-
-                    # Check collision with platforms only (enemies pass through hazards)
-                    all_walkable = platforms
-                    enemy_on_ground = collision.check_platform_collision_enemy(enemy, all_walkable)
-
-                    # Check if enemy is at patrol edge - make them turn around
-                    if enemy_on_ground and hasattr(enemy, 'patrol_left') and hasattr(enemy, 'patrol_right'):
-                        if hasattr(enemy, 'direction'):
-                            # Find which platform the enemy is on
-                            for platform in all_walkable:
-                                tolerance = 5
-                                if (enemy.hitbox.right > platform.left and
-                                    enemy.hitbox.left < platform.right and
-                                    enemy.hitbox.bottom >= platform.top - tolerance and
-                                    enemy.hitbox.bottom <= platform.top + tolerance):
-                                    # Enemy is on this platform - check edges
-                                    if enemy.direction == -1:  # Moving left
-                                        if enemy.hitbox.left <= platform.left + 10:
-                                            enemy.direction = 1
-                                            enemy.facing_right = True
-                                    elif enemy.direction == 1:  # Moving right
-                                        if enemy.hitbox.right >= platform.right - 10:
-                                            enemy.direction = -1
-                                            enemy.facing_right = False
-                                    break
-            
-            # Update projectiles (snowballs, iceballs, fireballs, spikes)
-            projectiles.update()
-            
-            # Check for newly spawned projectiles that need sound (only if player is nearby)
-            if ENABLE_SOUND and audio_manager.get_sound('enemy_projectile'):
-                PROJECTILE_SOUND_RANGE = 400  # Only hear projectiles within this distance
-                for projectile in projectiles:
-                    if hasattr(projectile, 'spawn_sound') and projectile.spawn_sound:
-                        # Calculate distance from player to projectile
-                        distance = abs(player.hitbox.centerx - projectile.rect.centerx)
-                        
-                        if distance <= PROJECTILE_SOUND_RANGE:
-                            # Player is close enough to hear it
-                            # Optional: adjust volume based on distance
-                            volume_multiplier = 1.0 - (distance / PROJECTILE_SOUND_RANGE) * 0.6
-                            audio_manager.set_sound_volume('enemy_projectile', 0.2 * volume_multiplier)
-                            audio_manager.play_sound('enemy_projectile')
-                        
-                        projectile.spawn_sound = False  # Only check once
-            
-            # Update coins
-            coins.update()
-
-            # Update goal NPC (if exists)
-            if goal_npc:
-                goal_npc.update()
-
-            # Rebuild platforms list from static platforms each frame
-            platforms = static_platforms.copy()
-
-            # Update moving platforms and add to collision list
-            for moving_platform in moving_platforms:
-                moving_platform.update()
-                platforms.append(moving_platform.rect)
-
-            # Update disappearing platforms and add to collision list (if visible)
-            player_on_disappearing = False
-            for disappearing_platform in disappearing_platforms:
-                # Check if player is standing on this platform
-                on_platform = (not disappearing_platform.disappeared and
-                              player.hitbox.bottom <= disappearing_platform.rect.top + 10 and
-                              player.hitbox.bottom >= disappearing_platform.rect.top - 5 and
-                              player.hitbox.right > disappearing_platform.rect.left and
-                              player.hitbox.left < disappearing_platform.rect.right)
-                disappearing_platform.update(on_platform)
-                # Add disappearing platforms to regular platforms list for collision (if not disappeared)
-                if not disappearing_platform.disappeared:
-                    platforms.append(disappearing_platform.rect)
-
-            # Update appearing platforms and add to collision list ONLY when solid
-            for appearing_platform in appearing_platforms:
-                appearing_platform.update()
-                # Only add to collision when the platform is fully solid
-                if appearing_platform.is_solid():
-                    platforms.append(appearing_platform.rect)
-
-            # --- COLLISION DETECTION ---
-            if SHOW_ENEMIES:  # Only check enemy collisions if they're enabled
-                for enemy in enemies:
-                    # Skip dead enemies completely
-                    if getattr(enemy, 'is_dead', False):
-                        continue
-
-                    # Get enemy's power vulnerability settings (default to all False if not present)
-                    vulnerable_to = getattr(enemy, 'vulnerable_to', {
-                        'stomp': False,
-                        'spin_attack': False,
-                        'roll': False
-                    })
-
-                    # Check body hitbox collision
-                    if player.hitbox.colliderect(enemy.hitbox):
-                        # --- SPIN ATTACK DETECTION (check FIRST for priority) ---
-                        if player.is_spinning:
-                            # Player is spin attacking
-                            if vulnerable_to.get('spin_attack', False):
-                                # Enemy is vulnerable to spin attack - deal damage to enemy
-                                if enemy.take_damage(1):
-                                    # Optional: slight bounce for player on successful hit
-                                    player.vel_y = -8
-
-                                    # Visual feedback: particles and screen shake
-                                    particle_mgr.spawn_burst(
-                                        enemy.rect.centerx,
-                                        enemy.rect.centery,
-                                        count=10,
-                                        particle_type='hit'
-                                    )
-                                    apply_preset(screen_shake, 'stomp_enemy')
-
-                                    # Check if enemy is defeated
-                                    if enemy.health <= 0:
-                                        particle_mgr.spawn_enemy_defeat(
-                                            enemy.rect.x,
-                                            enemy.rect.y,
-                                            enemy.rect.width,
-                                            enemy.rect.height
-                                        )
-                                        apply_preset(screen_shake, 'enemy_defeat')
-                            else:
-                                # Enemy is NOT vulnerable to spin attack - player takes damage
-                                if not player.invincible and not DEBUG_INVINCIBILITY:
-                                    knockback_direction = 1 if player.rect.centerx < enemy.rect.centerx else -1
-                                    player.take_damage(1, knockback_direction)
-                                    if ENABLE_SOUND:
-                                        audio_manager.play_sound('bump')
-                        
-                        # --- ROLL DETECTION ---
-                        elif player.is_rolling:
-                            # Player is rolling
-                            if vulnerable_to.get('roll', False):
-                                # Enemy is vulnerable to roll - deal damage to enemy
-                                if enemy.take_damage(1):
-                                    # Apply knockback velocity to enemy (push away from player)
-                                    knockback_direction = 1 if player.rect.centerx < enemy.rect.centerx else -1
-                                    enemy.knockback_velocity = knockback_direction * 20
-
-                                    # Visual feedback: particles and screen shake
-                                    particle_mgr.spawn_burst(
-                                        enemy.rect.centerx,
-                                        enemy.rect.centery,
-                                        count=10,
-                                        particle_type='hit'
-                                    )
-                                    apply_preset(screen_shake, 'stomp_enemy')
-
-                                    # Check if enemy is defeated
-                                    if enemy.health <= 0:
-                                        particle_mgr.spawn_enemy_defeat(
-                                            enemy.rect.x,
-                                            enemy.rect.y,
-                                            enemy.rect.width,
-                                            enemy.rect.height
-                                        )
-                                        apply_preset(screen_shake, 'enemy_defeat')
-
-                                    # Stop player's roll immediately and prevent re-rolling
-                                    player.is_rolling = False
-                                    player.roll_timer = 0.0
-                                    player.roll_speed_current = player.roll_speed_initial
-                                    player.roll_cooldown = 6  # 0.1 seconds at 60 fps
-
-                                    # Reset to standing animation
-                                    player.current_frame = 0
-                                    player.frame_counter = 0.0
-
-                                    # Apply dramatic knockback - push player back and up
-                                    bounce_distance = 60  # Much stronger knockback
-                                    player.rect.x += -knockback_direction * bounce_distance
-
-                                    # Give player upward velocity for a small bounce
-                                    player.vel_y = -6  # Small upward bounce
-                                    player.on_ground = False  # Make player airborne
-
-                                    player.update_hitbox_position()
-
-                                    # Grant brief invincibility after successful roll hit (0.4 seconds)
-                                    player.invincible = True
-                                    player.invincible_timer = 24  # 0.4 seconds at 60 fps
-
-                                    # Play land_enemy sound
-                                    if ENABLE_SOUND:
-                                        audio_manager.play_sound('land_enemy')
-
-                                    # Break out of enemy loop to prevent multiple hits in one frame
-                                    break
-                            else:
-                                # Enemy is NOT vulnerable to roll - player takes damage
-                                if not player.invincible and not DEBUG_INVINCIBILITY:
-                                    knockback_direction = 1 if player.rect.centerx < enemy.rect.centerx else -1
-                                    player.take_damage(1, knockback_direction)
-                                    if ENABLE_SOUND:
-                                        audio_manager.play_sound('bump')
-                        
-                        # --- STOMP DETECTION ---
-                        elif player_vel_y_before_platform_collision > 0 and player.hitbox.centery < enemy.hitbox.centery:
-                            # Player is coming from above (falling onto enemy) - use center comparison for more reliable detection
-                            # This prevents damage when landing on enemies under low platforms
-                            # Note: We use player_vel_y_before_platform_collision because platform collision sets vel_y to 0
-                            if vulnerable_to.get('stomp', False):
-                                # Enemy is vulnerable to stomp - deal damage to enemy
-                                enemy.take_damage(1)
-                                player.vel_y = -15  # Always bounce player up on stomp
-
-                                # Visual feedback: particles and screen shake
-                                particle_mgr.spawn_burst(
-                                    enemy.rect.centerx,
-                                    enemy.rect.top,
-                                    count=10,
-                                    particle_type='hit'
-                                )
-                                apply_preset(screen_shake, 'stomp_enemy')
-
-                                # Check if enemy is defeated
-                                if enemy.health <= 0:
-                                    particle_mgr.spawn_enemy_defeat(
-                                        enemy.rect.x,
-                                        enemy.rect.y,
-                                        enemy.rect.width,
-                                        enemy.rect.height
-                                    )
-                                    apply_preset(screen_shake, 'enemy_defeat')
-
-                                # Play appropriate stomp sound
-                                if ENABLE_SOUND:
-                                    # Check if enemy is a slime
-                                    if hasattr(enemy, '__class__') and 'Slime' in enemy.__class__.__name__:
-                                        if True:  # Sound handled by audio_manager
-                                            audio_manager.play_sound('land_slime')
-                                    else:
-                                        if True:  # Sound handled by audio_manager
-                                            audio_manager.play_sound('land_enemy')
-                            else:
-                                # Enemy is NOT vulnerable to stomp - player takes damage
-                                if not player.invincible and not DEBUG_INVINCIBILITY:
-                                    knockback_direction = 1 if player.rect.centerx < enemy.rect.centerx else -1
-                                    player.take_damage(1, knockback_direction)
-
-                                    # Visual feedback for taking damage
-                                    particle_mgr.spawn_hit_effect(
-                                        player.rect.centerx,
-                                        player.rect.centery,
-                                        knockback_direction
-                                    )
-                                    apply_preset(screen_shake, 'take_damage')
-
-                                    if ENABLE_SOUND:
-                                        audio_manager.play_sound('bump')
-
-                        # --- NORMAL COLLISION (no special power active) ---
-                        else:
-                            # Regular side collision - player takes damage and knockback
-                            if not player.invincible and not player.is_spinning and not DEBUG_INVINCIBILITY:
-                                knockback_direction = 1 if player.rect.centerx < enemy.rect.centerx else -1
-                                player.take_damage(1, knockback_direction)
-
-                                # Visual feedback for taking damage
-                                particle_mgr.spawn_hit_effect(
-                                    player.rect.centerx,
-                                    player.rect.centery,
-                                    knockback_direction
-                                )
-                                apply_preset(screen_shake, 'take_damage')
-
-                                if ENABLE_SOUND:
-                                    audio_manager.play_sound('bump')
-                    
-                    # Check sword hitbox collision (for Swordsman enemy)
-                    if hasattr(enemy, 'sword_hitbox_active') and enemy.sword_hitbox_active:
-                        if player.hitbox.colliderect(enemy.sword_hitbox):
-                            # Sword always damages player UNLESS player is spin attacking
-                            if not player.invincible and not player.is_spinning and not DEBUG_INVINCIBILITY:
-                                knockback_direction = 1 if player.rect.centerx < enemy.rect.centerx else -1
-                                player.take_damage(1, knockback_direction)
-
-                                # Visual feedback for sword hit
-                                particle_mgr.spawn_hit_effect(
-                                    player.rect.centerx,
-                                    player.rect.centery,
-                                    knockback_direction
-                                )
-                                apply_preset(screen_shake, 'take_damage')
-
-                                if ENABLE_SOUND:
-                                    audio_manager.play_sound('bump')
-
-                    # Check punch hitbox collision (for Snowy enemy)
-                    if hasattr(enemy, 'punch_hitbox_active') and enemy.punch_hitbox_active:
-                        if player.hitbox.colliderect(enemy.punch_hitbox):
-                            # Punch always damages player UNLESS player is spin attacking
-                            if not player.invincible and not player.is_spinning and not DEBUG_INVINCIBILITY:
-                                damage = getattr(enemy, 'punch_damage', 1)
-                                knockback_direction = 1 if player.rect.centerx < enemy.rect.centerx else -1
-                                player.take_damage(damage, knockback_direction)
-
-                                # Visual feedback for punch hit
-                                particle_mgr.spawn_hit_effect(
-                                    player.rect.centerx,
-                                    player.rect.centery,
-                                    knockback_direction
-                                )
-                                apply_preset(screen_shake, 'take_damage')
-
-                                if ENABLE_SOUND:
-                                    audio_manager.play_sound('bump')
-            
-            # Check projectile hits (snowballs, iceballs, fireballs, spikes)
-            if SHOW_ENEMIES:  # Only check projectiles if enemies are enabled
-                for projectile in projectiles:
-                    if player.hitbox.colliderect(projectile.rect):
-                        # Projectiles don't damage player if they're spin attacking
-                        if not player.is_spinning and not DEBUG_INVINCIBILITY:
-                            # Knockback away from projectile
-                            knockback_direction = 1 if player.rect.centerx < projectile.rect.centerx else -1
-                            player.take_damage(1, knockback_direction)
-
-                            # Visual feedback for projectile hit
-                            particle_mgr.spawn_hit_effect(
-                                player.rect.centerx,
-                                player.rect.centery,
-                                knockback_direction
-                            )
-                            apply_preset(screen_shake, 'take_damage')
-
-                            if ENABLE_SOUND:
-                                audio_manager.play_sound('bump')
-
-                        # Always destroy the projectile on contact (even during spin)
-                        # Add particle burst when projectile is destroyed
-                        particle_mgr.spawn_burst(
-                            projectile.rect.centerx,
-                            projectile.rect.centery,
-                            count=6,
-                            particle_type='snow'
-                        )
-                        projectile.kill()
-            
-            # --- COIN COLLECTION ---
-            for coin in coins:
-                if player.hitbox.colliderect(coin.hitbox):
-                    coin.collect()
-                    coins_collected += 1
-
-                    # Visual feedback: sparkle ring
-                    particle_mgr.spawn_coin_sparkles(coin.rect.centerx, coin.rect.centery)
-
-                    if ENABLE_SOUND:
-                        audio_manager.play_sound('coin')
-
-            # --- CAMERA FOLLOW ---
-            if player.rect.centerx - camera_x > S.WINDOW_WIDTH * 0.6:
-                camera_x = player.rect.centerx - S.WINDOW_WIDTH * 0.6
-            elif player.rect.centerx - camera_x < S.WINDOW_WIDTH * 0.4:
-                camera_x = player.rect.centerx - S.WINDOW_WIDTH * 0.4
-
-            camera_x = max(0, min(camera_x, level_width - S.WINDOW_WIDTH))
-        elif game_state.cutscene_active:
-            # --- CUTSCENE MODE ---
-            # Keep updating NPC animation during cutscene (if exists)
-            if goal_npc:
-                goal_npc.update()
 
+                    if replay_recorder is not None:
+                        replay_recorder.close()
+            elif game_state.cutscene_active:
+                # Keep updating NPC animation during cutscene (if exists)
+                if goal_npc:
+                    goal_npc.update()
+
+            # --- MENU ANIMATION (frame-counted timers advance once per step) ---
+            if game_state.show_death_screen:
+                # Fade in death screen
+                if game_state.death_fade_alpha < 255:
+                    game_state.death_fade_alpha = min(255, game_state.death_fade_alpha + game_state.death_fade_speed)
+                death_menu.update()
+            if game_state.paused:
+                pause_menu.update()
+
+        performance_monitor.end_update()
+
+        # --- CUTSCENE MODE (button input is handled once per rendered frame) ---
+        if game_state.cutscene_active:
             # Pre-render to get button rectangles (needed for mouse clicks)
             temp_surface = pygame.Surface((S.WINDOW_WIDTH, S.WINDOW_HEIGHT))
             continue_rect, menu_rect = draw_level_complete_screen(
                 temp_surface,
                 progression.current_level,
-                coins_collected,
-                level_time,
+                simulation.coins_collected,
+                simulation.level_time,
                 progression.username,
                 game_state.cutscene_selected_button
             )
 
             # Check mouse hover to update button selection
             mouse_pos = pygame.mouse.get_pos()
-            scaled_mouse_x = int(mouse_pos[0] / S.current_display_scale)
-            scaled_mouse_y = int(mouse_pos[1] / S.current_display_scale)
-            scaled_mouse_pos = (scaled_mouse_x, scaled_mouse_y)
+            scaled_mouse_pos = S.window_to_render(mouse_pos)
 
             if continue_rect.collidepoint(scaled_mouse_pos):
                 # Play sound when hovering over a new button
@@ -917,9 +397,7 @@ def main(progression):
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     # Mouse click - detect which button was clicked
                     mouse_pos = pygame.mouse.get_pos()
-                    scaled_mouse_x = int(mouse_pos[0] / S.current_display_scale)
-                    scaled_mouse_y = int(mouse_pos[1] / S.current_display_scale)
-                    scaled_mouse_pos = (scaled_mouse_x, scaled_mouse_y)
+                    scaled_mouse_pos = S.window_to_render(mouse_pos)
 
                     if continue_rect.collidepoint(scaled_mouse_pos):
                         # Play select sound
@@ -938,328 +416,25 @@ def main(progression):
                             audio_manager.play_sound('select_click', volume=0.3)  # Higher-pitched click sound
                         # Clicked menu button
                         return "MENU"
-        elif game_state.game_over:
-            # Still update player animation even when dead to show death animation
-            # But don't pass real keys - pass empty dict to prevent movement
-            player.update({})
 
-        # --- RENDER ---
-        screen.fill((50, 50, 80))
-        
-        background.draw(screen, camera_x)
-
-        # Draw hazard platforms (SPIKY ICE - deadly!) - only if enabled
-        if SHOW_HAZARDS:
-            for hazard in hazards:
-                draw_spiky_hazard(screen, hazard, camera_x)
-                
-                if SHOW_HITBOXES:
-                    # Draw hitbox outline
-                    draw_rect = pygame.Rect(hazard.x - camera_x, hazard.y, hazard.width, hazard.height)
-                    pygame.draw.rect(screen, (255, 0, 0), draw_rect, 3)  # Bright red outline
-
-        # Draw platforms with brick texture
-        if SHOW_PLATFORMS:
-            # For Level 2, draw ground with snowy texture, platforms with wooden texture
-            # For other levels, draw everything with icy brick texture
-            
-            if world_name == "1-1":
-                # LEVEL 1: Invisible ground + visible platforms
-                # Skip first platform which is the invisible_ground at y=570
-                platforms_to_draw = platforms[1:]  # Skip invisible_ground only
-
-                for platform in platforms_to_draw:
-                    # Draw brick pattern for platforms (not ground)
-                    draw_brick_platform(screen, platform, camera_x)
-
-                    # Optional: Draw platform outline for hitbox debugging
-                    if SHOW_HITBOXES:
-                        draw_rect = pygame.Rect(platform.x - camera_x, platform.y, platform.width, platform.height)
-                        pygame.draw.rect(screen, (255, 255, 0), draw_rect, 2)
-            elif world_name == "1-2":
-                # LEVEL 2: Snowy ground + wooden platforms
-                # Level 2 has 6 ground segments at Y=400, then platforms above
-                # Draw first 6 platforms as snowy ground (the main floor)
-                for i, platform in enumerate(platforms):
-                    if i < 6:  # First 6 are ground segments
-                        draw_snowy_ground(screen, platform, camera_x)
-                    else:  # Rest are wooden platforms
-                        draw_wooden_platform(screen, platform, camera_x)
-
-                    if SHOW_HITBOXES:
-                        draw_rect = pygame.Rect(platform.x - camera_x, platform.y, platform.width, platform.height)
-                        pygame.draw.rect(screen, (255, 255, 0), draw_rect, 2)
-            elif world_name == "1-3":
-                # LEVEL 3: Dark blue icy brick platforms
-                # Draw all platforms (including ground) with dark blue icy bricks
-                for platform in platforms:
-                    draw_icy_brick_platform(screen, platform, camera_x)
-
-                    if SHOW_HITBOXES:
-                        draw_rect = pygame.Rect(platform.x - camera_x, platform.y, platform.width, platform.height)
-                        pygame.draw.rect(screen, (255, 255, 0), draw_rect, 2)
-
-                # Draw moving platforms
-                for moving_platform in moving_platforms:
-                    draw_icy_brick_platform(screen, moving_platform.rect, camera_x)
-
-                    if SHOW_HITBOXES:
-                        draw_rect = pygame.Rect(moving_platform.rect.x - camera_x, moving_platform.rect.y,
-                                               moving_platform.rect.width, moving_platform.rect.height)
-                        pygame.draw.rect(screen, (0, 255, 255), draw_rect, 2)  # Cyan for moving platforms
-
-                # Draw disappearing platforms (same style as Level 4)
-                for disappearing_platform in disappearing_platforms:
-                    if not disappearing_platform.disappeared:
-                        # Create a semi-transparent surface
-                        platform_surface = pygame.Surface((disappearing_platform.rect.width, disappearing_platform.rect.height))
-                        platform_surface.set_colorkey((0, 0, 0))
-
-                        # Fill with semi-transparent white/blue ice color
-                        ice_color = (180, 200, 220)
-                        pygame.draw.rect(platform_surface, ice_color, (0, 0, disappearing_platform.rect.width, disappearing_platform.rect.height))
-
-                        # Draw border (black/grey) to make it clear
-                        border_color = (50, 50, 50) if not disappearing_platform.should_shake() else (100, 100, 100)
-                        pygame.draw.rect(platform_surface, border_color, (0, 0, disappearing_platform.rect.width, disappearing_platform.rect.height), 3)
-
-                        # Apply transparency
-                        platform_surface.set_alpha(disappearing_platform.get_alpha())
-
-                        # Apply pulse effect if warning about state change
-                        pulse_offset = 0
-                        if disappearing_platform.should_shake():
-                            import random
-                            pulse_offset = random.randint(-1, 1)
-
-                        # Draw to screen
-                        screen.blit(platform_surface,
-                                   (disappearing_platform.rect.x - camera_x,
-                                    disappearing_platform.rect.y + pulse_offset))
-
-                        if SHOW_HITBOXES:
-                            draw_rect = pygame.Rect(disappearing_platform.rect.x - camera_x, disappearing_platform.rect.y,
-                                                   disappearing_platform.rect.width, disappearing_platform.rect.height)
-                            pygame.draw.rect(screen, (255, 0, 255), draw_rect, 2)  # Magenta for disappearing platforms
-            elif world_name == "1-4":
-                # LEVEL 4: Glowing northern lights platforms with animated colors
-                # Draw all platforms (including ground) with animated northern lights effect
-                for platform in platforms:
-                    draw_northern_lights_ground(screen, platform, camera_x)
-
-                    if SHOW_HITBOXES:
-                        draw_rect = pygame.Rect(platform.x - camera_x, platform.y, platform.width, platform.height)
-                        pygame.draw.rect(screen, (255, 255, 0), draw_rect, 2)
-
-                # Draw moving platforms
-                for moving_platform in moving_platforms:
-                    draw_northern_lights_ground(screen, moving_platform.rect, camera_x)
-
-                    if SHOW_HITBOXES:
-                        draw_rect = pygame.Rect(moving_platform.rect.x - camera_x, moving_platform.rect.y,
-                                                moving_platform.rect.width, moving_platform.rect.height)
-                        pygame.draw.rect(screen, (0, 255, 255), draw_rect, 2)  # Cyan for moving platforms
-
-                # Draw disappearing platforms with same design as Level 4 appearing platforms
-                for disappearing_platform in disappearing_platforms:
-                    if not disappearing_platform.disappeared:
-                        # Create a semi-transparent surface (matching Level 4 style)
-                        platform_surface = pygame.Surface((disappearing_platform.rect.width, disappearing_platform.rect.height))
-                        platform_surface.set_colorkey((0, 0, 0))
-
-                        # Fill with semi-transparent white/blue ice color (same as Level 4)
-                        ice_color = (180, 200, 220)
-                        pygame.draw.rect(platform_surface, ice_color, (0, 0, disappearing_platform.rect.width, disappearing_platform.rect.height))
-
-                        # Draw solid border (not dashed) - matching Level 4 style
-                        # Use red warning color if about to disappear, otherwise black/grey
-                        if disappearing_platform.should_shake():
-                            border_color = (255, 50, 50)  # Red warning when shaking
-                        else:
-                            border_color = (50, 50, 50)  # Dark grey/black normally (matches Level 4)
-
-                        pygame.draw.rect(platform_surface, border_color, (0, 0, disappearing_platform.rect.width, disappearing_platform.rect.height), 3)
-
-                        # Apply alpha for fade effect
-                        platform_surface.set_alpha(disappearing_platform.get_alpha())
-
-                        # Apply pulse effect if warning (same as Level 4 appearing platforms)
-                        pulse_offset = 0
-                        if disappearing_platform.should_shake():
-                            import random
-                            pulse_offset = random.randint(-1, 1)
-
-                        # Draw to screen
-                        screen.blit(platform_surface,
-                                   (disappearing_platform.rect.x - camera_x,
-                                    disappearing_platform.rect.y + pulse_offset))
-
-                        if SHOW_HITBOXES:
-                            draw_rect = pygame.Rect(disappearing_platform.rect.x - camera_x, disappearing_platform.rect.y,
-                                                   disappearing_platform.rect.width, disappearing_platform.rect.height)
-                            pygame.draw.rect(screen, (255, 0, 255), draw_rect, 2)  # Magenta for disappearing platforms
-
-                # Draw appearing platforms with transparency and border
-                for appearing_platform in appearing_platforms:
-                    if appearing_platform.get_alpha() > 0:  # Only draw if visible at all
-                        # Create a semi-transparent surface
-                        platform_surface = pygame.Surface((appearing_platform.rect.width, appearing_platform.rect.height))
-                        platform_surface.set_colorkey((0, 0, 0))
-
-                        # Fill with semi-transparent white/blue ice color
-                        ice_color = (180, 200, 220)
-                        pygame.draw.rect(platform_surface, ice_color, (0, 0, appearing_platform.rect.width, appearing_platform.rect.height))
-
-                        # Draw border (black/grey) to make it clear
-                        border_color = (50, 50, 50) if appearing_platform.is_solid() else (100, 100, 100)
-                        pygame.draw.rect(platform_surface, border_color, (0, 0, appearing_platform.rect.width, appearing_platform.rect.height), 3)
-
-                        # Apply transparency
-                        platform_surface.set_alpha(appearing_platform.get_alpha())
-
-                        # Apply pulse effect if warning about state change
-                        pulse_offset = 0
-                        if appearing_platform.should_pulse():
-                            import random
-                            pulse_offset = random.randint(-1, 1)
-
-                        # Draw to screen
-                        screen.blit(platform_surface,
-                                   (appearing_platform.rect.x - camera_x,
-                                    appearing_platform.rect.y + pulse_offset))
-
-                        if SHOW_HITBOXES:
-                            draw_rect = pygame.Rect(appearing_platform.rect.x - camera_x, appearing_platform.rect.y,
-                                                   appearing_platform.rect.width, appearing_platform.rect.height)
-                            color = (0, 255, 0) if appearing_platform.is_solid() else (128, 128, 128)
-                            pygame.draw.rect(screen, color, draw_rect, 2)
-            else:
-                # OTHER LEVELS: Icy brick texture, skip ground
-                platforms_to_draw = platforms[1:]  # Skip invisible ground
-
-                for platform in platforms_to_draw:
-                    # Draw brick pattern
-                    draw_brick_platform(screen, platform, camera_x)
-
-                    # Optional: Draw platform outline for hitbox debugging
-                    if SHOW_HITBOXES:
-                        draw_rect = pygame.Rect(platform.x - camera_x, platform.y, platform.width, platform.height)
-                        pygame.draw.rect(screen, (255, 255, 0), draw_rect, 2)
-
-        # Draw enemies - only if enabled
-        if SHOW_ENEMIES:
-            for enemy in enemies:
-                # Skip drawing enemies that have completed their death animation
-                if getattr(enemy, 'death_complete', False):
-                    continue
-
-                screen.blit(enemy.image, (enemy.rect.x - camera_x, enemy.rect.y))
-
-                # Draw enemy health above them
-                enemy_health_ui.draw(screen, enemy, camera_x)
-                
-                if SHOW_HITBOXES:
-                    # Draw body hitbox (yellow)
-                    debug_hitbox = enemy.hitbox.copy()
-                    debug_hitbox.x -= camera_x
-                    pygame.draw.rect(screen, (255, 255, 0), debug_hitbox, 2)
-                    
-                    # Draw sword hitbox if active (for Swordsman) - red
-                    if hasattr(enemy, 'sword_hitbox_active') and enemy.sword_hitbox_active:
-                        debug_sword_hitbox = enemy.sword_hitbox.copy()
-                        debug_sword_hitbox.x -= camera_x
-                        pygame.draw.rect(screen, (255, 0, 0), debug_sword_hitbox, 2)
-                    
-                    # Draw punch hitbox if active (for Snowy) - red
-                    if hasattr(enemy, 'punch_hitbox_active') and enemy.punch_hitbox_active:
-                        debug_punch_hitbox = enemy.punch_hitbox.copy()
-                        debug_punch_hitbox.x -= camera_x
-                        pygame.draw.rect(screen, (255, 0, 0), debug_punch_hitbox, 2)
-        
-        # Draw projectiles (snowballs, iceballs, fireballs, spikes) - only if enemies enabled
-        if SHOW_ENEMIES:
-            for projectile in projectiles:
-                screen.blit(projectile.image, (projectile.rect.x - camera_x, projectile.rect.y))
-        
-        # Draw coins
-        for coin in coins:
-            screen.blit(coin.image, (coin.rect.x - camera_x, coin.rect.y))
 
-            if SHOW_HITBOXES:
-                coin.draw_hitbox(screen, camera_x)
+        # --- RENDER ---
+        performance_monitor.start_render()
 
-        # Draw checkpoints (if enabled)
-        if progression.checkpoints_enabled:
-            for checkpoint in checkpoints:
-                checkpoint.draw(screen, camera_x)
+        # Draw between the last two simulation steps so motion stays smooth at any render rate
+        camera_x = round(simulation.camera_x)  # One whole-pixel offset for every layer
+        coins_collected = simulation.coins_collected
+        level_time = simulation.level_time
+        if interpolator is not None and game_state.is_playing:
+            camera_x = interpolator.camera(previous_camera_x, simulation.camera_x, timestep.alpha)
+            interpolator.apply(timestep.alpha)
 
-        # Draw goal NPC (if exists)
-        if goal_npc:
-            screen.blit(goal_npc.image, (goal_npc.rect.x - camera_x, goal_npc.rect.y))
-            
-            if SHOW_HITBOXES:
-                goal_npc.draw_trigger_zone(screen, camera_x)
-
-        # Draw player
-        screen.blit(player.image, (player.rect.x - camera_x, player.rect.y))
-
-        if SHOW_HITBOXES:
-            # Draw player hitbox (cyan)
-            debug_player_hitbox = player.hitbox.copy()
-            debug_player_hitbox.x -= camera_x
-            pygame.draw.rect(screen, (0, 255, 255), debug_player_hitbox, 2)
-
-            # Draw player rect outline (green)
-            debug_player_rect = player.rect.copy()
-            debug_player_rect.x -= camera_x
-            pygame.draw.rect(screen, (0, 255, 0), debug_player_rect, 2)
-
-        # Draw debug coordinates (if enabled)
-        if SHOW_COORDINATES:
-            draw_debug_coordinates(screen, player, platforms, camera_x, 0)
-
-        # --- DRAW PARTICLES ---
-        particle_mgr.draw(screen, camera_x)
-
-        # --- DRAW UI ---
-        health_ui.draw(screen, player.health, player.max_health)
-        roll_stamina_ui.draw(screen, player, camera_x)
-        spin_charge_ui.draw(screen, player, camera_x)
-        
-        # Draw game HUD (coins, world, time, difficulty, coins needed, distance)
-        coins_requirement = progression.get_coin_requirement(progression.current_level)
-        coins_still_needed = max(0, coins_requirement - coins_collected)
-        coins_remaining_in_level = len(coins)  # Count uncollected coins still in the sprite group
-        distance_to_goal = 0
-        max_distance = 100  # Default for color scaling
-        if goal_npc:
-            # player.rect.x is already in world coordinates (camera_x is subtracted during rendering)
-            player_world_x = player.rect.x
-            goal_world_x = goal_npc.trigger_zone.left
-            distance_to_goal = max(0, int(goal_world_x - player_world_x - 102))  # Subtract 102 for accurate distance
-            # Calculate max_distance as the goal position (for color scaling)
-            max_distance = goal_world_x
-        draw_game_hud(screen, coins_collected, level_time, world_name, progression.difficulty, coins_still_needed, coins_remaining_in_level, distance_to_goal, max_distance)
-        
-        # --- DEBUG: DRAW PLAYER POSITION ---
-        if SHOW_HITBOXES:  # Only show when hitboxes are enabled
-            debug_font = FontManager.get_press_start_2p(12)
-
-            # Show player X and Y position
-            pos_text = debug_font.render(f"X: {int(player.rect.x)} Y: {int(player.rect.y)}", True, (255, 255, 0))
-            # Draw with black outline for visibility
-            screen.blit(pos_text, (10, S.WINDOW_HEIGHT - 30))
+        renderer.draw(screen, camera_x)
  
         
 
         # --- DEATH SCREEN (only show after animation delay) ---
         if game_state.show_death_screen:
-            # Fade in death screen
-            if game_state.death_fade_alpha < 255:
-                game_state.death_fade_alpha = min(255, game_state.death_fade_alpha + game_state.death_fade_speed)
-
-            # Update and draw death menu
-            death_menu.update()
             death_menu.draw(screen)
 
         # --- LEVEL COMPLETE CUTSCENE ---
@@ -1276,18 +451,23 @@ def main(progression):
 
         # --- PAUSE MENU OVERLAY ---
         if game_state.paused:
-            pause_menu.update()
             pause_menu.draw(screen)
 
-        # Scale render surface to display screen
-        scaled_surface = pygame.transform.scale(screen, (display_width, display_height))
+        # --- PERFORMANCE OVERLAY (debug.show_performance) ---
+        if SHOW_PERFORMANCE:
+            performance_monitor.draw_overlay(screen)
 
-        # Apply screen shake offset
-        shake_x, shake_y = screen_shake.get_offset()
-        display_screen.fill((0, 0, 0))  # Clear with black in case shake leaves gaps
-        display_screen.blit(scaled_surface, (shake_x, shake_y))
+        with performance_monitor.scope("present"):
+            # Scale render surface to display screen, applying the screen shake offset
+            presenter.present(display_screen, screen, screen_shake.get_offset())
 
-        pygame.display.flip()
+            pygame.display.flip()
+
+        if interpolator is not None:
+            interpolator.restore()
+
+        performance_monitor.end_render()
+        performance_monitor.end_frame()
 
     pygame.quit()
     sys.exit()
@@ -1312,6 +492,10 @@ if __name__ == "__main__":
     from src.core.config_loader import get_config
     config = get_config()
 
+    # Stream a Chrome trace of the whole session (debug.trace)
+    if config.get('debug.trace', False):
+        start_tracing(SaveSystem.SAVE_DIR / "traces" / f"trace_{time.strftime('%Y%m%d_%H%M%S')}.json")
+
     # Load saved progress and username (unless in debug mode)
     current_username = None
     if not config.get('debug.unlock_all_levels', True):
@@ -4,7 +4,8 @@
 echo "🧪 Running all tests..."
 echo ""
 
-./venv/bin/pytest tests/test_collision_physics.py -v
+# Top-level test modules only: tests/unit and tests/integration need Firebase credentials
+./venv/bin/pytest tests/test_*.py -v
 
 if [ $? -eq 0 ]; then
     echo ""
@@ -0,0 +1,201 @@
+"""
+Batch Collision Module
+Vectorized (NumPy) enemy landing, platform-edge and hazard-ahead checks
+"""
+
+from src.core import collision_physics as collision
+from src.core.game_logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def create_enemy_batch_collider(collision_world, hazards):
+    """
+    Create a batch collider if NumPy is available
+
+    Args:
+        collision_world: The level's CollisionWorld
+        hazards: List of hazard rectangles
+
+    Returns:
+        EnemyBatchCollider or None: None when NumPy is not installed (callers
+            fall back to the scalar functions in collision_physics)
+    """
+    if np is None:
+        logger.warning("numpy not installed. Using scalar enemy collision.")
+        return None
+    return EnemyBatchCollider(collision_world, hazards)
+
+
+class EnemyBatchCollider:
+    """
+    Resolves enemy-vs-platform checks for every enemy in one vectorized pass
+
+    Enemy hitboxes and platform rects are packed into arrays and tested as an
+    (enemies x platforms) matrix. "First matching platform" semantics of the
+    scalar loops are kept by taking the first True column of each row, so the
+    results are identical to check_platform_collision_enemy,
+    check_enemy_ground_edge and check_enemy_patrol_edge.
+    """
+
+    def __init__(self, collision_world, hazards):
+        """
+        Pack the static level geometry
+
+        Args:
+            collision_world: The level's CollisionWorld (dynamic bodies are read each call)
+            hazards: List of hazard rectangles
+        """
+        self.world = collision_world
+        self.static_platforms = self._pack(collision_world.static_platforms)
+        self.hazards = hazards
+        self.hazard_array = self._pack(self.hazards)
+
+    @staticmethod
+    def _pack(rects):
+        """Pack rects into an (N, 3) array of left, right, top"""
+        return np.array([(r.left, r.right, r.top) for r in rects], dtype=np.float64).reshape(-1, 3)
+
+    def _platform_array(self):
+        """Static platforms followed by the currently solid dynamic bodies (same order as queries)"""
+        dynamic = [(r.left, r.right, r.top) for r in self.world.active_body_rects()]
+        if not dynamic:
+            return self.static_platforms
+        return np.concatenate((self.static_platforms, np.array(dynamic, dtype=np.float64)))
+
+    @staticmethod
+    def _first_match(matches):
+        """Return (has_match, first_index) for each row of a boolean matrix"""
+        if matches.shape[1] == 0:
+            empty = np.zeros(matches.shape[0], dtype=bool)
+            return empty, np.zeros(matches.shape[0], dtype=np.intp)
+        return matches.any(axis=1), matches.argmax(axis=1)
+
+    def check_ground_edges(self, enemies, hazards=(), tolerance=10, edge_buffer=15,
+                           hazard_check_distance=40):
+        """
+        Batched check_enemy_ground_edge for every living enemy with a direction
+
+        Args:
+            enemies: Iterable of enemies
+            hazards: Hazards to avoid (pass an empty tuple to skip the hazard check)
+            tolerance: Pixel tolerance for finding the platform an enemy stands on
+            edge_buffer: Buffer zone to prevent oscillation at edges
+            hazard_check_distance: How far ahead to look for hazards
+        """
+        active = [enemy for enemy in enemies
+                  if not getattr(enemy, 'is_dead', False) and hasattr(enemy, 'direction')]
+        if not active:
+            return
+
+        boxes = np.array([(e.hitbox.left, e.hitbox.right, e.hitbox.bottom, e.direction)
+                          for e in active], dtype=np.float64)
+        left, right, bottom, direction = boxes.T
+        platforms = self._platform_array()
+        p_left, p_right, p_top = platforms[:, 0], platforms[:, 1], platforms[:, 2]
+
+        # Platform each enemy stands on (first match in level order)
+        on_platform = ((bottom[:, None] >= p_top - tolerance) &
+                       (bottom[:, None] <= p_top + tolerance) &
+                       (right[:, None] > p_left) &
+                       (left[:, None] < p_right))
+        has_platform, first = self._first_match(on_platform)
+        current_left = p_left[first] if len(platforms) else left
+        current_right = p_right[first] if len(platforms) else right
+        current_top = p_top[first] if len(platforms) else bottom
+        on_ground = has_platform & (np.abs(current_top - 400) <= 30)
+
+        # Ground edge turn-around
+        turn_right = on_ground & (direction == -1) & (left <= current_left + edge_buffer)
+        turn_left = on_ground & (direction == 1) & (right >= current_right - edge_buffer)
+        new_direction = np.where(turn_right, 1.0, np.where(turn_left, -1.0, direction))
+        turned = turn_right | turn_left
+
+        # Hazard-ahead check uses the direction after the edge turn, like the scalar path
+        avoids = np.array([getattr(e, 'avoids_hazards', False) for e in active], dtype=bool)
+        check_hazards = on_ground & avoids
+        if len(hazards) and check_hazards.any():
+            h_array = self.hazard_array if hazards is self.hazards else self._pack(hazards)
+            h_left, h_right, h_top = h_array[:, 0], h_array[:, 1], h_array[:, 2]
+            near_height = np.abs(h_top - bottom[:, None]) < 50
+            ahead_left = ((h_right >= left[:, None] - hazard_check_distance) &
+                          (h_left < left[:, None]) & near_height).any(axis=1)
+            ahead_right = ((h_left <= right[:, None] + hazard_check_distance) &
+                           (h_right > right[:, None]) & near_height).any(axis=1)
+            hazard_right = check_hazards & (new_direction == -1) & ahead_left
+            hazard_left = check_hazards & (new_direction == 1) & ahead_right
+            new_direction = np.where(hazard_right, 1.0, np.where(hazard_left, -1.0, new_direction))
+            turned |= hazard_right | hazard_left
+
+        for enemy, was_turned, final_direction in zip(active, turned.tolist(), new_direction.tolist()):
+            enemy.at_platform_edge = was_turned
+            if was_turned:
+                collision.turn_enemy_around(enemy, int(final_direction))
+
+    def land_and_check_patrol_edges(self, enemies, tolerance=20, patrol_tolerance=5,
+                                    patrol_edge_buffer=10):
+        """
+        Batched check_platform_collision_enemy followed by check_enemy_patrol_edge
+
+        Args:
+            enemies: Living enemies that have had gravity applied this frame
+            tolerance: Landing tolerance (see check_platform_collision_enemy)
+            patrol_tolerance: Pixel tolerance for finding the platform an enemy stands on
+            patrol_edge_buffer: Distance from the edge at which patrolling enemies turn
+
+        Returns:
+            list: Enemies that are standing on a platform
+        """
+        if not enemies:
+            return []
+
+        platforms = self._platform_array()
+        if not len(platforms):
+            return []
+        p_left, p_right, p_top = platforms[:, 0], platforms[:, 1], platforms[:, 2]
+
+        # --- Landing ---
+        boxes = np.array([(e.hitbox.left, e.hitbox.right, e.hitbox.bottom, e.vel_y)
+                          for e in enemies], dtype=np.float64)
+        left, right, bottom, vel_y = boxes.T
+        landing = ((right[:, None] > p_left) &
+                   (left[:, None] < p_right) &
+                   (bottom[:, None] >= p_top - tolerance) &
+                   (bottom[:, None] <= p_top + tolerance) &
+                   (vel_y >= 0)[:, None])
+        has_landed, first = self._first_match(landing)
+
+        grounded = []
+        for i in np.flatnonzero(has_landed).tolist():
+            enemy = enemies[i]
+            collision.land_enemy(enemy, int(p_top[first[i]]))
+            grounded.append(enemy)
+
+        # --- Patrol edges (uses hitboxes after landing) ---
+        patrolling = [e for e in grounded
+                      if hasattr(e, 'patrol_left') and hasattr(e, 'patrol_right') and hasattr(e, 'direction')]
+        if not patrolling:
+            return grounded
+
+        boxes = np.array([(e.hitbox.left, e.hitbox.right, e.hitbox.bottom, e.direction)
+                          for e in patrolling], dtype=np.float64)
+        left, right, bottom, direction = boxes.T
+        on_platform = ((right[:, None] > p_left) &
+                       (left[:, None] < p_right) &
+                       (bottom[:, None] >= p_top - patrol_tolerance) &
+                       (bottom[:, None] <= p_top + patrol_tolerance))
+        has_platform, first = self._first_match(on_platform)
+        turn_right = has_platform & (direction == -1) & (left <= p_left[first] + patrol_edge_buffer)
+        turn_left = has_platform & (direction == 1) & (right >= p_right[first] - patrol_edge_buffer)
+
+        for i in np.flatnonzero(turn_right).tolist():
+            collision.turn_enemy_around(patrolling[i], 1)
+        for i in np.flatnonzero(turn_left).tolist():
+            collision.turn_enemy_around(patrolling[i], -1)
+
+        return grounded
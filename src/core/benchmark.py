@@ -0,0 +1,265 @@
+"""
+Frame-Time Benchmark
+Plays every level headless with fixed input and checks update/render times against a baseline
+
+Usage:
+    python -m src.core.benchmark --output baseline.json
+    python -m src.core.benchmark --baseline baseline.json --threshold 0.2
+    python -m src.core.benchmark --levels 3 4 --replay-dir benchmarks/
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+from pathlib import Path
+
+# Benchmarks never open a real window or audio device
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from src.core.game_logging import get_logger
+from src.core.headless import HeadlessRunner, SCRIPTS
+from src.core.performance import PerformanceMonitor
+from src.core.replay import Replay, REPLAY_EXTENSION
+from src.utils import settings as S
+from src.utils.progression import LevelManager
+from src.rendering.level_renderer import LevelRenderer
+
+logger = get_logger(__name__)
+
+RESULTS_VERSION = 1
+PERCENTILES = (50, 95, 99)
+# Phases compared against the baseline ('frame' is their sum plus loop overhead)
+COMPARED_PHASES = ('update', 'render')
+
+
+class LevelBenchmark:
+    """
+    Times the update and render phases of one level over a fixed run
+
+    Input comes from a headless script with a fixed seed, or from a replay,
+    so every run of the benchmark steps through the same game states. The
+    level is drawn to an offscreen window-sized surface with the same
+    LevelRenderer the game uses.
+    """
+
+    def __init__(self, level, frames=1800, script='run', seed=0, replay=None, warmup=60):
+        """
+        Args:
+            level: Level number (key of LevelManager.LEVELS)
+            frames: Number of timed frames (60 per second of game time)
+            script: Name of a scripted input pattern in SCRIPTS
+            seed: Seed for the level and the script
+            replay: Replay to play back instead of the script
+            warmup: Untimed frames run first so caches are filled
+        """
+        self.level = level
+        self.frames = frames
+        self.warmup = warmup
+        self.monitor = PerformanceMonitor(sample_size=frames)
+        self.runner = HeadlessRunner(level, script=script, seed=seed, replay=replay,
+                                     performance_monitor=self.monitor)
+        self.screen = pygame.Surface((S.WINDOW_WIDTH, S.WINDOW_HEIGHT))
+        self.renderer = None
+
+    def _frame(self):
+        """
+        Run and time one update and render
+
+        Returns:
+            bool: False once a replay has run out of steps
+        """
+        monitor = self.monitor
+        monitor.start_frame()
+        monitor.start_update()
+        stepped = self.runner.step()
+        monitor.end_update()
+        if not stepped:
+            return False
+
+        simulation = self.runner.simulation
+        if self.renderer is None or self.renderer.simulation is not simulation:
+            # Level (re)loaded: building the render state is load time, not frame time
+            enabled, monitor.enabled = monitor.enabled, False
+            self.renderer = LevelRenderer(simulation, simulation.particle_mgr, monitor,
+                                          show_enemies=simulation.show_enemies,
+                                          show_platforms=simulation.show_platforms,
+                                          show_hazards=simulation.show_hazards)
+            monitor.enabled = enabled
+            monitor.start_frame()
+
+        monitor.start_render()
+        self.renderer.draw(self.screen, simulation.camera_x)
+        monitor.end_render()
+        monitor.end_frame()
+        return True
+
+    def run(self):
+        """
+        Run the warmup and timed frames
+
+        Returns:
+            dict: Level name, frame count, 'frame'/'update'/'render' percentiles
+                and average 'scopes' times in ms
+        """
+        self.monitor.enabled = False
+        for _ in range(self.warmup):
+            if not self._frame():
+                break
+
+        self.monitor.enabled = True
+        frames = 0
+        while frames < self.frames and self._frame():
+            frames += 1
+        self.monitor.enabled = False
+
+        result = {
+            'name': LevelManager.LEVELS[self.level]['name'],
+            'frames': frames,
+        }
+        result.update(self.monitor.get_percentiles(PERCENTILES))
+        result['scopes'] = {path: avg_ms for path, avg_ms, _ in self.monitor.get_scope_stats()}
+        return result
+
+
+def run_benchmark(levels=None, frames=1800, script='run', seed=0, replay_dir=None, warmup=60):
+    """
+    Benchmark a set of levels
+
+    Args:
+        levels: Level numbers (defaults to every level in LevelManager.LEVELS)
+        frames: Timed frames per level
+        script: Scripted input pattern for levels without a replay
+        seed: Seed for scripted runs
+        replay_dir: Directory of level_<N>.ssr replays to use instead of the script
+        warmup: Untimed frames per level
+
+    Returns:
+        dict: Benchmark settings and per-level results (JSON serializable)
+    """
+    if levels is None:
+        levels = sorted(LevelManager.LEVELS)
+
+    results = {
+        'version': RESULTS_VERSION,
+        'frames': frames,
+        'script': script,
+        'seed': seed,
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'levels': {},
+    }
+    for level in levels:
+        replay = None
+        if replay_dir is not None:
+            replay_path = Path(replay_dir) / f"level_{level}{REPLAY_EXTENSION}"
+            if replay_path.exists():
+                replay = Replay.load(replay_path)
+                if replay.level != level:
+                    raise ValueError(f"{replay_path} is a replay of level {replay.level}")
+        source = replay_path.name if replay is not None else f"script '{script}'"
+        logger.info(f"Benchmarking level {level} ({source})")
+
+        result = LevelBenchmark(level, frames, script=script, seed=seed, replay=replay, warmup=warmup).run()
+        result['input'] = source
+        results['levels'][str(level)] = result
+    return results
+
+
+def compare_results(results, baseline, threshold=0.2, min_delta_ms=0.5):
+    """
+    Find levels whose update or render times got slower than a baseline
+
+    A time counts as a regression when it is more than threshold (relative)
+    slower and also more than min_delta_ms slower, so sub-millisecond noise
+    on fast phases does not fail the check.
+
+    Args:
+        results: Results from run_benchmark
+        baseline: Earlier results from run_benchmark
+        threshold: Allowed relative slowdown (0.2 = 20%)
+        min_delta_ms: Smallest absolute slowdown that counts
+
+    Returns:
+        list: Human-readable descriptions of each regression (empty if none)
+    """
+    regressions = []
+    for level, result in results['levels'].items():
+        before = baseline['levels'].get(level)
+        if before is None:
+            continue
+        for phase in COMPARED_PHASES:
+            for key, now in result[phase].items():
+                was = before.get(phase, {}).get(key)
+                if was is None:
+                    continue
+                if now - was > min_delta_ms and now > was * (1 + threshold):
+                    regressions.append(
+                        f"Level {level} {phase} {key}: {was:.2f}ms -> {now:.2f}ms "
+                        f"(+{(now / was - 1) * 100 if was > 0 else float('inf'):.0f}%)"
+                    )
+    return regressions
+
+
+def main(argv=None):
+    """
+    Command line entry point
+
+    Returns:
+        int: Exit code (1 if a level regressed against the baseline)
+    """
+    parser = argparse.ArgumentParser(description="Benchmark per-level update and render times")
+    parser.add_argument('--levels', type=int, nargs='+', default=None,
+                        help="Levels to run (default: all)")
+    parser.add_argument('--frames', type=int, default=1800, help="Timed frames per level")
+    parser.add_argument('--warmup', type=int, default=60, help="Untimed frames before timing")
+    parser.add_argument('--script', choices=sorted(SCRIPTS), default='run', help="Scripted input pattern")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed")
+    parser.add_argument('--replay-dir', metavar='DIR',
+                        help=f"Use level_<N>{REPLAY_EXTENSION} replays from this directory when present")
+    parser.add_argument('--output', metavar='FILE', help="Write results as JSON")
+    parser.add_argument('--baseline', metavar='FILE', help="Compare against earlier JSON results")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="Allowed relative slowdown before failing (default 0.2 = 20%%)")
+    parser.add_argument('--min-delta', type=float, default=0.5,
+                        help="Smallest slowdown in ms that counts as a regression")
+    args = parser.parse_args(argv)
+
+    for level in args.levels or ():
+        if level not in LevelManager.LEVELS:
+            parser.error(f"unknown level {level}, choose from {sorted(LevelManager.LEVELS)}")
+
+    results = run_benchmark(args.levels, args.frames, script=args.script, seed=args.seed,
+                            replay_dir=args.replay_dir, warmup=args.warmup)
+    pygame.quit()
+
+    print(f"{'Level':<22}{'update p50/p95/p99 (ms)':>26}{'render p50/p95/p99 (ms)':>26}")
+    for level, result in results['levels'].items():
+        phases = [
+            '/'.join(f"{result[phase][f'p{p}']:.2f}" for p in PERCENTILES)
+            for phase in ('update', 'render')
+        ]
+        print(f"{level + ' ' + result['name']:<22}{phases[0]:>26}{phases[1]:>26}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare_results(results, baseline, args.threshold, args.min_delta)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
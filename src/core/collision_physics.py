@@ -3,9 +3,360 @@ Collision & Physics Module
 Handles all collision detection and physics calculations for the game
 """
 
+from bisect import insort
+
 import pygame
 from src.utils import settings as S
 
+# Extra search distance around a hitbox for broadphase queries. Covers collision
+# tolerances plus the distance an entity can be pushed while being resolved.
+BROADPHASE_MARGIN = 64
+
+
+class PlatformIndex:
+    """
+    Uniform-grid broadphase for static platforms
+
+    Platforms are bucketed into fixed-width X columns once, after the level
+    loads. Queries only look at the columns an entity's hitbox spans, so the
+    per-frame collision loops scale with nearby geometry instead of level size.
+    """
+
+    def __init__(self, platforms, cell_size=256):
+        """
+        Build the index
+
+        Args:
+            platforms: List of static platform rectangles (never moved afterwards)
+            cell_size: Width of each X column in pixels
+        """
+        self.platforms = list(platforms)
+        self.cell_size = cell_size
+        self.columns = {}
+
+        for i, platform in enumerate(self.platforms):
+            first, last = self.column_span(platform.left, platform.right)
+            for column in range(first, last + 1):
+                self.columns.setdefault(column, []).append(i)
+
+    def column_span(self, left, right):
+        """Return the first and last column touched by the X range [left, right)"""
+        last = (right - 1) // self.cell_size if right > left else left // self.cell_size
+        return left // self.cell_size, last
+
+    def query(self, rect, margin=0):
+        """
+        Find platforms that may touch a rectangle
+
+        Args:
+            rect: Area to search (usually an entity hitbox)
+            margin: Extra pixels to grow the search area by on every side, so
+                entities that are moved during resolution still see their neighbours
+
+        Returns:
+            list: Candidate platform rectangles, in the same order as the
+                original platform list
+        """
+        left = rect.left - margin
+        right = rect.right + margin
+        top = rect.top - margin
+        bottom = rect.bottom + margin
+
+        first, last = self.column_span(left, right)
+        if first == last:
+            indices = self.columns.get(first, ())
+        else:
+            found = set()
+            for column in range(first, last + 1):
+                found.update(self.columns.get(column, ()))
+            indices = sorted(found)
+
+        candidates = []
+        for i in indices:
+            platform = self.platforms[i]
+            if (platform.right >= left and platform.left <= right and
+                    platform.bottom >= top and platform.top <= bottom):
+                candidates.append(platform)
+        return candidates
+
+    def __len__(self):
+        return len(self.platforms)
+
+
+class CollisionWorld:
+    """
+    Static platforms plus a small set of dynamic platform bodies
+
+    The static set is indexed once and never changes. Dynamic bodies (moving,
+    disappearing and appearing platforms) are registered once and kept in their
+    own column buckets. Calling sync() after the bodies update toggles them on or
+    off in place and only re-buckets a body when it crosses a column boundary,
+    so no platform list is rebuilt per frame.
+    """
+
+    def __init__(self, static_platforms, cell_size=256):
+        """
+        Create the world
+
+        Args:
+            static_platforms: List of static platform rectangles
+            cell_size: Width of each X column in pixels
+        """
+        self.static_index = PlatformIndex(static_platforms, cell_size)
+        self.cell_size = cell_size
+        self.bodies = []
+        self.body_spans = []  # (first, last) column per body, or None when inactive
+        self.body_columns = {}
+
+    @property
+    def static_platforms(self):
+        return self.static_index.platforms
+
+    @staticmethod
+    def is_body_active(body):
+        """
+        Check whether a dynamic platform should currently collide
+
+        Args:
+            body: Platform object with a rect (and optionally disappeared / is_solid())
+
+        Returns:
+            bool: True if the body is solid right now
+        """
+        if getattr(body, 'disappeared', False):
+            return False
+        is_solid = getattr(body, 'is_solid', None)
+        if is_solid is not None and not is_solid():
+            return False
+        return True
+
+    def add_body(self, body):
+        """
+        Register a dynamic platform
+
+        Bodies are queried in registration order, after static platforms.
+
+        Args:
+            body: Platform object with a rect attribute
+        """
+        self.bodies.append(body)
+        self.body_spans.append(None)
+        self.update_body(len(self.bodies) - 1)
+
+    def add_bodies(self, bodies):
+        """Register several dynamic platforms in order"""
+        for body in bodies:
+            self.add_body(body)
+
+    def update_body(self, body_id):
+        """
+        Refresh one body's active state and buckets
+
+        Args:
+            body_id: Registration index of the body
+
+        Returns:
+            bool: True if the body changed buckets or was toggled
+        """
+        body = self.bodies[body_id]
+        if self.is_body_active(body):
+            span = self.static_index.column_span(body.rect.left, body.rect.right)
+        else:
+            span = None
+
+        old_span = self.body_spans[body_id]
+        if span == old_span:
+            return False
+
+        if old_span is not None:
+            for column in range(old_span[0], old_span[1] + 1):
+                bucket = self.body_columns[column]
+                bucket.remove(body_id)
+                if not bucket:
+                    del self.body_columns[column]
+        if span is not None:
+            for column in range(span[0], span[1] + 1):
+                insort(self.body_columns.setdefault(column, []), body_id)
+
+        self.body_spans[body_id] = span
+        return True
+
+    def sync(self):
+        """Refresh every dynamic body (call once per frame after the bodies update)"""
+        for body_id in range(len(self.bodies)):
+            self.update_body(body_id)
+
+    def active_body_rects(self):
+        """Yield the rects of dynamic bodies that are currently solid, in registration order"""
+        for body, span in zip(self.bodies, self.body_spans):
+            if span is not None:
+                yield body.rect
+
+    def iter_platforms(self):
+        """Yield every solid platform rect: static first, then active dynamic bodies"""
+        yield from self.static_index.platforms
+        yield from self.active_body_rects()
+
+    def query(self, rect, margin=0):
+        """
+        Find static and dynamic platforms that may touch a rectangle
+
+        Args:
+            rect: Area to search (usually an entity hitbox)
+            margin: Extra pixels to grow the search area by on every side
+
+        Returns:
+            list: Candidate rectangles - static platforms in level order, then
+                active dynamic bodies in registration order
+        """
+        candidates = self.static_index.query(rect, margin)
+        if not self.body_columns:
+            return candidates
+
+        left = rect.left - margin
+        right = rect.right + margin
+        top = rect.top - margin
+        bottom = rect.bottom + margin
+
+        first, last = self.static_index.column_span(left, right)
+        if first == last:
+            body_ids = self.body_columns.get(first, ())
+        else:
+            found = set()
+            for column in range(first, last + 1):
+                found.update(self.body_columns.get(column, ()))
+            body_ids = sorted(found)
+
+        for body_id in body_ids:
+            platform = self.bodies[body_id].rect
+            if (platform.right >= left and platform.left <= right and
+                    platform.bottom >= top and platform.top <= bottom):
+                candidates.append(platform)
+        return candidates
+
+
+def sweep_aabb(box, dx, dy, target):
+    """
+    Compute when a moving box first touches a static rectangle (time of impact)
+
+    Args:
+        box: Rectangle at its start position
+        dx: Horizontal movement this frame
+        dy: Vertical movement this frame
+        target: Static rectangle to test against
+
+    Returns:
+        tuple: (time, normal_x, normal_y) with time in [0, 1] and the normal of the
+            face that was hit, or None if there is no hit this frame. Boxes that
+            already overlap at the start are left to the discrete resolvers.
+    """
+    if dx == 0 and dy == 0:
+        return None
+
+    if dx > 0:
+        x_entry = (target.left - box.right) / dx
+        x_exit = (target.right - box.left) / dx
+    elif dx < 0:
+        x_entry = (target.right - box.left) / dx
+        x_exit = (target.left - box.right) / dx
+    elif box.right <= target.left or box.left >= target.right:
+        return None
+    else:
+        x_entry, x_exit = float('-inf'), float('inf')
+
+    if dy > 0:
+        y_entry = (target.top - box.bottom) / dy
+        y_exit = (target.bottom - box.top) / dy
+    elif dy < 0:
+        y_entry = (target.bottom - box.top) / dy
+        y_exit = (target.top - box.bottom) / dy
+    elif box.bottom <= target.top or box.top >= target.bottom:
+        return None
+    else:
+        y_entry, y_exit = float('-inf'), float('inf')
+
+    entry = max(x_entry, y_entry)
+    exit_time = min(x_exit, y_exit)
+    if entry >= exit_time or entry < 0 or entry > 1:
+        return None
+
+    # Prefer the vertical face on exact corner hits so landings win over wall bumps
+    if x_entry > y_entry:
+        return entry, (-1 if dx > 0 else 1), 0
+    return entry, 0, (-1 if dy > 0 else 1)
+
+
+def swept_bounds(hitbox, start_midbottom):
+    """
+    Get the area covered by a hitbox moving from start_midbottom to where it is now
+
+    Args:
+        hitbox: The entity's hitbox at its end position
+        start_midbottom: (x, y) midbottom of the hitbox before it moved
+
+    Returns:
+        pygame.Rect: Bounding box of the whole movement (for broadphase queries)
+    """
+    start = hitbox.copy()
+    start.midbottom = start_midbottom
+    return start.union(hitbox)
+
+
+def resolve_swept_motion(entity, start_midbottom, platforms, landing_only=False):
+    """
+    Pull an entity back to its first contact along this frame's movement
+
+    Runs before the discrete resolvers so fast movers cannot tunnel through thin
+    platforms. The entity is moved to the contact point on the axis that was hit
+    and keeps its movement on the other axis; landing itself (on_ground, vel_y)
+    is still handled by check_platform_collision_player/enemy.
+
+    Args:
+        entity: Player or enemy (needs rect, hitbox and update_hitbox_position)
+        start_midbottom: (x, y) midbottom of the hitbox before it moved this frame
+        platforms: Candidate platform rectangles
+        landing_only: If True, only hits on the top face count (enemies pass
+            through platforms from the side and from below)
+
+    Returns:
+        tuple: (normal_x, normal_y) of the face that was hit, or None
+    """
+    end = entity.hitbox
+    start = end.copy()
+    start.midbottom = start_midbottom
+    dx = end.centerx - start.centerx
+    dy = end.bottom - start.bottom
+
+    best = None
+    best_platform = None
+    for platform in platforms:
+        hit = sweep_aabb(start, dx, dy, platform)
+        if hit is None or (landing_only and hit[2] != -1):
+            continue
+        if best is None or hit[0] < best[0]:
+            best = hit
+            best_platform = platform
+
+    if best is None:
+        return None
+
+    _, normal_x, normal_y = best
+    shift_x = shift_y = 0
+    if normal_x == -1:
+        shift_x = best_platform.left - end.right
+    elif normal_x == 1:
+        shift_x = best_platform.right - end.left
+    elif normal_y == -1:
+        shift_y = best_platform.top - end.bottom
+    else:
+        shift_y = best_platform.bottom - end.top
+        entity.vel_y = 0  # Bumped head - stop rising
+
+    entity.rect.x += shift_x
+    entity.rect.y += shift_y
+    entity.update_hitbox_position()
+    return normal_x, normal_y
+
 
 def check_platform_collision_player(player, platforms, tolerance=5):
     """
@@ -110,18 +461,143 @@ def check_platform_collision_enemy(enemy, platforms, tolerance=20):
         )
 
         if touching_from_top:
-            # Enemy lands on platform
-            # Enemies use midbottom alignment, so rect.bottom = hitbox.bottom
-            enemy.hitbox.bottom = platform.top
-            enemy.rect.bottom = enemy.hitbox.bottom
-            enemy.vel_y = 0
+            land_enemy(enemy, platform.top)
             enemy_on_ground = True
-            enemy.update_hitbox_position()
             break
 
     return enemy_on_ground
 
 
+def land_enemy(enemy, platform_top):
+    """
+    Place an enemy on top of a platform and stop its fall
+
+    Args:
+        enemy: The enemy object
+        platform_top: Y coordinate of the platform's top edge
+    """
+    # Enemies use midbottom alignment, so rect.bottom = hitbox.bottom
+    enemy.hitbox.bottom = platform_top
+    enemy.rect.bottom = enemy.hitbox.bottom
+    enemy.vel_y = 0
+    enemy.update_hitbox_position()
+
+
+def turn_enemy_around(enemy, direction):
+    """
+    Point an enemy in a new walking direction
+
+    Args:
+        enemy: The enemy object
+        direction: 1 for right, -1 for left
+    """
+    enemy.direction = direction
+    enemy.facing_right = direction == 1
+
+
+def check_enemy_ground_edge(enemy, platforms, hazards=(), tolerance=10, edge_buffer=15,
+                            hazard_check_distance=40):
+    """
+    Turn an enemy around at the edge of a ground platform (holes in the ground)
+
+    Only ground-level platforms (Y=400 +/- 30) count, so enemies can still walk
+    off raised platforms. Enemies with avoids_hazards also turn around before
+    walking into a hazard.
+
+    Args:
+        enemy: The enemy object (must have a direction attribute)
+        platforms: List of platform rectangles
+        hazards: List of hazard rectangles (empty to skip the hazard check)
+        tolerance: Pixel tolerance for finding the platform the enemy stands on
+        edge_buffer: Buffer zone to prevent oscillation at edges
+        hazard_check_distance: How far ahead to look for hazards
+
+    Returns:
+        bool: True if the enemy was turned around
+    """
+    enemy.at_platform_edge = False
+
+    # Find the platform the enemy is currently standing on
+    current_platform = None
+    for platform in platforms:
+        if (enemy.hitbox.bottom >= platform.top - tolerance and
+            enemy.hitbox.bottom <= platform.top + tolerance and
+            enemy.hitbox.right > platform.left and
+            enemy.hitbox.left < platform.right):
+            current_platform = platform
+            break
+
+    # Only apply edge detection if enemy is on a GROUND platform
+    # Ground platforms are typically at Y=400 (+/-30 pixels tolerance)
+    if current_platform is None or abs(current_platform.top - 400) > 30:
+        return False
+
+    if enemy.direction == -1:  # Moving left
+        if enemy.hitbox.left <= current_platform.left + edge_buffer:
+            turn_enemy_around(enemy, 1)
+            enemy.at_platform_edge = True
+    elif enemy.direction == 1:  # Moving right
+        if enemy.hitbox.right >= current_platform.right - edge_buffer:
+            turn_enemy_around(enemy, -1)
+            enemy.at_platform_edge = True
+
+    # Some enemies (Spiked Slimes) avoid walking onto hazards
+    if getattr(enemy, 'avoids_hazards', False):
+        for hazard in hazards:
+            if enemy.direction == -1:  # Moving left
+                if (hazard.right >= enemy.hitbox.left - hazard_check_distance and
+                    hazard.left < enemy.hitbox.left and
+                    abs(hazard.top - enemy.hitbox.bottom) < 50):
+                    turn_enemy_around(enemy, 1)
+                    enemy.at_platform_edge = True
+                    break
+            elif enemy.direction == 1:  # Moving right
+                if (hazard.left <= enemy.hitbox.right + hazard_check_distance and
+                    hazard.right > enemy.hitbox.right and
+                    abs(hazard.top - enemy.hitbox.bottom) < 50):
+                    turn_enemy_around(enemy, -1)
+                    enemy.at_platform_edge = True
+                    break
+
+    return enemy.at_platform_edge
+
+
+def check_enemy_patrol_edge(enemy, platforms, tolerance=5, edge_buffer=10):
+    """
+    Turn a patrolling enemy around at the edge of the platform it stands on
+
+    Args:
+        enemy: The enemy object (ignored unless it has patrol_left/patrol_right and direction)
+        platforms: List of platform rectangles
+        tolerance: Pixel tolerance for finding the platform the enemy stands on
+        edge_buffer: Distance from the edge at which to turn around
+
+    Returns:
+        bool: True if the enemy was turned around
+    """
+    if not (hasattr(enemy, 'patrol_left') and hasattr(enemy, 'patrol_right') and
+            hasattr(enemy, 'direction')):
+        return False
+
+    for platform in platforms:
+        if (enemy.hitbox.right > platform.left and
+            enemy.hitbox.left < platform.right and
+            enemy.hitbox.bottom >= platform.top - tolerance and
+            enemy.hitbox.bottom <= platform.top + tolerance):
+            # Enemy is on this platform - check edges
+            if enemy.direction == -1:  # Moving left
+                if enemy.hitbox.left <= platform.left + edge_buffer:
+                    turn_enemy_around(enemy, 1)
+                    return True
+            elif enemy.direction == 1:  # Moving right
+                if enemy.hitbox.right >= platform.right - edge_buffer:
+                    turn_enemy_around(enemy, -1)
+                    return True
+            return False
+
+    return False
+
+
 def check_hazard_collision(player, hazards, debug_invincibility=False):
     """
     Check if player collides with any hazards
@@ -97,6 +97,11 @@ ENEMY_HURT_FLASH_DURATION = _config.get('enemies.global.hurt_flash_duration', 20
 # Collision tolerances - From config
 PLATFORM_COLLISION_TOLERANCE = _config.get('collision.platform_tolerance', 5)
 STOMP_DETECTION_TOLERANCE = _config.get('collision.stomp_detection_tolerance', 15)
+ENEMY_LANDING_TOLERANCE = 20  # Discrete mode only - catches fast-falling enemies from tall drops
+
+# Swept (continuous) collision - From config
+SWEPT_COLLISION = _config.get('collision.swept', False)
+BATCH_ENEMY_COLLISION = _config.get('collision.batch_enemies', True)
 
 # Bounce - From config
 STOMP_BOUNCE_VELOCITY = _config.get('collision.stomp_bounce_velocity', -10)
@@ -85,6 +85,19 @@ class FontManager:
         """
         return cls.get_font("assets/fonts/PressStart2P-Regular.ttf", size)
 
+    @classmethod
+    def get_fixedsys(cls, size):
+        """
+        Convenience method to get the Fixedsys font (in-game HUD font)
+
+        Args:
+            size: Font size in pixels
+
+        Returns:
+            pygame.font.Font object
+        """
+        return cls.get_font("assets/fonts/Fixedsys500c.ttf", size)
+
     @classmethod
     def get_default_font(cls, size):
         """
@@ -0,0 +1,283 @@
+"""
+Headless Runner
+Steps a level's simulation with scripted input and no window, audio or rendering
+
+Usage:
+    python -m src.core.headless --level 3 --frames 36000 --script run
+    python -m src.core.headless --level 3 --frames 3600 --record run.ssr
+    python -m src.core.headless --replay run.ssr
+"""
+
+import argparse
+import os
+import random
+import time
+
+# SDL must pick the dummy drivers before pygame creates a window or opens audio
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from src.core.game_logging import get_logger
+from src.core.audio_manager import AudioManager
+from src.core.game_state import GameStateManager
+from src.core.simulation import (
+    LevelSimulation, ACTION_JUMP, ACTION_SPIN, ACTION_RESPAWN, EVENT_PLAYER_DIED, EVENT_LEVEL_COMPLETE
+)
+from src.core.replay import Replay, ReplayRecorder
+from src.utils import settings as S
+from src.utils.progression import GameProgression, LevelManager
+from src.rendering.particles import ParticleManager
+from src.rendering.screen_shake import ScreenShake
+
+logger = get_logger(__name__)
+
+
+class ScriptedInput:
+    """
+    Stand-in for pygame.key.get_pressed() driven by a script
+
+    A script is a function (frame, rng) -> (held_keys, actions), where
+    held_keys is a set of pygame key codes and actions is a sequence of
+    ACTION_* values for that step.
+    """
+
+    def __init__(self, script, seed=0):
+        """
+        Args:
+            script: Script function (see SCRIPTS)
+            seed: Seed for scripts that press keys at random
+        """
+        self.script = script
+        self.rng = random.Random(seed)
+        self.held = frozenset()
+        self.actions = ()
+
+    def advance(self, frame):
+        """Read the script for a frame"""
+        held, actions = self.script(frame, self.rng)
+        self.held = frozenset(held)
+        self.actions = tuple(actions)
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+def script_idle(frame, rng):
+    """Press nothing (enemies and moving platforms still run)"""
+    return (), ()
+
+
+def script_run(frame, rng):
+    """Hold right and jump every 45 frames"""
+    return (pygame.K_RIGHT,), (ACTION_JUMP,) if frame % 45 == 0 else ()
+
+
+def script_random(frame, rng):
+    """Change direction every half second and jump, spin and roll at random"""
+    held = set()
+    direction = (frame // 30) % 4
+    if direction in (0, 1):
+        held.add(pygame.K_RIGHT)
+    elif direction == 2:
+        held.add(pygame.K_LEFT)
+    if rng.random() < 0.02:
+        held.add(pygame.K_DOWN)
+    actions = []
+    if rng.random() < 0.04:
+        actions.append(ACTION_JUMP)
+    if rng.random() < 0.01:
+        actions.append(ACTION_SPIN)
+    return held, actions
+
+
+SCRIPTS = {
+    'idle': script_idle,
+    'run': script_run,
+    'random': script_random,
+}
+
+
+class HeadlessRunner:
+    """
+    Runs a level for a fixed number of simulation steps as fast as possible
+
+    With a script, deaths respawn the player at the last checkpoint (or
+    restart the level) and completing the level restarts it, so any frame
+    count can be soaked. Restarts are skipped while recording, since a replay
+    covers a single level attempt. With a replay, the recorded input is fed
+    through the same LevelSimulation.update path the game uses.
+    """
+
+    def __init__(self, level=1, script='run', seed=0, checkpoints=True, difficulty="Medium",
+                 replay=None, record_path=None, performance_monitor=None):
+        """
+        Args:
+            level: Level number (key of LevelManager.LEVELS)
+            script: Name of a scripted input pattern in SCRIPTS
+            seed: Seed for the random module and randomized scripts
+            checkpoints: Whether checkpoints are enabled
+            difficulty: Difficulty name (affects coin requirements)
+            replay: Replay to play back instead of a script (overrides level,
+                seed, checkpoints and difficulty)
+            record_path: Write a replay of this run to this file
+            performance_monitor: PerformanceMonitor passed to each LevelSimulation
+        """
+        self.replay = replay
+        self.performance_monitor = performance_monitor
+        self.simulation_options = {'seed': seed}
+        if replay is not None:
+            level, seed = replay.level, replay.seed
+            self.simulation_options = replay.simulation_options()
+
+        if level not in LevelManager.LEVELS:
+            raise ValueError(f"Unknown level {level}, choose from {sorted(LevelManager.LEVELS)}")
+        if script not in SCRIPTS:
+            raise ValueError(f"Unknown script '{script}', choose from {sorted(SCRIPTS)}")
+
+        self.progression = GameProgression(difficulty=difficulty, username="headless")
+        self.progression.current_level = level
+        self.progression.checkpoints_enabled = checkpoints
+        if replay is not None:
+            replay.configure(self.progression)
+        self.input = ScriptedInput(SCRIPTS[script], seed)
+        self.replay_frames = iter(replay) if replay is not None else None
+
+        if not pygame.get_init():
+            pygame.init()
+        if pygame.display.get_surface() is None:
+            # Sprite loading needs a display mode for convert_alpha()
+            pygame.display.set_mode((1, 1))
+
+        self.audio_manager = AudioManager(enable_music=False, enable_sound=False)
+        self.deaths = 0
+        self.completions = 0
+        self.frames = 0
+        self.simulation = None
+        self.load_level()
+        self.recorder = ReplayRecorder(record_path, self.simulation) if record_path else None
+
+    def load_level(self):
+        """(Re)load the level with fresh game state"""
+        self.simulation = LevelSimulation(
+            self.progression, GameStateManager(), self.audio_manager,
+            ParticleManager(), ScreenShake(), enable_sound=False,
+            performance_monitor=self.performance_monitor, **self.simulation_options
+        )
+
+    def step(self):
+        """
+        Run one simulation step with the next scripted or recorded input
+
+        Returns:
+            bool: False once a replay has run out of steps
+        """
+        simulation = self.simulation
+
+        if self.replay_frames is not None:
+            frame = next(self.replay_frames, None)
+            if frame is None:
+                return False
+            keys, actions = frame
+        else:
+            self.input.advance(self.frames)
+            keys, actions = self.input, list(self.input.actions)
+            if simulation.game_state.game_over:
+                if simulation.has_checkpoint:
+                    actions.append(ACTION_RESPAWN)
+                elif self.recorder is None:
+                    self.load_level()
+                    simulation = self.simulation
+
+        if self.recorder is not None:
+            self.recorder.record(keys, actions)
+        events = simulation.update(keys, actions)
+        self.frames += 1
+
+        if EVENT_PLAYER_DIED in events:
+            self.deaths += 1
+        if EVENT_LEVEL_COMPLETE in events:
+            self.completions += 1
+            if self.replay is None and self.recorder is None:
+                self.load_level()
+        return True
+
+    def run(self, frames=None):
+        """
+        Run a number of simulation steps
+
+        Args:
+            frames: Number of steps (60 per second of game time); defaults
+                to the whole replay, or 3600 steps for a script
+
+        Returns:
+            dict: Run statistics
+        """
+        if frames is None:
+            frames = len(self.replay) if self.replay is not None else 3600
+
+        start = time.perf_counter()
+        start_frames = self.frames
+        for _ in range(frames):
+            if not self.step():
+                break
+        elapsed = time.perf_counter() - start
+        frames = self.frames - start_frames
+
+        player = self.simulation.player
+        stats = {
+            'level': self.progression.current_level,
+            'frames': frames,
+            'seconds': elapsed,
+            'steps_per_second': frames / elapsed if elapsed > 0 else float('inf'),
+            'realtime_factor': frames / S.FPS / elapsed if elapsed > 0 else float('inf'),
+            'deaths': self.deaths,
+            'completions': self.completions,
+            'coins_collected': self.simulation.coins_collected,
+            'player_position': (player.rect.x, player.rect.y),
+            'state_hash': self.simulation.state_hash(),
+        }
+        if self.replay is not None and self.replay.final_hash is not None and self.frames == len(self.replay):
+            stats['replay_match'] = stats['state_hash'] == self.replay.final_hash
+        return stats
+
+    def close(self):
+        """Finish the replay being recorded, if any"""
+        if self.recorder is not None:
+            self.recorder.close()
+
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Run a level headless with scripted or recorded input")
+    parser.add_argument('--level', type=int, default=1, help="Level number")
+    parser.add_argument('--frames', type=int, default=None,
+                        help="Simulation steps to run (60 per second, default 3600 or the whole replay)")
+    parser.add_argument('--script', choices=sorted(SCRIPTS), default='run', help="Scripted input pattern")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed")
+    parser.add_argument('--no-checkpoints', action='store_true', help="Disable checkpoints")
+    parser.add_argument('--record', metavar='FILE', help="Record the run to a replay file")
+    parser.add_argument('--replay', metavar='FILE', help="Play back a replay file instead of a script")
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.replay) if args.replay else None
+    runner = HeadlessRunner(args.level, script=args.script, seed=args.seed,
+                            checkpoints=not args.no_checkpoints, replay=replay,
+                            record_path=args.record)
+    stats = runner.run(args.frames)
+    runner.close()
+
+    print(f"Level {stats['level']}: {stats['frames']} steps in {stats['seconds']:.2f}s "
+          f"({stats['steps_per_second']:.0f} steps/s, {stats['realtime_factor']:.1f}x real time)")
+    print(f"Deaths: {stats['deaths']}, completions: {stats['completions']}, "
+          f"coins: {stats['coins_collected']}, player at {stats['player_position']}")
+    print(f"State hash: {stats['state_hash']:08x}")
+    if 'replay_match' in stats:
+        print("Replay matches recording" if stats['replay_match'] else "Replay DESYNCED from recording")
+    pygame.quit()
+    return stats
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,7 @@ Centralized input processing for the game
 
 import pygame
 from src.core.game_logging import get_logger
+from src.core.simulation import ACTION_JUMP, ACTION_SPIN
 
 logger = get_logger(__name__)
 
@@ -22,15 +23,19 @@ class InputHandler:
         self.quit_requested = False
         self.window_resized = False
         self.new_window_size = None
+        self.actions = []  # Gameplay actions (ACTION_*) pressed this frame
         logger.debug("InputHandler initialized")
 
-    def handle_events(self, game_state, player, pause_menu, death_menu, audio_manager):
+    def handle_events(self, game_state, pause_menu, death_menu, audio_manager):
         """
         Process all pygame events
 
+        Gameplay key presses (jump, spin attack) are not applied here but
+        collected in self.actions for the next simulation step, so they can
+        be recorded and replayed.
+
         Args:
             game_state: GameStateManager instance
-            player: Player instance
             pause_menu: PauseMenu instance
             death_menu: DeathMenu instance
             audio_manager: AudioManager instance
@@ -40,8 +45,9 @@ class InputHandler:
         """
         command = None
 
-        # Reset resize flag each frame
+        # Reset resize flag and actions each frame
         self.window_resized = False
+        self.actions = []
 
         if not game_state.cutscene_active:
             for event in pygame.event.get():
@@ -58,7 +64,7 @@ class InputHandler:
                 # Handle keyboard events
                 elif event.type == pygame.KEYDOWN:
                     result = self._handle_keydown(
-                        event, game_state, player, pause_menu, death_menu, audio_manager
+                        event, game_state, pause_menu, death_menu, audio_manager
                     )
                     if result:
                         command = result
@@ -73,7 +79,7 @@ class InputHandler:
 
         return command
 
-    def _handle_keydown(self, event, game_state, player, pause_menu, death_menu, audio_manager):
+    def _handle_keydown(self, event, game_state, pause_menu, death_menu, audio_manager):
         """
         Handle keyboard events
 
@@ -94,7 +100,7 @@ class InputHandler:
 
         # Gameplay input (only if actively playing)
         if game_state.is_playing:
-            return self._handle_gameplay_input(event, player, audio_manager)
+            return self._handle_gameplay_input(event)
 
         return None
 
@@ -151,18 +157,15 @@ class InputHandler:
 
         return None
 
-    def _handle_gameplay_input(self, event, player, audio_manager):
+    def _handle_gameplay_input(self, event):
         """Handle gameplay input (jumps, attacks, etc.)"""
         # Jump
         if event.key in (pygame.K_SPACE, pygame.K_UP, pygame.K_w):
-            player.jump(
-                audio_manager.get_sound('jump'),
-                audio_manager.get_sound('double_jump')
-            )
+            self.actions.append(ACTION_JUMP)
 
         # Spin attack
         elif event.key == pygame.K_e:
-            player.spin_attack(audio_manager.get_sound('spin_attack'))
+            self.actions.append(ACTION_SPIN)
 
         # Quick restart (Shift+Enter)
         elif event.key == pygame.K_RETURN:
@@ -3,9 +3,247 @@ Performance Profiler
 Tools for measuring and optimizing game performance
 """
 
+import atexit
+import json
 import time
 import pygame
 from collections import deque
+from pathlib import Path
+
+from src.core.game_logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class _NullScope:
+    """Scope handed out while monitoring is disabled (does nothing)"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _ProfileScope:
+    """Times one named section of a frame, nested under any scope already open"""
+
+    __slots__ = ('monitor', 'name', 'path', 'start')
+
+    def __init__(self, monitor, name):
+        self.monitor = monitor
+        self.name = name
+
+    def __enter__(self):
+        stack = self.monitor._scope_stack
+        self.path = f"{stack[-1]}/{self.name}" if stack else self.name
+        stack.append(self.path)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        elapsed = (end - self.start) * 1000
+        monitor = self.monitor
+        monitor._scope_stack.pop()
+        if monitor.tracer is not None:
+            monitor.tracer.complete(self.name, self.start, end)
+        totals = monitor._frame_scopes
+        totals[self.path] = totals.get(self.path, 0) + elapsed
+        return False
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed histogram of durations with constant relative precision
+
+    Durations are kept in whole microseconds. Below 64us every value has its
+    own bucket; above that, buckets keep the top 6 bits of the value, so any
+    bucket is within about 3% of the values it holds (HDR histogram style).
+    Memory is bounded by the range of values seen, not the number recorded.
+    """
+
+    SIGNIFICANT_BITS = 6
+
+    def __init__(self):
+        self.counts = {}  # bucket lower bound (us) -> count
+        self.total = 0
+        self.sum_ms = 0.0
+        self.min_ms = None
+        self.max_ms = 0.0
+
+    @classmethod
+    def _bucket_width(cls, lower_us):
+        """Width in microseconds of the bucket starting at lower_us"""
+        return 1 << max(0, lower_us.bit_length() - cls.SIGNIFICANT_BITS)
+
+    def record(self, ms):
+        """
+        Add one duration
+
+        Args:
+            ms: Duration in milliseconds
+        """
+        us = max(0, int(ms * 1000))
+        shift = max(0, us.bit_length() - self.SIGNIFICANT_BITS)
+        lower = (us >> shift) << shift
+        self.counts[lower] = self.counts.get(lower, 0) + 1
+        self.total += 1
+        self.sum_ms += ms
+        if self.min_ms is None or ms < self.min_ms:
+            self.min_ms = ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, percentile):
+        """
+        Get the duration below which a percentage of the recorded values fall
+
+        Args:
+            percentile: Percentile (0-100)
+
+        Returns:
+            float: Upper edge of the bucket holding that rank, in ms (0 if empty)
+        """
+        if not self.total:
+            return 0
+        rank = max(1, -(-percentile * self.total // 100))
+        seen = 0
+        for lower in sorted(self.counts):
+            seen += self.counts[lower]
+            if seen >= rank:
+                upper_ms = (lower + self._bucket_width(lower)) / 1000
+                return min(upper_ms, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self):
+        """Summary and non-empty buckets as JSON-friendly data"""
+        return {
+            'count': self.total,
+            'mean_ms': round(self.sum_ms / self.total, 3) if self.total else 0,
+            'min_ms': round(self.min_ms or 0, 3),
+            'max_ms': round(self.max_ms, 3),
+            'percentiles_ms': {f"p{p}": round(self.percentile(p), 3) for p in (50, 90, 95, 99, 99.9)},
+            'buckets_us': {str(lower): self.counts[lower] for lower in sorted(self.counts)},
+        }
+
+
+class SessionProfile:
+    """
+    Whole-session frame-time histograms and captured slow frames
+
+    Unlike PerformanceMonitor's rolling averages, this covers every monitored
+    frame since the game started, across levels. Any frame slower than the
+    spike budget is captured along with its scope breakdown and game context.
+    """
+
+    _session = None
+
+    def __init__(self, spike_budget_ms=1000 / 30, max_spikes=200):
+        """
+        Args:
+            spike_budget_ms: Frames slower than this are captured as spikes
+            max_spikes: Most spikes kept (later ones are only counted)
+        """
+        self.spike_budget_ms = spike_budget_ms
+        self.max_spikes = max_spikes
+        self.histograms = {
+            'frame': LatencyHistogram(),
+            'update': LatencyHistogram(),
+            'render': LatencyHistogram(),
+        }
+        self.spikes = []
+        self.spike_count = 0
+        self.frames = 0
+        self.started = time.time()
+
+    @classmethod
+    def get_session(cls, save_path=None, **kwargs):
+        """
+        Get the process-wide session profile, creating it on first use
+
+        Args:
+            save_path: Write the profile as JSON here when the process exits
+                (only used when the session is created)
+            **kwargs: SessionProfile options (only used when the session is created)
+
+        Returns:
+            SessionProfile: The shared session
+        """
+        if cls._session is None:
+            cls._session = cls(**kwargs)
+            if save_path is not None:
+                atexit.register(cls._session.save, save_path)
+        return cls._session
+
+    def record_frame(self, frame_ms, update_ms, render_ms, scopes, context):
+        """
+        Add one frame's times and capture it if it went over budget
+
+        Args:
+            frame_ms, update_ms, render_ms: Phase times for the frame
+            scopes: Scope path -> ms for the frame
+            context: Callable returning a dict describing the game state, or None
+        """
+        self.frames += 1
+        self.histograms['frame'].record(frame_ms)
+        self.histograms['update'].record(update_ms)
+        self.histograms['render'].record(render_ms)
+
+        if frame_ms <= self.spike_budget_ms:
+            return
+        self.spike_count += 1
+        if len(self.spikes) >= self.max_spikes:
+            return
+        spike = {
+            'frame': self.frames,
+            'time_s': round(time.time() - self.started, 3),
+            'frame_ms': round(frame_ms, 3),
+            'update_ms': round(update_ms, 3),
+            'render_ms': round(render_ms, 3),
+            'scopes_ms': {path: round(ms, 3) for path, ms in
+                          sorted(scopes.items(), key=lambda item: item[1], reverse=True)},
+        }
+        if context is not None:
+            try:
+                spike['context'] = context()
+            except Exception as e:  # A broken context hook must not take the game down
+                spike['context'] = {'error': str(e)}
+        self.spikes.append(spike)
+
+    def to_dict(self):
+        """The session as JSON-friendly data"""
+        return {
+            'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started)),
+            'duration_s': round(time.time() - self.started, 3),
+            'frames': self.frames,
+            'spike_budget_ms': self.spike_budget_ms,
+            'spike_count': self.spike_count,
+            'histograms': {name: histogram.to_dict() for name, histogram in self.histograms.items()},
+            'spikes': self.spikes,
+        }
+
+    def save(self, path):
+        """
+        Write the session as JSON (skipped if no frames were recorded)
+
+        Args:
+            path: File to write (parent directories are created)
+        """
+        if not self.frames:
+            return
+        try:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(self.to_dict(), indent=2))
+            logger.info(f"Saved performance profile: {path} ({self.frames} frames, {self.spike_count} spikes)")
+        except OSError as e:
+            logger.error(f"Could not save performance profile: {e}")
 
 
 class PerformanceMonitor:
@@ -27,8 +265,50 @@ class PerformanceMonitor:
         self.update_start = 0
         self.render_start = 0
 
+        # View culling counters from the last rendered frame (layer -> (drawn, culled))
+        self.culling = {}
+
+        # Named scope times: totals for the frame in progress, then one dict per finished frame
+        self._scope_stack = []
+        self._frame_scopes = {}
+        self.scope_frames = deque(maxlen=sample_size)
+        self.overlay_scopes = 8  # Slowest scopes listed in the overlay
+
+        # Whole-session histograms and spike capture (see SessionProfile)
+        self.session = None
+        self.context_provider = None  # Callable returning game context for captured spikes
+        self.last_update_time = 0
+        self.last_render_time = 0
+
+        # TraceWriter that receives frame, phase and scope events (see src.core.tracing)
+        self.tracer = None
+        self.frame_count = 0
+
         self.enabled = False
 
+    def scope(self, name):
+        """
+        Time a named section of the frame
+
+        Scopes opened inside another scope are recorded under its path
+        ("enemies/ai"). A section entered several times in one frame adds up.
+        While the monitor is disabled this returns a shared no-op scope.
+
+        Usage:
+            with monitor.scope("enemies"):
+                with monitor.scope("ai"):
+                    ...
+
+        Args:
+            name: Section name
+
+        Returns:
+            Context manager that times the section
+        """
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _ProfileScope(self, name)
+
     def start_frame(self):
         """Mark the start of a frame"""
         if self.enabled:
@@ -42,8 +322,12 @@ class PerformanceMonitor:
     def end_update(self):
         """Mark the end of update phase"""
         if self.enabled:
-            update_time = (time.perf_counter() - self.update_start) * 1000  # Convert to ms
+            end = time.perf_counter()
+            update_time = (end - self.update_start) * 1000  # Convert to ms
             self.update_times.append(update_time)
+            self.last_update_time = update_time
+            if self.tracer is not None:
+                self.tracer.complete("update", self.update_start, end, 'phase')
 
     def start_render(self):
         """Mark the start of render phase"""
@@ -53,14 +337,74 @@ class PerformanceMonitor:
     def end_render(self):
         """Mark the end of render phase"""
         if self.enabled:
-            render_time = (time.perf_counter() - self.render_start) * 1000
+            end = time.perf_counter()
+            render_time = (end - self.render_start) * 1000
             self.render_times.append(render_time)
+            self.last_render_time = render_time
+            if self.tracer is not None:
+                self.tracer.complete("render", self.render_start, end, 'phase')
 
     def end_frame(self):
         """Mark the end of a frame"""
         if self.enabled:
-            frame_time = (time.perf_counter() - self.frame_start) * 1000
+            end = time.perf_counter()
+            frame_time = (end - self.frame_start) * 1000
             self.frame_times.append(frame_time)
+            self.frame_count += 1
+            if self.tracer is not None:
+                self.tracer.complete("frame", self.frame_start, end, 'frame', {'frame': self.frame_count})
+            if self.session is not None:
+                self.session.record_frame(frame_time, self.last_update_time, self.last_render_time,
+                                          self._frame_scopes, self.context_provider)
+            self.scope_frames.append(self._frame_scopes)
+            self._frame_scopes = {}
+
+    def record_culling(self, counts):
+        """
+        Record how many objects each layer drew and culled this frame
+
+        Args:
+            counts: dict of layer name -> (drawn, culled)
+        """
+        if self.enabled:
+            self.culling = {layer: tuple(pair) for layer, pair in counts.items()}
+
+    def get_culling_stats(self):
+        """
+        Get drawn/culled totals for the last frame
+
+        Returns:
+            dict: 'drawn', 'culled' and per-layer 'layers' counts
+        """
+        return {
+            'drawn': sum(drawn for drawn, _ in self.culling.values()),
+            'culled': sum(culled for _, culled in self.culling.values()),
+            'layers': dict(self.culling),
+        }
+
+    def get_scope_stats(self, top=None):
+        """
+        Get average and worst per-frame time of each scope over the sample period
+
+        Args:
+            top: Only return this many of the slowest scopes (None for all)
+
+        Returns:
+            list: (path, avg_ms, max_ms) tuples, slowest average first
+        """
+        frames = len(self.scope_frames)
+        if not frames:
+            return []
+        totals = {}
+        worst = {}
+        for frame in self.scope_frames:
+            for path, ms in frame.items():
+                totals[path] = totals.get(path, 0) + ms
+                if ms > worst.get(path, 0):
+                    worst[path] = ms
+        stats = sorted(((path, total / frames, worst[path]) for path, total in totals.items()),
+                       key=lambda stat: stat[1], reverse=True)
+        return stats[:top] if top is not None else stats
 
     def get_avg_fps(self):
         """Get average FPS over sample period"""
@@ -94,6 +438,32 @@ class PerformanceMonitor:
         max_frame_time = max(self.frame_times)
         return 1000 / max_frame_time if max_frame_time > 0 else 0
 
+    def get_percentiles(self, percentiles=(50, 95, 99)):
+        """
+        Get frame, update and render time percentiles over the sample period
+
+        Uses the nearest-rank method, so every value is a measured time.
+
+        Args:
+            percentiles: Percentiles to report (0-100)
+
+        Returns:
+            dict: 'frame', 'update' and 'render' -> {'p50': ms, ...}
+        """
+        result = {}
+        for name, times in (('frame', self.frame_times), ('update', self.update_times),
+                            ('render', self.render_times)):
+            ordered = sorted(times)
+            result[name] = {}
+            for percentile in percentiles:
+                if not ordered:
+                    value = 0
+                else:
+                    rank = max(1, -(-percentile * len(ordered) // 100))  # ceil without floats
+                    value = ordered[min(rank, len(ordered)) - 1]
+                result[name][f"p{percentile}"] = value
+        return result
+
     def get_performance_report(self):
         """Get a formatted performance report"""
         if not self.enabled:
@@ -107,8 +477,18 @@ Avg Frame Time:     {self.get_avg_frame_time():.2f}ms
 Avg Update Time:    {self.get_avg_update_time():.2f}ms
 Avg Render Time:    {self.get_avg_render_time():.2f}ms
 Sample Size:        {len(self.frame_times)} frames
-==========================
 """
+        culling = self.get_culling_stats()
+        if culling['layers']:
+            report += f"Drawn / Culled:     {culling['drawn']} / {culling['culled']}\n"
+            for layer, (drawn, culled) in culling['layers'].items():
+                report += f"  {layer + ':':<18}{drawn} / {culled}\n"
+        scopes = self.get_scope_stats()
+        if scopes:
+            report += "Scopes (avg / max):\n"
+            for path, avg_ms, max_ms in scopes:
+                report += f"  {path + ':':<24}{avg_ms:.2f}ms / {max_ms:.2f}ms\n"
+        report += "==========================\n"
         return report
 
     def draw_overlay(self, screen, x=10, y=10):
@@ -132,10 +512,18 @@ Sample Size:        {len(self.frame_times)} frames
         frame_text = f"Frame: {self.get_avg_frame_time():.1f}ms"
         update_text = f"Update: {self.get_avg_update_time():.1f}ms"
         render_text = f"Render: {self.get_avg_render_time():.1f}ms"
+        lines = [fps_text, frame_text, update_text, render_text]
+
+        if self.culling:
+            culling = self.get_culling_stats()
+            lines.append(f"Drawn: {culling['drawn']}  Culled: {culling['culled']}")
+
+        for path, avg_ms, _ in self.get_scope_stats(self.overlay_scopes):
+            lines.append(f"{path}: {avg_ms:.2f}ms")
 
         # Background box
-        box_height = 100
-        box_width = 200
+        box_height = 12 + len(lines) * 22
+        box_width = max(200, 20 + max(font.size(text)[0] for text in lines))
         background = pygame.Surface((box_width, box_height))
         background.set_alpha(128)
         background.fill((0, 0, 0))
@@ -143,7 +531,7 @@ Sample Size:        {len(self.frame_times)} frames
 
         # Draw text
         y_offset = y + 10
-        for text in [fps_text, frame_text, update_text, render_text]:
+        for text in lines:
             # Determine color based on performance
             if "FPS" in text:
                 fps_value = self.get_avg_fps()
@@ -0,0 +1,245 @@
+"""
+Replay
+Compact binary recording and playback of per-step input for deterministic replays
+"""
+
+import random
+import struct
+from pathlib import Path
+
+import pygame
+from src.core.game_logging import get_logger
+from src.core.simulation import ACTION_JUMP, ACTION_SPIN, ACTION_RESPAWN
+
+logger = get_logger(__name__)
+
+REPLAY_MAGIC = b'SSRP'
+REPLAY_VERSION = 1
+REPLAY_EXTENSION = '.ssr'
+
+# Held keys the player reads each step, one bit each (order is part of the file format)
+RECORDED_KEYS = (
+    pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN, pygame.K_SPACE,
+    pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s,
+)
+ACTION_BITS = (ACTION_JUMP, ACTION_SPIN, ACTION_RESPAWN)
+
+# Header: magic, version, level, option flags, seed, difficulty length (difficulty follows)
+HEADER = struct.Struct('<4sBBBIB')
+# Body: runs of identical steps (step count, held-key bits, action bits); a 0 count ends the body
+RUN = struct.Struct('<HHB')
+# Footer: total steps and LevelSimulation.state_hash() after the last step
+FOOTER = struct.Struct('<II')
+MAX_RUN = 0xFFFF
+
+# Option flag bits (simulation settings that change gameplay)
+FLAG_CHECKPOINTS = 1
+FLAG_SHOW_ENEMIES = 2
+FLAG_SHOW_PLATFORMS = 4
+FLAG_SHOW_HAZARDS = 8
+FLAG_INVINCIBLE = 16
+
+
+def new_seed():
+    """Pick a fresh seed for a recorded run"""
+    return random.SystemRandom().getrandbits(32)
+
+
+def pack_keys(keys):
+    """Pack held keys (anything indexable by key code) into RECORDED_KEYS bits"""
+    mask = 0
+    for bit, key in enumerate(RECORDED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def pack_actions(actions):
+    """Pack ACTION_* values into ACTION_BITS bits"""
+    mask = 0
+    for bit, action in enumerate(ACTION_BITS):
+        if action in actions:
+            mask |= 1 << bit
+    return mask
+
+
+class ReplayKeys:
+    """Held-key state decoded from a replay, indexable like pygame.key.get_pressed()"""
+
+    __slots__ = ('held',)
+
+    def __init__(self, mask):
+        self.held = frozenset(key for bit, key in enumerate(RECORDED_KEYS) if mask & (1 << bit))
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+class ReplayRecorder:
+    """
+    Writes the input of every simulation step to a replay file as it is played
+
+    Steps are run-length encoded (held keys rarely change between steps), so
+    a minute of play is typically a few hundred bytes. Runs are written as
+    they end, so a crash loses at most the current run.
+    """
+
+    def __init__(self, path, simulation):
+        """
+        Args:
+            path: Replay file to create (parent directories are created)
+            simulation: LevelSimulation being recorded (must have been given a seed)
+        """
+        if simulation.seed is None:
+            raise ValueError("Replays need a seeded LevelSimulation")
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.simulation = simulation
+        self.steps = 0
+        self._run = None  # [count, keys, actions]
+
+        progression = simulation.progression
+        flags = ((FLAG_CHECKPOINTS if progression.checkpoints_enabled else 0) |
+                 (FLAG_SHOW_ENEMIES if simulation.show_enemies else 0) |
+                 (FLAG_SHOW_PLATFORMS if simulation.show_platforms else 0) |
+                 (FLAG_SHOW_HAZARDS if simulation.show_hazards else 0) |
+                 (FLAG_INVINCIBLE if simulation.invincible else 0))
+        difficulty = progression.difficulty.encode('utf-8')
+
+        self._file = open(self.path, 'wb')
+        self._file.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, progression.current_level,
+                                     flags, simulation.seed, len(difficulty)))
+        self._file.write(difficulty)
+        logger.info(f"Recording replay to {self.path}")
+
+    def record(self, keys, actions=()):
+        """
+        Record the input for one simulation step (call right before simulation.update)
+
+        Args:
+            keys: Held-key state passed to the step
+            actions: ACTION_* values applied at the start of the step
+        """
+        if self._file is None:
+            return
+        self.steps += 1
+        key_bits = pack_keys(keys)
+        action_bits = pack_actions(actions)
+        run = self._run
+        if run is not None and run[1] == key_bits and run[2] == action_bits and run[0] < MAX_RUN:
+            run[0] += 1
+            return
+        self._flush_run()
+        self._run = [1, key_bits, action_bits]
+
+    def _flush_run(self):
+        """Write the current run of identical steps"""
+        if self._run is not None:
+            self._file.write(RUN.pack(*self._run))
+            self._run = None
+
+    def close(self):
+        """Finish the file with the step count and the final state hash (safe to call twice)"""
+        if self._file is None:
+            return
+        self._flush_run()
+        self._file.write(RUN.pack(0, 0, 0))
+        self._file.write(FOOTER.pack(self.steps, self.simulation.state_hash()))
+        self._file.close()
+        self._file = None
+        logger.info(f"Saved replay: {self.path} ({self.steps} steps)")
+
+
+class Replay:
+    """A loaded replay file"""
+
+    def __init__(self, level, difficulty, flags, seed, steps, final_hash=None):
+        """
+        Args:
+            level: Level number
+            difficulty: Difficulty name
+            flags: FLAG_* option bits
+            seed: Random seed the level was loaded with
+            steps: List of (key_bits, action_bits), one per simulation step
+            final_hash: State hash after the last step (None if the file was not closed)
+        """
+        self.level = level
+        self.difficulty = difficulty
+        self.flags = flags
+        self.seed = seed
+        self.steps = steps
+        self.final_hash = final_hash
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a replay file
+
+        Files from runs that never closed the recorder load without a final
+        hash and end at the last complete run.
+
+        Args:
+            path: Replay file
+
+        Returns:
+            Replay: The loaded replay
+
+        Raises:
+            ValueError: If the file is not a replay or is a newer version
+        """
+        data = Path(path).read_bytes()
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} is not a replay file")
+        magic, version, level, flags, seed, difficulty_length = HEADER.unpack_from(data, 0)
+        if magic != REPLAY_MAGIC:
+            raise ValueError(f"{path} is not a replay file")
+        if version > REPLAY_VERSION:
+            raise ValueError(f"{path} is replay version {version}, this build reads up to {REPLAY_VERSION}")
+
+        offset = HEADER.size
+        difficulty = data[offset:offset + difficulty_length].decode('utf-8')
+        offset += difficulty_length
+
+        steps = []
+        final_hash = None
+        while offset + RUN.size <= len(data):
+            count, key_bits, action_bits = RUN.unpack_from(data, offset)
+            offset += RUN.size
+            if count == 0:
+                if offset + FOOTER.size <= len(data):
+                    _, final_hash = FOOTER.unpack_from(data, offset)
+                break
+            steps.extend([(key_bits, action_bits)] * count)
+
+        return cls(level, difficulty, flags, seed, steps, final_hash)
+
+    def configure(self, progression):
+        """Set up a GameProgression to match the recorded run"""
+        progression.current_level = self.level
+        progression.difficulty = self.difficulty
+        progression.checkpoints_enabled = bool(self.flags & FLAG_CHECKPOINTS)
+
+    def simulation_options(self):
+        """Keyword arguments for LevelSimulation matching the recorded run"""
+        return {
+            'show_enemies': bool(self.flags & FLAG_SHOW_ENEMIES),
+            'show_platforms': bool(self.flags & FLAG_SHOW_PLATFORMS),
+            'show_hazards': bool(self.flags & FLAG_SHOW_HAZARDS),
+            'invincible': bool(self.flags & FLAG_INVINCIBLE),
+            'seed': self.seed,
+        }
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __iter__(self):
+        """Yield (keys, actions) for each step, ready for LevelSimulation.update"""
+        decoded = {}
+        for step in self.steps:
+            frame = decoded.get(step)
+            if frame is None:
+                key_bits, action_bits = step
+                actions = tuple(action for bit, action in enumerate(ACTION_BITS) if action_bits & (1 << bit))
+                frame = decoded[step] = (ReplayKeys(key_bits), actions)
+            yield frame
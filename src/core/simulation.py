@@ -0,0 +1,769 @@
+"""
+Level Simulation
+One level's gameplay state and its fixed 60 Hz update step, shared by the game loop and headless runs
+"""
+
+import random
+import struct
+import zlib
+
+from src.core.game_logging import get_logger
+from src.core.performance import PerformanceMonitor
+from src.core import collision_physics as collision
+from src.core.batch_collision import create_enemy_batch_collider
+from src.core import constants as C
+from src.utils import settings as S
+from src.utils.progression import LevelManager
+from src.ui.checkpoint import Checkpoint
+from src.rendering.screen_shake import apply_preset
+
+logger = get_logger(__name__)
+
+# Step events reported back to the caller
+EVENT_PLAYER_DIED = "PLAYER_DIED"
+EVENT_LEVEL_COMPLETE = "LEVEL_COMPLETE"
+EVENT_RESPAWNED = "RESPAWNED"
+
+# One-shot player actions applied at the start of a step (from KEYDOWN events or a replay)
+ACTION_JUMP = "JUMP"
+ACTION_SPIN = "SPIN"
+ACTION_RESPAWN = "RESPAWN"
+
+PROJECTILE_SOUND_RANGE = 400  # Only hear projectiles within this distance
+
+
+def take_step_actions(pending):
+    """
+    Remove the actions for the next step from a queue of pending actions
+
+    Each action is applied at most once per step (replays store one bit per
+    action); a second press queued in the same frame waits for the next step.
+
+    Args:
+        pending: List of ACTION_* values (modified in place)
+
+    Returns:
+        list: Actions for this step
+    """
+    actions = []
+    remaining = []
+    for action in pending:
+        (remaining if action in actions else actions).append(action)
+    pending[:] = remaining
+    return actions
+
+
+class LevelSimulation:
+    """
+    Loads a level and advances its gameplay one simulation step at a time
+
+    step() is everything main used to run per frame while playing: player
+    and enemy updates, collision, combat, coins, checkpoints and the camera.
+    It never draws. Particles, screen shake and sound effects go through the
+    objects passed in, and menus, saving and score submission stay with the
+    caller, which reacts to the events step() returns.
+
+    Given the same seed, keys and actions per step, a level plays out
+    identically: gameplay randomness (enemy AI) comes from the random module,
+    which is seeded before the level loads, and purely visual effects use
+    their own random streams.
+    """
+
+    def __init__(self, progression, game_state, audio_manager, particle_mgr, screen_shake,
+                 enable_sound=True, show_enemies=True, show_platforms=True, show_hazards=True,
+                 invincible=False, seed=None, performance_monitor=None):
+        """
+        Args:
+            progression: GameProgression (current level, difficulty, checkpoints)
+            game_state: GameStateManager for this level
+            audio_manager: AudioManager used for sound effects
+            particle_mgr: ParticleManager for hit/coin effects
+            screen_shake: ScreenShake for impact feedback
+            enable_sound: Whether sound effects are enabled
+            show_enemies: Whether enemies are updated and collide (debug toggle)
+            show_platforms: Whether the player collides with platforms (debug toggle)
+            show_hazards: Whether hazards kill the player (debug toggle)
+            invincible: Debug invincibility (no damage or deaths)
+            seed: Seed for the random module (None leaves it as is)
+            performance_monitor: PerformanceMonitor whose scopes time each part
+                of the step (a disabled monitor is used if None)
+        """
+        self.progression = progression
+        self.game_state = game_state
+        self.audio_manager = audio_manager
+        self.particle_mgr = particle_mgr
+        self.screen_shake = screen_shake
+        self.enable_sound = enable_sound
+        self.show_enemies = show_enemies
+        self.show_platforms = show_platforms
+        self.show_hazards = show_hazards
+        self.invincible = invincible
+        self.seed = seed
+        self.performance_monitor = performance_monitor or PerformanceMonitor()
+
+        # Enemies roll their AI at construction, so seed before the level loads
+        if seed is not None:
+            random.seed(seed)
+
+        # --- BUILD LEVEL USING LEVEL MANAGER ---
+        (self.bg_color, platforms, self.hazards, self.level_width, self.player, self.enemies,
+         self.projectiles, self.coins, self.world_name, self.goal_npc, self.background_layers,
+         self.moving_platforms, self.disappearing_platforms, self.appearing_platforms) = \
+            LevelManager.load_level(progression.current_level, progression)
+
+        # Save the original static platforms (dynamic platforms are tracked by the collision world)
+        self.static_platforms = platforms.copy()
+
+        # Collision world: indexed static platforms plus dynamic platforms toggled in place
+        self.collision_world = collision.CollisionWorld(self.static_platforms)
+        self.collision_world.add_bodies(self.moving_platforms)
+        self.collision_world.add_bodies(self.disappearing_platforms)
+        self.collision_world.add_bodies(self.appearing_platforms)
+
+        # Vectorized enemy landing/edge checks (falls back to the scalar loops without numpy)
+        self.enemy_batch = None
+        if C.BATCH_ENEMY_COLLISION and not C.SWEPT_COLLISION:
+            self.enemy_batch = create_enemy_batch_collider(self.collision_world, self.hazards)
+
+        # --- GAME STATS ---
+        self.coins_collected = 0
+        self.level_time = 0  # Time in frames (divide by 60 for seconds)
+        self.camera_x = 0
+
+        # --- ROLL SOUND TRACKING ---
+        self.roll_sound_channel = None  # Track if roll sound is playing
+
+        # --- CHECKPOINT SETUP ---
+        self.checkpoints = []
+        self.furthest_checkpoint_index = -1
+        self.last_checkpoint_position = (100, 300)  # Default spawn position
+        self.enemies_dead_at_checkpoint = set()  # Track which enemies were dead when checkpoint was reached
+
+        # Save initial enemy data for respawning at checkpoints
+        self.initial_enemy_data = []
+        for enemy in self.enemies:
+            self.initial_enemy_data.append({
+                'enemy': enemy,
+                'x': enemy.rect.x,
+                'y': enemy.rect.y,
+                'health': enemy.health,
+                'max_health': enemy.max_health
+            })
+
+        if progression.checkpoints_enabled and progression.current_level in LevelManager.CHECKPOINTS:
+            ground_y = LevelManager.GROUND_Y.get(progression.current_level, 400)
+            for checkpoint_x in LevelManager.CHECKPOINTS[progression.current_level]:
+                # Place flag on the ground (pole bottom at ground, flag above)
+                checkpoint_y = ground_y - 40  # Flag pole is 40px tall
+                self.checkpoints.append(Checkpoint(checkpoint_x, checkpoint_y))
+
+    @property
+    def has_checkpoint(self):
+        """Whether the player can respawn at a reached checkpoint"""
+        return self.progression.checkpoints_enabled and self.furthest_checkpoint_index >= 0
+
+    def _play_sound(self, sound_name):
+        """Play a sound effect if sound effects are enabled"""
+        if self.enable_sound:
+            self.audio_manager.play_sound(sound_name)
+
+    def _kill_player(self):
+        """Instant death (hazard or pit)"""
+        player = self.player
+        player.health = 0
+        player.die()
+        self.game_state.trigger_death()
+        self.audio_manager.stop_music()  # Stop music
+        self.audio_manager.play_sound('death')  # Play death sound
+
+    def _damage_player(self, damage, knockback_direction):
+        """Damage the player with hit particles, screen shake and the bump sound"""
+        player = self.player
+        player.take_damage(damage, knockback_direction)
+
+        # Visual feedback for taking damage
+        self.particle_mgr.spawn_hit_effect(
+            player.rect.centerx,
+            player.rect.centery,
+            knockback_direction
+        )
+        apply_preset(self.screen_shake, 'take_damage')
+        self._play_sound('bump')
+
+    def _enemy_hit_feedback(self, enemy, y):
+        """Particles and screen shake for a successful hit on an enemy"""
+        self.particle_mgr.spawn_burst(
+            enemy.rect.centerx,
+            y,
+            count=10,
+            particle_type='hit'
+        )
+        apply_preset(self.screen_shake, 'stomp_enemy')
+
+        # Check if enemy is defeated
+        if enemy.health <= 0:
+            self.particle_mgr.spawn_enemy_defeat(
+                enemy.rect.x,
+                enemy.rect.y,
+                enemy.rect.width,
+                enemy.rect.height
+            )
+            apply_preset(self.screen_shake, 'enemy_defeat')
+
+    def update(self, keys, actions=()):
+        """
+        Run one simulation step in whatever state the game is in
+
+        Applies queued actions, handles death (and the death animation), and
+        runs step() while playing. Does nothing while paused or in the
+        level-complete cutscene, so callers only need to call it when
+        game_state.is_playing or game_state.game_over.
+
+        Args:
+            keys: Held-key state indexable by pygame key code
+            actions: ACTION_* values to apply before the step
+
+        Returns:
+            list: Events that happened this step (EVENT_*)
+        """
+        events = []
+        player = self.player
+        game_state = self.game_state
+
+        for action in actions:
+            if action == ACTION_JUMP and game_state.is_playing:
+                player.jump(
+                    self.audio_manager.get_sound('jump'),
+                    self.audio_manager.get_sound('double_jump')
+                )
+            elif action == ACTION_SPIN and game_state.is_playing:
+                player.spin_attack(self.audio_manager.get_sound('spin_attack'))
+            elif action == ACTION_RESPAWN and game_state.game_over:
+                if self.respawn_at_checkpoint():
+                    events.append(EVENT_RESPAWNED)
+
+        # Check if player is dead
+        if player.health <= 0 and not game_state.game_over:
+            game_state.trigger_death()
+            self.audio_manager.stop_music()  # Stop music on death
+            self.audio_manager.play_sound('death')  # Play death sound effect
+            events.append(EVENT_PLAYER_DIED)
+
+        # Handle death animation delay
+        game_state.update_death_animation()
+
+        if game_state.is_playing:
+            events.extend(self.step(keys))
+        elif game_state.game_over:
+            # Still update player animation even when dead to show death animation
+            # But don't pass real keys - pass empty dict to prevent movement
+            player.update({})
+
+        return events
+
+    def state_hash(self):
+        """
+        Checksum of the gameplay state, for checking that two runs match exactly
+
+        Covers the level timer, coins, camera, and the exact positions and
+        velocities of the player, enemies and projectiles.
+
+        Returns:
+            int: CRC-32 of the packed state
+        """
+        player = self.player
+        data = [struct.pack('<IIdiidd', self.level_time, self.coins_collected, self.camera_x,
+                            player.rect.x, player.rect.y, player.vel_y, player.health)]
+        for enemy in self.enemies:
+            data.append(struct.pack('<iid?', enemy.rect.x, enemy.rect.y,
+                                    getattr(enemy, 'vel_y', 0), getattr(enemy, 'is_dead', False)))
+        for projectile in self.projectiles:
+            data.append(struct.pack('<ii', projectile.rect.x, projectile.rect.y))
+        return zlib.crc32(b''.join(data))
+
+    def step(self, keys):
+        """
+        Advance gameplay by one simulation step (call only while the game is playing)
+
+        Args:
+            keys: Held-key state indexable by pygame key code
+                (pygame.key.get_pressed() or a scripted equivalent)
+
+        Returns:
+            list: Events that happened this step (EVENT_PLAYER_DIED, EVENT_LEVEL_COMPLETE)
+        """
+        events = []
+        player = self.player
+        projectiles = self.projectiles
+        hazards = self.hazards
+        collision_world = self.collision_world
+        game_state = self.game_state
+        audio_manager = self.audio_manager
+        monitor = self.performance_monitor
+
+        # Increment level timer
+        self.level_time += 1
+
+        # Remember where the player started this frame (for swept collision)
+        if C.SWEPT_COLLISION:
+            player.update_hitbox_position()
+        player_midbottom_before_update = player.hitbox.midbottom
+
+        with monitor.scope("player.update"):
+            player.update(keys)
+
+        # --- ROLL SOUND HANDLING ---
+        if player.is_rolling:
+            # Start roll sound if not already playing
+            if self.roll_sound_channel is None or not self.roll_sound_channel.get_busy():
+                if self.enable_sound:
+                    self.roll_sound_channel = audio_manager.play_sound('roll', loops=-1)  # Loop infinitely
+        else:
+            # Stop roll sound when not rolling
+            if self.roll_sound_channel is not None and self.roll_sound_channel.get_busy():
+                if self.enable_sound:
+                    audio_manager.stop_sound('roll')
+                self.roll_sound_channel = None
+
+        # --- UPDATE PARTICLE SYSTEM ---
+        with monitor.scope("particles.update"):
+            self.particle_mgr.update()
+
+        # --- UPDATE SCREEN SHAKE ---
+        self.screen_shake.update()
+
+        # --- CHECK CHECKPOINTS ---
+        if self.progression.checkpoints_enabled:
+            for i, checkpoint in enumerate(self.checkpoints):
+                if checkpoint.check_player_reached(player):
+                    self.furthest_checkpoint_index = i
+                    # Save the player's current Y position when they reach the checkpoint
+                    # This ensures they respawn at the same height they were at (on platform or ground)
+                    self.last_checkpoint_position = (checkpoint.x, player.rect.y)
+                    # Record which enemies are currently dead (so we don't respawn them)
+                    self.enemies_dead_at_checkpoint.clear()
+                    for enemy_data in self.initial_enemy_data:
+                        if getattr(enemy_data['enemy'], 'is_dead', False):
+                            self.enemies_dead_at_checkpoint.add(id(enemy_data['enemy']))
+
+        # --- LEFT BOUNDARY WALL (prevent player from going off-screen left) ---
+        if player.rect.left < 0:
+            player.rect.left = 0
+            player.update_hitbox_position()
+
+        # --- CHECK LEVEL GOAL NPC ---
+        goal_npc = self.goal_npc
+        if goal_npc and not game_state.level_complete and player.hitbox.colliderect(goal_npc.trigger_zone):
+            # Check if player has collected enough coins for their difficulty level
+            coins_required = self.progression.get_coin_requirement(self.progression.current_level)
+            if self.coins_collected >= coins_required:
+                game_state.trigger_level_complete()
+                audio_manager.stop_music()  # Stop music on level complete
+                audio_manager.play_sound('stage_clear')  # Play victory sound
+                events.append(EVENT_LEVEL_COMPLETE)
+            # If not enough coins, nothing happens - player just stands there
+
+        # --- CHECK HAZARDS FIRST (before platform collision adjusts position) ---
+        if self.show_hazards:  # Only check hazards if they're enabled
+            for hazard in hazards:
+                if player.hitbox.colliderect(hazard):
+                    if not game_state.game_over and not self.invincible:  # Only trigger once (unless invincible)
+                        self._kill_player()
+                        events.append(EVENT_PLAYER_DIED)
+                    break
+
+        # --- CHECK FOR FALLING OFF THE MAP (pit death) ---
+        if player.rect.y > 550:  # Player has fallen below the screen (screen height = 600)
+            if not game_state.game_over and not self.invincible:
+                self._kill_player()
+                events.append(EVENT_PLAYER_DIED)
+
+        # --- PLATFORM COLLISION ---
+        player.on_ground = False  # Reset each frame
+
+        # Save vel_y before platform collision (for stomp detection later)
+        player_vel_y_before_platform_collision = player.vel_y
+
+        if self.show_platforms:  # Only collide with platforms if they're enabled
+            with monitor.scope("player.collision"):
+                if C.SWEPT_COLLISION:
+                    # Search the whole path this frame and stop at the first contact
+                    sweep_area = collision.swept_bounds(player.hitbox, player_midbottom_before_update)
+                    nearby_platforms = collision_world.query(sweep_area, collision.BROADPHASE_MARGIN)
+                    collision.resolve_swept_motion(player, player_midbottom_before_update, nearby_platforms)
+                else:
+                    nearby_platforms = collision_world.query(player.hitbox, collision.BROADPHASE_MARGIN)
+                player.on_ground = collision.check_platform_collision_player(player, nearby_platforms)
+
+        if self.show_enemies:
+            with monitor.scope("enemies"):
+                self._update_enemies()
+
+        # Update projectiles (snowballs, iceballs, fireballs, spikes)
+        with monitor.scope("projectiles.update"):
+            projectiles.update()
+
+            # Check for newly spawned projectiles that need sound (only if player is nearby)
+            if self.enable_sound and audio_manager.get_sound('enemy_projectile'):
+                for projectile in projectiles:
+                    if hasattr(projectile, 'spawn_sound') and projectile.spawn_sound:
+                        # Calculate distance from player to projectile
+                        distance = abs(player.hitbox.centerx - projectile.rect.centerx)
+
+                        if distance <= PROJECTILE_SOUND_RANGE:
+                            # Player is close enough to hear it (quieter further away)
+                            volume_multiplier = 1.0 - (distance / PROJECTILE_SOUND_RANGE) * 0.6
+                            audio_manager.set_sound_volume('enemy_projectile', 0.2 * volume_multiplier)
+                            audio_manager.play_sound('enemy_projectile')
+
+                        projectile.spawn_sound = False  # Only check once
+
+        # Update coins
+        with monitor.scope("coins.update"):
+            self.coins.update()
+
+        # Update goal NPC (if exists)
+        if goal_npc:
+            goal_npc.update()
+
+        with monitor.scope("platforms.update"):
+            # Update moving platforms
+            for moving_platform in self.moving_platforms:
+                moving_platform.update()
+
+            # Update disappearing platforms
+            for disappearing_platform in self.disappearing_platforms:
+                # Check if player is standing on this platform
+                on_platform = (not disappearing_platform.disappeared and
+                               player.hitbox.bottom <= disappearing_platform.rect.top + 10 and
+                               player.hitbox.bottom >= disappearing_platform.rect.top - 5 and
+                               player.hitbox.right > disappearing_platform.rect.left and
+                               player.hitbox.left < disappearing_platform.rect.right)
+                disappearing_platform.update(on_platform)
+
+            # Update appearing platforms
+            for appearing_platform in self.appearing_platforms:
+                appearing_platform.update()
+
+            # Toggle/re-bucket dynamic platforms (disappeared ones and non-solid appearing ones stop colliding)
+            collision_world.sync()
+
+        # --- COLLISION DETECTION ---
+        if self.show_enemies:  # Only check enemy collisions if they're enabled
+            with monitor.scope("enemies"):
+                with monitor.scope("combat"):
+                    self._check_enemy_combat(player_vel_y_before_platform_collision)
+                    self._check_projectile_hits()
+
+        # --- COIN COLLECTION ---
+        with monitor.scope("coins.collect"):
+            for coin in self.coins:
+                if player.hitbox.colliderect(coin.hitbox):
+                    coin.collect()
+                    self.coins_collected += 1
+
+                    # Visual feedback: sparkle ring
+                    self.particle_mgr.spawn_coin_sparkles(coin.rect.centerx, coin.rect.centery)
+                    self._play_sound('coin')
+
+        # --- CAMERA FOLLOW ---
+        camera_x = self.camera_x
+        if player.rect.centerx - camera_x > S.WINDOW_WIDTH * 0.6:
+            camera_x = player.rect.centerx - S.WINDOW_WIDTH * 0.6
+        elif player.rect.centerx - camera_x < S.WINDOW_WIDTH * 0.4:
+            camera_x = player.rect.centerx - S.WINDOW_WIDTH * 0.4
+        self.camera_x = max(0, min(camera_x, self.level_width - S.WINDOW_WIDTH))
+
+        return events
+
+    def _update_enemies(self):
+        """Enemy edge detection, AI update, gravity and platform landing"""
+        player = self.player
+        enemies = self.enemies
+        collision_world = self.collision_world
+        enemy_batch = self.enemy_batch
+        monitor = self.performance_monitor
+
+        with monitor.scope("collision"):
+            # --- PRE-UPDATE ENEMY EDGE DETECTION ---
+            # ONLY stop enemies at GROUND-LEVEL edges (holes in the ground)
+            edge_hazards = self.hazards if self.show_hazards else ()
+
+            if enemy_batch is not None:
+                enemy_batch.check_ground_edges(enemies, edge_hazards)
+            else:
+                for enemy in enemies:
+                    # Skip if enemy is dead or doesn't have direction
+                    if getattr(enemy, 'is_dead', False) or not hasattr(enemy, 'direction'):
+                        continue
+
+                    # Enemies pass through hazards, only collide with platforms
+                    all_walkable = collision_world.query(enemy.hitbox, collision.BROADPHASE_MARGIN)
+                    collision.check_enemy_ground_edge(enemy, all_walkable, edge_hazards)
+
+        with monitor.scope("ai"):
+            # Update enemies (they add projectiles to the group)
+            for enemy in enemies:
+                enemy.update(player=player, projectile_group=self.projectiles)
+
+        with monitor.scope("collision"):
+            # --- ENEMY PLATFORM COLLISION ---
+            falling_enemies = []
+
+            for enemy in enemies:
+                # Skip if enemy is dead
+                if getattr(enemy, 'is_dead', False):
+                    continue
+
+                # Apply gravity if enemy has it
+                if C.SWEPT_COLLISION:
+                    enemy.update_hitbox_position()
+                enemy_midbottom_before_gravity = enemy.hitbox.midbottom
+                if hasattr(enemy, 'vel_y'):
+                    enemy.vel_y += enemy.gravity
+                    enemy.rect.y += enemy.vel_y
+                else:
+                    # Add gravity properties if they don't exist
+                    enemy.vel_y = 0
+                    enemy.gravity = 0.6
+
+                # Kill enemies that fall below the screen (fell in a pit)
+                if enemy.rect.top > S.WINDOW_HEIGHT + 100:
+                    enemy.is_dead = True
+                    # Enemy death sounds are handled by the enemy objects themselves
+                    continue  # Skip rest of processing for this enemy
+
+                # Batched path resolves landing + patrol edges for all enemies at once below
+                if enemy_batch is not None:
+                    falling_enemies.append(enemy)
+                    continue
+
+                # Check collision with nearby platforms only (enemies pass through hazards)
+                if C.SWEPT_COLLISION:
+                    # Move the hitbox with gravity, then stop at the first platform top on the way down
+                    enemy.update_hitbox_position()
+                    sweep_area = collision.swept_bounds(enemy.hitbox, enemy_midbottom_before_gravity)
+                    all_walkable = collision_world.query(sweep_area, collision.BROADPHASE_MARGIN)
+                    collision.resolve_swept_motion(enemy, enemy_midbottom_before_gravity, all_walkable, landing_only=True)
+                    enemy_on_ground = collision.check_platform_collision_enemy(
+                        enemy, all_walkable, tolerance=C.PLATFORM_COLLISION_TOLERANCE)
+                else:
+                    all_walkable = collision_world.query(enemy.hitbox, collision.BROADPHASE_MARGIN)
+                    enemy_on_ground = collision.check_platform_collision_enemy(
+                        enemy, all_walkable, tolerance=C.ENEMY_LANDING_TOLERANCE)
+
+                # Check if enemy is at patrol edge - make them turn around
+                if enemy_on_ground:
+                    collision.check_enemy_patrol_edge(enemy, all_walkable)
+
+            if falling_enemies:
+                enemy_batch.land_and_check_patrol_edges(falling_enemies, tolerance=C.ENEMY_LANDING_TOLERANCE)
+
+    def _check_enemy_combat(self, player_vel_y_before_platform_collision):
+        """
+        Resolve player/enemy contact: spin, roll and stomp attacks, and enemy hits
+
+        Args:
+            player_vel_y_before_platform_collision: Player vel_y before landing
+                (platform collision zeroes it, stomps need the falling speed)
+        """
+        player = self.player
+        invincible = self.invincible
+
+        for enemy in self.enemies:
+            # Skip dead enemies completely
+            if getattr(enemy, 'is_dead', False):
+                continue
+
+            # Get enemy's power vulnerability settings (default to all False if not present)
+            vulnerable_to = getattr(enemy, 'vulnerable_to', {
+                'stomp': False,
+                'spin_attack': False,
+                'roll': False
+            })
+            knockback_direction = 1 if player.rect.centerx < enemy.rect.centerx else -1
+
+            # Check body hitbox collision
+            if player.hitbox.colliderect(enemy.hitbox):
+                # --- SPIN ATTACK DETECTION (check FIRST for priority) ---
+                if player.is_spinning:
+                    if vulnerable_to.get('spin_attack', False):
+                        # Enemy is vulnerable to spin attack - deal damage to enemy
+                        if enemy.take_damage(1):
+                            # Slight bounce for player on successful hit
+                            player.vel_y = -8
+                            self._enemy_hit_feedback(enemy, enemy.rect.centery)
+                    else:
+                        # Enemy is NOT vulnerable to spin attack - player takes damage
+                        if not player.invincible and not invincible:
+                            player.take_damage(1, knockback_direction)
+                            self._play_sound('bump')
+
+                # --- ROLL DETECTION ---
+                elif player.is_rolling:
+                    if vulnerable_to.get('roll', False):
+                        # Enemy is vulnerable to roll - deal damage to enemy
+                        if enemy.take_damage(1):
+                            # Apply knockback velocity to enemy (push away from player)
+                            enemy.knockback_velocity = knockback_direction * 20
+                            self._enemy_hit_feedback(enemy, enemy.rect.centery)
+
+                            # Stop player's roll immediately and prevent re-rolling
+                            player.is_rolling = False
+                            player.roll_timer = 0.0
+                            player.roll_speed_current = player.roll_speed_initial
+                            player.roll_cooldown = 6  # 0.1 seconds at 60 fps
+
+                            # Reset to standing animation
+                            player.current_frame = 0
+                            player.frame_counter = 0.0
+
+                            # Apply dramatic knockback - push player back and up
+                            bounce_distance = 60
+                            player.rect.x += -knockback_direction * bounce_distance
+
+                            # Give player upward velocity for a small bounce
+                            player.vel_y = -6
+                            player.on_ground = False  # Make player airborne
+
+                            player.update_hitbox_position()
+
+                            # Grant brief invincibility after successful roll hit (0.4 seconds)
+                            player.invincible = True
+                            player.invincible_timer = 24  # 0.4 seconds at 60 fps
+
+                            self._play_sound('land_enemy')
+
+                            # Break out of enemy loop to prevent multiple hits in one frame
+                            break
+                    else:
+                        # Enemy is NOT vulnerable to roll - player takes damage
+                        if not player.invincible and not invincible:
+                            player.take_damage(1, knockback_direction)
+                            self._play_sound('bump')
+
+                # --- STOMP DETECTION ---
+                elif player_vel_y_before_platform_collision > 0 and player.hitbox.centery < enemy.hitbox.centery:
+                    # Player is coming from above (falling onto enemy) - use center comparison for more reliable detection
+                    # This prevents damage when landing on enemies under low platforms
+                    if vulnerable_to.get('stomp', False):
+                        # Enemy is vulnerable to stomp - deal damage to enemy
+                        enemy.take_damage(1)
+                        player.vel_y = -15  # Always bounce player up on stomp
+                        self._enemy_hit_feedback(enemy, enemy.rect.top)
+
+                        # Play appropriate stomp sound
+                        if 'Slime' in enemy.__class__.__name__:
+                            self._play_sound('land_slime')
+                        else:
+                            self._play_sound('land_enemy')
+                    else:
+                        # Enemy is NOT vulnerable to stomp - player takes damage
+                        if not player.invincible and not invincible:
+                            self._damage_player(1, knockback_direction)
+
+                # --- NORMAL COLLISION (no special power active) ---
+                else:
+                    # Regular side collision - player takes damage and knockback
+                    if not player.invincible and not player.is_spinning and not invincible:
+                        self._damage_player(1, knockback_direction)
+
+            # Check sword hitbox collision (for Swordsman enemy)
+            if hasattr(enemy, 'sword_hitbox_active') and enemy.sword_hitbox_active:
+                if player.hitbox.colliderect(enemy.sword_hitbox):
+                    # Sword always damages player UNLESS player is spin attacking
+                    if not player.invincible and not player.is_spinning and not invincible:
+                        self._damage_player(1, knockback_direction)
+
+            # Check punch hitbox collision (for Snowy enemy)
+            if hasattr(enemy, 'punch_hitbox_active') and enemy.punch_hitbox_active:
+                if player.hitbox.colliderect(enemy.punch_hitbox):
+                    # Punch always damages player UNLESS player is spin attacking
+                    if not player.invincible and not player.is_spinning and not invincible:
+                        damage = getattr(enemy, 'punch_damage', 1)
+                        self._damage_player(damage, knockback_direction)
+
+    def _check_projectile_hits(self):
+        """Damage the player on projectile contact and destroy the projectile"""
+        player = self.player
+
+        for projectile in self.projectiles:
+            if player.hitbox.colliderect(projectile.rect):
+                # Projectiles don't damage player if they're spin attacking
+                if not player.is_spinning and not self.invincible:
+                    # Knockback away from projectile
+                    knockback_direction = 1 if player.rect.centerx < projectile.rect.centerx else -1
+                    self._damage_player(1, knockback_direction)
+
+                # Always destroy the projectile on contact (even during spin)
+                self.particle_mgr.spawn_burst(
+                    projectile.rect.centerx,
+                    projectile.rect.centery,
+                    count=6,
+                    particle_type='snow'
+                )
+                projectile.kill()
+
+    def respawn_at_checkpoint(self):
+        """
+        Respawn the player at the furthest checkpoint reached
+
+        Enemies placed after the checkpoint come back to life unless they were
+        already dead when it was reached. level_time keeps running.
+
+        Returns:
+            bool: True if the player was respawned, False if no checkpoint was reached
+        """
+        if self.furthest_checkpoint_index < 0:
+            return False
+
+        checkpoint_x = self.checkpoints[self.furthest_checkpoint_index].x
+
+        # Respawn enemies that are after the checkpoint
+        for enemy_data in self.initial_enemy_data:
+            enemy = enemy_data['enemy']
+            # If enemy's initial position is after the checkpoint, respawn it
+            # BUT skip enemies that were already dead when checkpoint was reached
+            if enemy_data['x'] > checkpoint_x and id(enemy) not in self.enemies_dead_at_checkpoint:
+                enemy.rect.x = enemy_data['x']
+                enemy.rect.y = enemy_data['y']
+                enemy.health = enemy_data['max_health']
+                enemy.is_dead = False
+                # Reset enemy state if it has these attributes
+                if hasattr(enemy, 'death_animation_complete'):
+                    enemy.death_animation_complete = False
+                if hasattr(enemy, 'death_complete'):
+                    enemy.death_complete = False
+                if hasattr(enemy, 'velocity_x'):
+                    enemy.velocity_x = 0
+                if hasattr(enemy, 'velocity_y'):
+                    enemy.velocity_y = 0
+                # Reset animation frame to prevent index errors
+                if hasattr(enemy, 'current_frame'):
+                    enemy.current_frame = 0
+                if hasattr(enemy, 'animation_counter'):
+                    enemy.animation_counter = 0
+                if hasattr(enemy, 'hurt_flash_timer'):
+                    enemy.hurt_flash_timer = 0
+                # Re-add enemy to sprite group if it was removed (killed)
+                if enemy not in self.enemies:
+                    self.enemies.add(enemy)
+
+        # Clear projectiles
+        self.projectiles.empty()
+
+        # Respawn player at checkpoint
+        player = self.player
+        player.rect.x, player.rect.y = self.last_checkpoint_position
+        player.health = player.max_health
+        player.is_dead = False
+        player.invincible = True
+        player.invincible_timer = player.invincible_duration
+        player.update_hitbox_position()
+
+        game_state = self.game_state
+        game_state.game_over = False
+        game_state.show_death_screen = False
+        game_state.death_animation_timer = 0
+        game_state.death_fade_alpha = 0
+        return True
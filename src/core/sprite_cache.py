@@ -0,0 +1,147 @@
+"""
+Sprite Sheet Cache
+Process-wide loading and caching of sprite sheet frames shared by all entities
+"""
+
+import time
+
+import pygame
+from src.core.game_logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SpriteSheetCache:
+    """
+    Loads, slices and scales each horizontal sprite sheet once per process
+
+    Every coin, enemy and the player get the same frame tuple for the same
+    (path, frame_count, target size), so level load time and memory no
+    longer grow with entity count. Frames are shared: callers must treat them
+    as read-only (use get_mirrored or copy them instead of drawing on them).
+
+    Every frame is mirrored once at load, so facing left/right is a lookup
+    instead of a pygame.transform.flip (and a new Surface) per entity per frame.
+    """
+
+    # Cache for sliced frames (key: (path, frame_count, target_size), value: tuple of Surfaces)
+    _frame_cache = {}
+    _bytes = 0
+    _hits = 0
+    _misses = 0
+
+    # Horizontally flipped copy of each frame (key: frame Surface, value: mirrored Surface)
+    _mirrors = {}
+    _mirror_bytes = 0
+    _mirror_seconds = 0.0
+
+    @classmethod
+    def get_frames(cls, path, frame_count, target_size):
+        """
+        Get the frames of a horizontal sprite sheet, loading and caching them if necessary
+
+        Args:
+            path: Path to the sprite sheet image
+            frame_count: Number of frames laid out left to right
+            target_size: (width, height) to scale every frame to, or an int
+                height to scale to while keeping each frame's aspect ratio
+
+        Returns:
+            tuple: Scaled frames (shared, do not modify)
+
+        Raises:
+            FileNotFoundError, pygame.error: If the sheet cannot be loaded
+                (failures are not cached, callers fall back as before)
+        """
+        cache_key = (path, frame_count, target_size)
+        frames = cls._frame_cache.get(cache_key)
+        if frames is not None:
+            cls._hits += 1
+            return frames
+
+        cls._misses += 1
+        sheet = pygame.image.load(path).convert_alpha()
+        sheet_width, sheet_height = sheet.get_size()
+        frame_width = sheet_width // frame_count
+
+        if isinstance(target_size, int):
+            # Scale keeping aspect ratio
+            aspect = frame_width / sheet_height
+            scaled_size = (int(target_size * aspect), target_size)
+        else:
+            scaled_size = tuple(target_size)
+
+        scaled_frames = []
+        for i in range(frame_count):
+            # Extract frame from sheet
+            frame = pygame.Surface((frame_width, sheet_height), pygame.SRCALPHA)
+            frame.blit(sheet, (0, 0), (i * frame_width, 0, frame_width, sheet_height))
+            scaled_frames.append(pygame.transform.scale(frame, scaled_size))
+
+        frames = tuple(scaled_frames)
+        cls._frame_cache[cache_key] = frames
+        cls._bytes += sum(f.get_bytesize() * f.get_width() * f.get_height() for f in frames)
+        cls._add_mirrors(frames)
+        logger.debug(f"Loaded sprite sheet: {path} ({frame_count} frames at {scaled_size})")
+        return frames
+
+    @classmethod
+    def _add_mirrors(cls, frames):
+        """Build the mirrored copy of each frame"""
+        start = time.perf_counter()
+        for frame in frames:
+            mirrored = pygame.transform.flip(frame, True, False)
+            cls._mirrors[frame] = mirrored
+            cls._mirror_bytes += mirrored.get_bytesize() * mirrored.get_width() * mirrored.get_height()
+        cls._mirror_seconds += time.perf_counter() - start
+
+    @classmethod
+    def get_mirrored(cls, frame):
+        """
+        Get the horizontally flipped version of a frame
+
+        Frames from get_frames are mirrored when their sheet is loaded; any
+        other surface (e.g. a fallback sprite) is mirrored on first use.
+
+        Args:
+            frame: Frame Surface
+
+        Returns:
+            pygame.Surface: Mirrored frame (shared, do not modify)
+        """
+        mirrored = cls._mirrors.get(frame)
+        if mirrored is None:
+            cls._add_mirrors((frame,))
+            mirrored = cls._mirrors[frame]
+        return mirrored
+
+    @classmethod
+    def clear_cache(cls):
+        """Clear the sprite sheet cache (useful for testing or memory management)"""
+        cls._frame_cache.clear()
+        cls._bytes = 0
+        cls._mirrors.clear()
+        cls._mirror_bytes = 0
+        cls._mirror_seconds = 0.0
+        cls._hits = 0
+        cls._misses = 0
+        logger.info("Sprite sheet cache cleared")
+
+    @classmethod
+    def get_cache_info(cls):
+        """
+        Get information about cached sprite sheets
+
+        Returns:
+            dict: Cache statistics
+        """
+        return {
+            'size': len(cls._frame_cache),
+            'sheets': list(cls._frame_cache.keys()),
+            'bytes': cls._bytes,
+            'hits': cls._hits,
+            'misses': cls._misses,
+            'mirrored_frames': len(cls._mirrors),
+            'mirrored_bytes': cls._mirror_bytes,
+            'mirror_build_ms': cls._mirror_seconds * 1000,
+        }
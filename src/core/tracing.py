@@ -0,0 +1,231 @@
+"""
+Tracing
+Streams Chrome trace-event JSON (open in Perfetto or chrome://tracing) from a background thread
+"""
+
+import atexit
+import contextlib
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+from src.core.game_logging import get_logger
+
+logger = get_logger(__name__)
+
+PROCESS_NAME = "Siena's Snowy Adventure"
+
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class _TraceSpan:
+    """Records a complete event covering the with-block"""
+
+    __slots__ = ('tracer', 'name', 'cat', 'args', 'start')
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.complete(self.name, self.start, time.perf_counter(), self.cat, self.args)
+        return False
+
+
+class TraceWriter:
+    """
+    Writes trace events to a file without blocking the game loop
+
+    Recording an event only appends a tuple to a bounded in-memory buffer;
+    a daemon thread formats and writes the buffered events every
+    flush_interval seconds. If the writer falls behind and the buffer fills
+    up, new events are dropped (and counted) rather than stalling the frame.
+    The file is valid JSON once closed; a file cut short by a crash still
+    opens in Perfetto and chrome://tracing.
+    """
+
+    def __init__(self, path, capacity=100000, flush_interval=0.5):
+        """
+        Args:
+            path: Trace file to create (parent directories are created)
+            capacity: Most events buffered between writes
+            flush_interval: Seconds between background writes
+        """
+        self.path = Path(path)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.written = 0
+
+        self._events = deque()
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._main_tid = threading.get_ident()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w')
+        self._file.write('[\n')
+        self._write_event({'name': 'process_name', 'ph': 'M', 'pid': self._pid,
+                           'args': {'name': PROCESS_NAME}})
+        self._write_event({'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': self._main_tid,
+                           'args': {'name': 'main loop'}})
+
+        self._file_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="trace-writer", daemon=True)
+        self._thread.start()
+        logger.info(f"Tracing to {self.path}")
+
+    def complete(self, name, start, end, cat='scope', args=None):
+        """
+        Record a section that ran from start to end
+
+        Args:
+            name: Event name
+            start, end: time.perf_counter() values
+            cat: Event category (filterable in the viewer)
+            args: Optional dict shown with the event
+        """
+        if len(self._events) >= self.capacity:
+            self.dropped += 1
+            return
+        self._events.append(('X', name, cat, start, end, threading.get_ident(), args))
+
+    def instant(self, name, cat='marker', args=None):
+        """
+        Record a point in time (drawn as a marker across the timeline)
+
+        Args:
+            name: Event name
+            cat: Event category
+            args: Optional dict shown with the event
+        """
+        if len(self._events) >= self.capacity:
+            self.dropped += 1
+            return
+        now = time.perf_counter()
+        self._events.append(('i', name, cat, now, now, threading.get_ident(), args))
+
+    def span(self, name, cat='marker', **args):
+        """
+        Time a with-block as one event
+
+        Args:
+            name: Event name
+            cat: Event category
+            **args: Values shown with the event
+
+        Returns:
+            Context manager that records the event on exit
+        """
+        return _TraceSpan(self, name, cat, args or None)
+
+    def _write_event(self, event):
+        """Append one formatted event to the file"""
+        if self.written:
+            self._file.write(',\n')
+        self._file.write(json.dumps(event, separators=(',', ':')))
+        self.written += 1
+
+    def _drain(self):
+        """Format and write everything buffered so far"""
+        events = self._events
+        with self._file_lock:
+            if self._file is None:
+                return
+            while events:
+                phase, name, cat, start, end, tid, args = events.popleft()
+                event = {
+                    'name': name, 'cat': cat, 'ph': phase, 'pid': self._pid, 'tid': tid,
+                    'ts': round((start - self._origin) * 1e6, 1),
+                }
+                if phase == 'X':
+                    event['dur'] = round((end - start) * 1e6, 1)
+                else:
+                    event['s'] = 'g'
+                if args:
+                    event['args'] = args
+                self._write_event(event)
+            self._file.flush()
+
+    def _run(self):
+        """Writer thread: drain the buffer until closed"""
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self._drain()
+            except (OSError, TypeError, ValueError) as e:
+                logger.error(f"Trace writer stopped: {e}")
+                return
+
+    def close(self):
+        """Write the remaining events and finish the file (safe to call twice)"""
+        if self._file is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._drain()
+        with self._file_lock:
+            if self.dropped:
+                self._write_event({'name': 'dropped_events', 'ph': 'M', 'pid': self._pid,
+                                   'args': {'count': self.dropped}})
+            self._file.write('\n]\n')
+            self._file.close()
+            self._file = None
+        logger.info(f"Saved trace: {self.path} ({self.written} events, {self.dropped} dropped)")
+
+
+_tracer = None
+
+
+def start_tracing(path, **kwargs):
+    """
+    Start the process-wide trace (does nothing if one is already running)
+
+    Args:
+        path: Trace file to write
+        **kwargs: TraceWriter options
+
+    Returns:
+        TraceWriter: The active tracer
+    """
+    global _tracer
+    if _tracer is None:
+        _tracer = TraceWriter(path, **kwargs)
+        atexit.register(stop_tracing)
+    return _tracer
+
+
+def get_tracer():
+    """Get the active TraceWriter, or None when not tracing"""
+    return _tracer
+
+
+def stop_tracing():
+    """Finish the process-wide trace, if any"""
+    global _tracer
+    if _tracer is not None:
+        _tracer.close()
+        _tracer = None
+
+
+def trace_span(name, cat='marker', **args):
+    """
+    Time a with-block in the active trace (a no-op when not tracing)
+
+    Usage:
+        with trace_span("level.load", level=3):
+            ...
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, cat, **args)
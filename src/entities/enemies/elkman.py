@@ -1,19 +1,17 @@
 import pygame
 import random
+from src.core.sprite_cache import SpriteSheetCache
 
 class Snowball(pygame.sprite.Sprite):
     """Projectile thrown by Elkman"""
+
+    # Circle drawn once if the sprite cannot be loaded (later throws reuse it instead of retrying)
+    _fallback_image = None
+
     def __init__(self, x, y, direction):
         super().__init__()
         
-        try:
-            # Load and scale snowball image
-            original = pygame.image.load("assets/images/2 Elkman/Snowball.png").convert_alpha()
-            self.image = pygame.transform.scale(original, (30, 30))
-        except:
-            # Fallback white circle
-            self.image = pygame.Surface((30, 30), pygame.SRCALPHA)
-            pygame.draw.circle(self.image, (255, 255, 255), (15, 15), 15)
+        self.image = self.load_image()
         
         self.rect = self.image.get_rect(center=(x, y))
         self.speed_x = 6  # Horizontal speed
@@ -34,6 +32,20 @@ class Snowball(pygame.sprite.Sprite):
         if self.rect.x < -100 or self.rect.x > 10000 or self.rect.y > 600:
             self.kill()
 
+    @classmethod
+    def load_image(cls):
+        """Get the snowball image (shared, do not modify)"""
+        if cls._fallback_image is not None:
+            return cls._fallback_image
+        try:
+            # Load and scale snowball image
+            return SpriteSheetCache.get_frames("assets/images/2 Elkman/Snowball.png", 1, (30, 30))[0]
+        except:
+            # Fallback white circle
+            cls._fallback_image = pygame.Surface((30, 30), pygame.SRCALPHA)
+            pygame.draw.circle(cls._fallback_image, (255, 255, 255), (15, 15), 15)
+            return cls._fallback_image
+
 
 class Elkman(pygame.sprite.Sprite):
     """Elk enemy - aggressive ranged attacker that stays on platform"""
@@ -145,18 +157,7 @@ class Elkman(pygame.sprite.Sprite):
         self.gravity = 0.6
         
     def load_sprite_sheet(self, path, frame_count, target_height=120):
-        sheet = pygame.image.load(path).convert_alpha()
-        sheet_width, sheet_height = sheet.get_size()
-        frame_width = sheet_width // frame_count
-        
-        frames = []
-        for i in range(frame_count):
-            frame = pygame.Surface((frame_width, sheet_height), pygame.SRCALPHA)
-            frame.blit(sheet, (0, 0), (i * frame_width, 0, frame_width, sheet_height))
-            aspect = frame_width / sheet_height
-            scaled = pygame.transform.scale(frame, (int(target_height * aspect), target_height))
-            frames.append(scaled)
-        return frames
+        return SpriteSheetCache.get_frames(path, frame_count, target_height)
     
     def create_fallback_sprite(self):
         surf = pygame.Surface((60, 80), pygame.SRCALPHA)
@@ -304,7 +305,7 @@ class Elkman(pygame.sprite.Sprite):
             old_centerx = self.rect.centerx
             
             base_image = self.hurt_frames[0] if self.hurt_flash_timer > 0 else self.attack_frames[self.current_frame]
-            self.image = pygame.transform.flip(base_image, True, False) if self.facing_right else base_image
+            self.image = SpriteSheetCache.get_mirrored(base_image) if self.facing_right else base_image
             
             self.rect = self.image.get_rect(centerx=old_centerx, bottom=old_bottom)
             self.update_hitbox_position()
@@ -333,7 +334,7 @@ class Elkman(pygame.sprite.Sprite):
         old_centerx = self.rect.centerx
         
         base_image = self.hurt_frames[0] if self.hurt_flash_timer > 0 else self.attack_frames[self.current_frame]
-        self.image = pygame.transform.flip(base_image, True, False) if self.facing_right else base_image
+        self.image = SpriteSheetCache.get_mirrored(base_image) if self.facing_right else base_image
         
         self.rect = self.image.get_rect(centerx=old_centerx, bottom=old_bottom)
         self.update_hitbox_position()
@@ -364,7 +365,7 @@ class Elkman(pygame.sprite.Sprite):
         old_centerx = self.rect.centerx
         
         base_image = self.hurt_frames[0] if self.hurt_flash_timer > 0 else self.walk_frames[self.current_frame]
-        self.image = pygame.transform.flip(base_image, True, False) if self.facing_right else base_image
+        self.image = SpriteSheetCache.get_mirrored(base_image) if self.facing_right else base_image
         
         self.rect = self.image.get_rect(centerx=old_centerx, bottom=old_bottom)
         self.update_hitbox_position()
@@ -417,7 +418,7 @@ class Elkman(pygame.sprite.Sprite):
 
         base_image = self.death_frames[self.current_frame]
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
 
@@ -1,5 +1,6 @@
 import pygame
 import random
+from src.core.sprite_cache import SpriteSheetCache
 
 class Fireball(pygame.sprite.Sprite):
     """Projectile shot by Frost Golem - bounces 3 times"""
@@ -220,20 +221,7 @@ class FrostGolem(pygame.sprite.Sprite):
         
     def load_sprite_sheet(self, path, frame_count, target_height=80):
         """Load and split a sprite sheet into frames"""
-        sheet = pygame.image.load(path).convert_alpha()
-        sheet_width, sheet_height = sheet.get_size()
-        frame_width = sheet_width // frame_count
-        
-        frames = []
-        for i in range(frame_count):
-            frame = pygame.Surface((frame_width, sheet_height), pygame.SRCALPHA)
-            frame.blit(sheet, (0, 0), (i * frame_width, 0, frame_width, sheet_height))
-            
-            # Scale keeping aspect ratio
-            aspect = frame_width / sheet_height
-            scaled = pygame.transform.scale(frame, (int(target_height * aspect), target_height))
-            frames.append(scaled)
-        return frames
+        return SpriteSheetCache.get_frames(path, frame_count, target_height)
     
     def create_fallback_sprite(self):
         """Fallback rectangle if sprites fail to load"""
@@ -549,7 +537,7 @@ class FrostGolem(pygame.sprite.Sprite):
             base_image = self.idle_anim_frames[self.current_frame]
         
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
         
@@ -574,7 +562,7 @@ class FrostGolem(pygame.sprite.Sprite):
                 base_image = self.attack_frames[self.current_frame]
             
             if self.facing_right:
-                self.image = pygame.transform.flip(base_image, True, False)
+                self.image = SpriteSheetCache.get_mirrored(base_image)
             else:
                 self.image = base_image
             
@@ -614,7 +602,7 @@ class FrostGolem(pygame.sprite.Sprite):
             base_image = self.attack_frames[self.current_frame]
         
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
         
@@ -658,7 +646,7 @@ class FrostGolem(pygame.sprite.Sprite):
             base_image = self.walk_frames[self.current_frame]
         
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
         
@@ -721,7 +709,7 @@ class FrostGolem(pygame.sprite.Sprite):
 
         base_image = self.death_frames[self.current_frame]
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
         
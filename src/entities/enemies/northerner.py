@@ -1,29 +1,20 @@
 import pygame
 import random
+from src.core.sprite_cache import SpriteSheetCache
 
 class Pilos(pygame.sprite.Sprite):
     """Spear projectile thrown by Northerner"""
+
+    # Spear drawn once if the sprite cannot be loaded (later throws reuse it instead of retrying)
+    _fallback_image = None
+
     def __init__(self, x, y, direction, speed_x=15, speed_y=-2):
         super().__init__()
         
-        # Load the pilos spear image
-        try:
-            self.image = pygame.image.load("assets/images/6 Northerner/pilos.png").convert_alpha()
-            # Scale it to a reasonable size (adjust as needed)
-            self.image = pygame.transform.scale(self.image, (40, 12))
-            
-            # Flip if going left
-            if direction == -1:
-                self.image = pygame.transform.flip(self.image, True, False)
-        except Exception as e:
-            print(f"Error loading pilos sprite: {e}")
-            # Fallback: create a simple spear shape
-            self.image = pygame.Surface((40, 12), pygame.SRCALPHA)
-            pygame.draw.polygon(self.image, (139, 69, 19), [(0, 6), (30, 0), (40, 6), (30, 12)])
-            pygame.draw.rect(self.image, (101, 67, 33), (0, 4, 30, 4))
-            
-            if direction == -1:
-                self.image = pygame.transform.flip(self.image, True, False)
+        # Shared spear image, mirrored once for throws to the left
+        self.image = self.load_image()
+        if direction == -1:
+            self.image = SpriteSheetCache.get_mirrored(self.image)
         
         self.rect = self.image.get_rect(center=(x, y))
         self.speed_x = speed_x  # Horizontal speed (can be customized)
@@ -44,6 +35,22 @@ class Pilos(pygame.sprite.Sprite):
         if self.rect.x < -100 or self.rect.x > 15000 or self.rect.y > 600:
             self.kill()
 
+    @classmethod
+    def load_image(cls):
+        """Get the spear image facing right (shared, do not modify)"""
+        if cls._fallback_image is not None:
+            return cls._fallback_image
+        try:
+            # Scale it to a reasonable size (adjust as needed)
+            return SpriteSheetCache.get_frames("assets/images/6 Northerner/pilos.png", 1, (40, 12))[0]
+        except Exception as e:
+            print(f"Error loading pilos sprite: {e}")
+            # Fallback: create a simple spear shape
+            cls._fallback_image = pygame.Surface((40, 12), pygame.SRCALPHA)
+            pygame.draw.polygon(cls._fallback_image, (139, 69, 19), [(0, 6), (30, 0), (40, 6), (30, 12)])
+            pygame.draw.rect(cls._fallback_image, (101, 67, 33), (0, 4, 30, 4))
+            return cls._fallback_image
+
 
 class Northerner(pygame.sprite.Sprite):
     """Northerner enemy - intelligent ranged warrior who throws spears"""
@@ -178,20 +185,7 @@ class Northerner(pygame.sprite.Sprite):
         
     def load_sprite_sheet(self, path, frame_count, target_height=130):
         """Load and split a sprite sheet into frames"""
-        sheet = pygame.image.load(path).convert_alpha()
-        sheet_width, sheet_height = sheet.get_size()
-        frame_width = sheet_width // frame_count
-        
-        frames = []
-        for i in range(frame_count):
-            frame = pygame.Surface((frame_width, sheet_height), pygame.SRCALPHA)
-            frame.blit(sheet, (0, 0), (i * frame_width, 0, frame_width, sheet_height))
-            
-            # Scale keeping aspect ratio
-            aspect = frame_width / sheet_height
-            scaled = pygame.transform.scale(frame, (int(target_height * aspect), target_height))
-            frames.append(scaled)
-        return frames
+        return SpriteSheetCache.get_frames(path, frame_count, target_height)
     
     def create_fallback_sprite(self):
         """Fallback rectangle if sprites fail to load"""
@@ -407,7 +401,7 @@ class Northerner(pygame.sprite.Sprite):
             base_image = self.idle_anim_frames[self.current_frame]
         
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
         
@@ -432,7 +426,7 @@ class Northerner(pygame.sprite.Sprite):
                 base_image = self.attack_frames[self.current_frame]
             
             if self.facing_right:
-                self.image = pygame.transform.flip(base_image, True, False)
+                self.image = SpriteSheetCache.get_mirrored(base_image)
             else:
                 self.image = base_image
             
@@ -472,7 +466,7 @@ class Northerner(pygame.sprite.Sprite):
             base_image = self.attack_frames[self.current_frame]
         
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
         
@@ -554,7 +548,7 @@ class Northerner(pygame.sprite.Sprite):
             base_image = self.walk_frames[self.current_frame]
         
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
         
@@ -612,7 +606,7 @@ class Northerner(pygame.sprite.Sprite):
 
         base_image = self.death_frames[self.current_frame]
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
 
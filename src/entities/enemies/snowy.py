@@ -1,6 +1,7 @@
 import pygame
 import random
 from src.core import constants as C
+from src.core.sprite_cache import SpriteSheetCache
 
 class Snowy(pygame.sprite.Sprite):
     """Snowman enemy - slow, powerful melee fighter that tracks and punches the player"""
@@ -136,20 +137,7 @@ class Snowy(pygame.sprite.Sprite):
         
     def load_sprite_sheet(self, path, frame_count, target_height=160):
         """Load and split a sprite sheet into frames"""
-        sheet = pygame.image.load(path).convert_alpha()
-        sheet_width, sheet_height = sheet.get_size()
-        frame_width = sheet_width // frame_count
-        
-        frames = []
-        for i in range(frame_count):
-            frame = pygame.Surface((frame_width, sheet_height), pygame.SRCALPHA)
-            frame.blit(sheet, (0, 0), (i * frame_width, 0, frame_width, sheet_height))
-            
-            # Scale keeping aspect ratio
-            aspect = frame_width / sheet_height
-            scaled = pygame.transform.scale(frame, (int(target_height * aspect), target_height))
-            frames.append(scaled)
-        return frames
+        return SpriteSheetCache.get_frames(path, frame_count, target_height)
     
     def create_fallback_sprite(self):
         """Fallback rectangle if sprites fail to load"""
@@ -342,7 +330,7 @@ class Snowy(pygame.sprite.Sprite):
             base_image = self.idle_anim_frames[self.current_frame]
         
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
         
@@ -367,7 +355,7 @@ class Snowy(pygame.sprite.Sprite):
                 base_image = self.attack_frames[self.current_frame]
             
             if self.facing_right:
-                self.image = pygame.transform.flip(base_image, True, False)
+                self.image = SpriteSheetCache.get_mirrored(base_image)
             else:
                 self.image = base_image
             
@@ -410,7 +398,7 @@ class Snowy(pygame.sprite.Sprite):
             base_image = self.attack_frames[self.current_frame]
         
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
         
@@ -438,7 +426,7 @@ class Snowy(pygame.sprite.Sprite):
             base_image = self.walk_frames[self.current_frame]
         
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
         
@@ -497,7 +485,7 @@ class Snowy(pygame.sprite.Sprite):
 
         base_image = self.death_frames[self.current_frame]
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
 
@@ -1,19 +1,17 @@
 import pygame
 import random
+from src.core.sprite_cache import SpriteSheetCache
 
 class Spike(pygame.sprite.Sprite):
     """Spike projectile shot by Spiked Slime"""
+
+    # Spike drawn once if the sprite cannot be loaded (later shots reuse it instead of retrying)
+    _fallback_image = None
+
     def __init__(self, x, y, direction):
         super().__init__()
         
-        try:
-            spike_sheet = pygame.image.load("assets/images/4 Spiked_slime/Spikes.png").convert_alpha()
-            self.image = spike_sheet
-            self.image = pygame.transform.scale(self.image, (35, 35))
-        except Exception as e:
-            print(f"Error loading spike sprite: {e}")
-            self.image = pygame.Surface((20, 20), pygame.SRCALPHA)
-            pygame.draw.polygon(self.image, (150, 150, 150), [(10, 0), (20, 20), (0, 20)])
+        self.image = self.load_image()
         
         self.rect = self.image.get_rect(center=(x, y))
         self.speed_x = 5
@@ -31,9 +29,26 @@ class Spike(pygame.sprite.Sprite):
         if self.rect.bottom >= self.ground_y or self.rect.x < -100 or self.rect.x > 10000:
             self.kill()
 
+    @classmethod
+    def load_image(cls):
+        """Get the spike image (shared, do not modify)"""
+        if cls._fallback_image is not None:
+            return cls._fallback_image
+        try:
+            return SpriteSheetCache.get_frames("assets/images/4 Spiked_slime/Spikes.png", 1, (35, 35))[0]
+        except Exception as e:
+            print(f"Error loading spike sprite: {e}")
+            cls._fallback_image = pygame.Surface((20, 20), pygame.SRCALPHA)
+            pygame.draw.polygon(cls._fallback_image, (150, 150, 150), [(10, 0), (20, 20), (0, 20)])
+            return cls._fallback_image
+
 
 class SpikedSlime(pygame.sprite.Sprite):
     """Spiked Slime - aggressive melee-focused enemy that stays on platform"""
+
+    # Turns around before walking onto hazards (see check_enemy_ground_edge)
+    avoids_hazards = True
+
     def __init__(self, x, y, patrol_left, patrol_right):
         super().__init__()
 
@@ -171,18 +186,7 @@ class SpikedSlime(pygame.sprite.Sprite):
             self.attack_sound = None
         
     def load_sprite_sheet(self, path, frame_count, target_height=80):
-        sheet = pygame.image.load(path).convert_alpha()
-        sheet_width, sheet_height = sheet.get_size()
-        frame_width = sheet_width // frame_count
-        
-        frames = []
-        for i in range(frame_count):
-            frame = pygame.Surface((frame_width, sheet_height), pygame.SRCALPHA)
-            frame.blit(sheet, (0, 0), (i * frame_width, 0, frame_width, sheet_height))
-            aspect = frame_width / sheet_height
-            scaled = pygame.transform.scale(frame, (int(target_height * aspect), target_height))
-            frames.append(scaled)
-        return frames
+        return SpriteSheetCache.get_frames(path, frame_count, target_height)
     
     def create_fallback_sprite(self):
         surf = pygame.Surface((40, 56), pygame.SRCALPHA)
@@ -370,7 +374,7 @@ class SpikedSlime(pygame.sprite.Sprite):
         old_centerx = self.rect.centerx
         
         base_image = self.hurt_frames[0] if self.hurt_flash_timer > 0 else self.idle_anim_frames[self.current_frame]
-        self.image = pygame.transform.flip(base_image, True, False) if self.facing_right else base_image
+        self.image = SpriteSheetCache.get_mirrored(base_image) if self.facing_right else base_image
         
         self.rect = self.image.get_rect(centerx=old_centerx, bottom=old_bottom)
         self.update_hitbox_position()
@@ -384,7 +388,7 @@ class SpikedSlime(pygame.sprite.Sprite):
             old_centerx = self.rect.centerx
             
             base_image = self.hurt_frames[0] if self.hurt_flash_timer > 0 else self.attack_frames[self.current_frame]
-            self.image = pygame.transform.flip(base_image, True, False) if self.facing_right else base_image
+            self.image = SpriteSheetCache.get_mirrored(base_image) if self.facing_right else base_image
             
             self.rect = self.image.get_rect(centerx=old_centerx, bottom=old_bottom)
             self.update_hitbox_position()
@@ -413,7 +417,7 @@ class SpikedSlime(pygame.sprite.Sprite):
         old_centerx = self.rect.centerx
         
         base_image = self.hurt_frames[0] if self.hurt_flash_timer > 0 else self.attack_frames[self.current_frame]
-        self.image = pygame.transform.flip(base_image, True, False) if self.facing_right else base_image
+        self.image = SpriteSheetCache.get_mirrored(base_image) if self.facing_right else base_image
         
         self.rect = self.image.get_rect(centerx=old_centerx, bottom=old_bottom)
         self.update_hitbox_position()
@@ -450,7 +454,7 @@ class SpikedSlime(pygame.sprite.Sprite):
         old_centerx = self.rect.centerx
         
         base_image = self.hurt_frames[0] if self.hurt_flash_timer > 0 else self.walk_frames[self.current_frame]
-        self.image = pygame.transform.flip(base_image, True, False) if self.facing_right else base_image
+        self.image = SpriteSheetCache.get_mirrored(base_image) if self.facing_right else base_image
         
         self.rect = self.image.get_rect(centerx=old_centerx, bottom=old_bottom)
         self.update_hitbox_position()
@@ -501,7 +505,7 @@ class SpikedSlime(pygame.sprite.Sprite):
         old_centerx = self.rect.centerx
 
         base_image = self.death_frames[self.current_frame]
-        self.image = pygame.transform.flip(base_image, True, False) if self.facing_right else base_image
+        self.image = SpriteSheetCache.get_mirrored(base_image) if self.facing_right else base_image
         
         self.rect = self.image.get_rect(centerx=old_centerx, bottom=old_bottom)
         self.update_hitbox_position()
\ No newline at end of file
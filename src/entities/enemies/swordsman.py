@@ -1,5 +1,6 @@
 import pygame
 import random
+from src.core.sprite_cache import SpriteSheetCache
 
 class Swordsman(pygame.sprite.Sprite):
     """Swordsman enemy - melee attacker with sword hitbox extension and player tracking"""
@@ -151,20 +152,7 @@ class Swordsman(pygame.sprite.Sprite):
         
     def load_sprite_sheet(self, path, frame_count, target_height=130):
         """Load and split a sprite sheet into frames"""
-        sheet = pygame.image.load(path).convert_alpha()
-        sheet_width, sheet_height = sheet.get_size()
-        frame_width = sheet_width // frame_count
-        
-        frames = []
-        for i in range(frame_count):
-            frame = pygame.Surface((frame_width, sheet_height), pygame.SRCALPHA)
-            frame.blit(sheet, (0, 0), (i * frame_width, 0, frame_width, sheet_height))
-            
-            # Scale keeping aspect ratio
-            aspect = frame_width / sheet_height
-            scaled = pygame.transform.scale(frame, (int(target_height * aspect), target_height))
-            frames.append(scaled)
-        return frames
+        return SpriteSheetCache.get_frames(path, frame_count, target_height)
     
     def create_fallback_sprite(self):
         """Fallback rectangle if sprites fail to load"""
@@ -386,7 +374,7 @@ class Swordsman(pygame.sprite.Sprite):
             base_image = self.idle_anim_frames[self.current_frame]
         
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
         
@@ -411,7 +399,7 @@ class Swordsman(pygame.sprite.Sprite):
                 base_image = self.attack_frames[self.current_frame]
             
             if self.facing_right:
-                self.image = pygame.transform.flip(base_image, True, False)
+                self.image = SpriteSheetCache.get_mirrored(base_image)
             else:
                 self.image = base_image
             
@@ -462,7 +450,7 @@ class Swordsman(pygame.sprite.Sprite):
             base_image = self.attack_frames[self.current_frame]
         
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
         
@@ -490,7 +478,7 @@ class Swordsman(pygame.sprite.Sprite):
             base_image = self.walk_frames[self.current_frame]
         
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
         
@@ -551,7 +539,7 @@ class Swordsman(pygame.sprite.Sprite):
 
         base_image = self.death_frames[self.current_frame]
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
         
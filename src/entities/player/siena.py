@@ -1,6 +1,7 @@
 import pygame
 from src.utils import settings as S
 from src.core import constants as C
+from src.core.sprite_cache import SpriteSheetCache
 
 class Siena(pygame.sprite.Sprite):
     def __init__(self, x=100, y=500, abilities=None, max_health=6):
@@ -181,18 +182,7 @@ class Siena(pygame.sprite.Sprite):
     # ------------------------------------------------------------------
     def load_sprite_sheet(self, path, frame_count, target_height=160):
         """Splits a horizontal sprite sheet into individual frames."""
-        sheet = pygame.image.load(path).convert_alpha()
-        sheet_width, sheet_height = sheet.get_size()
-        frame_width = sheet_width // frame_count
-
-        frames = []
-        for i in range(frame_count):
-            frame = pygame.Surface((frame_width, sheet_height), pygame.SRCALPHA)
-            frame.blit(sheet, (0, 0), (i * frame_width, 0, frame_width, sheet_height))
-            aspect = frame_width / sheet_height
-            scaled = pygame.transform.scale(frame, (int(target_height * aspect), target_height))
-            frames.append(scaled)
-        return frames
+        return SpriteSheetCache.get_frames(path, frame_count, target_height)
 
     # ------------------------------------------------------------------
     def create_fallback_sprite(self):
@@ -498,7 +488,7 @@ class Siena(pygame.sprite.Sprite):
                 self.frame_counter = 0.0
                 base_image = self.crouch_frames[0]
                 if self.facing_right:
-                    self.image = pygame.transform.flip(base_image, True, False)
+                    self.image = SpriteSheetCache.get_mirrored(base_image)
                 else:
                     self.image = base_image
                 old_bottom = self.rect.bottom
@@ -605,7 +595,7 @@ class Siena(pygame.sprite.Sprite):
 
         base_image = self.hurt_frames[self.current_frame]
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
 
@@ -619,7 +609,7 @@ class Siena(pygame.sprite.Sprite):
 
         base_image = self.death_frames[0]
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
 
@@ -650,7 +640,7 @@ class Siena(pygame.sprite.Sprite):
             base_image = self.spin_frames[self.current_frame]
 
             if self.facing_right:
-                self.image = pygame.transform.flip(base_image, True, False)
+                self.image = SpriteSheetCache.get_mirrored(base_image)
             else:
                 self.image = base_image
 
@@ -669,7 +659,7 @@ class Siena(pygame.sprite.Sprite):
             base_image = self.roll_frames[self.current_frame]
 
             if self.facing_right:
-                self.image = pygame.transform.flip(base_image, True, False)
+                self.image = SpriteSheetCache.get_mirrored(base_image)
             else:
                 self.image = base_image
 
@@ -693,7 +683,7 @@ class Siena(pygame.sprite.Sprite):
             base_image = self.flap_frames[self.current_frame]
             
             if self.facing_right:
-                self.image = pygame.transform.flip(base_image, True, False)
+                self.image = SpriteSheetCache.get_mirrored(base_image)
             else:
                 self.image = base_image
             
@@ -707,7 +697,7 @@ class Siena(pygame.sprite.Sprite):
             base_image = self.crouch_frames[0]
 
             if self.facing_right:
-                self.image = pygame.transform.flip(base_image, True, False)
+                self.image = SpriteSheetCache.get_mirrored(base_image)
             else:
                 self.image = base_image
 
@@ -758,7 +748,7 @@ class Siena(pygame.sprite.Sprite):
         # FINAL APPLY
         # -------------------------------------------------
         if self.facing_right:
-            self.image = pygame.transform.flip(base_image, True, False)
+            self.image = SpriteSheetCache.get_mirrored(base_image)
         else:
             self.image = base_image
 
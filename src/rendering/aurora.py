@@ -0,0 +1,269 @@
+"""
+Aurora Textures
+Northern lights platform bricks drawn from a precomputed palette table
+"""
+
+import math
+
+import pygame
+from src.core.game_logging import get_logger
+from src.rendering.platform_textures import BRICK_WIDTH, BRICK_HEIGHT
+
+logger = get_logger(__name__)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Number of steps the aurora colour cycle is quantized into
+# (base, glow and outline colours for every step fill palette entries 0-254)
+AURORA_PHASE_STEPS = 85
+
+# Colour cycle speed (cycles per second)
+AURORA_SPEED = 0.8
+
+# Palette layout: [base x steps][glow x steps][outline x steps] ... transparent
+BASE, GLOW, OUTLINE = 0, 1, 2
+TRANSPARENT_INDEX = 255
+
+
+def _aurora_rgb(phase):
+    """Base aurora colour (green/purple/blue) for a phase in [0, 1)"""
+    if phase < 0.33:
+        # Green aurora
+        r = int(50 + phase * 300)
+        g = int(150 + math.sin(phase * math.pi) * 80)
+        b = int(100 + phase * 100)
+    elif phase < 0.66:
+        # Purple aurora
+        adjusted_phase = (phase - 0.33) * 3
+        r = int(120 + math.sin(adjusted_phase * math.pi) * 80)
+        g = int(50 + adjusted_phase * 100)
+        b = int(150 + math.sin(adjusted_phase * math.pi) * 80)
+    else:
+        # Blue aurora
+        adjusted_phase = (phase - 0.66) * 3
+        r = int(50 + adjusted_phase * 80)
+        g = int(100 + adjusted_phase * 100)
+        b = int(180 + math.sin(adjusted_phase * math.pi) * 70)
+    return r, g, b
+
+
+def build_aurora_table(steps=AURORA_PHASE_STEPS):
+    """
+    Build the (steps, 3, 3) table of base/glow/outline colours for each phase step
+
+    Uses NumPy when available, otherwise the same formulas in pure Python.
+
+    Args:
+        steps: Number of phase steps
+
+    Returns:
+        list: table[step][BASE|GLOW|OUTLINE] -> (r, g, b)
+    """
+    if np is None:
+        table = []
+        for step in range(steps):
+            r, g, b = _aurora_rgb(step / steps)
+            table.append((
+                (min(255, max(0, r)), min(255, max(0, g)), min(255, max(0, b))),
+                (min(255, r + 40), min(255, g + 40), min(255, b + 40)),
+                (max(0, r - 30), max(0, g - 30), max(0, b - 30)),
+            ))
+        return table
+
+    phase = np.arange(steps) / steps
+    green = phase < 0.33
+    purple = ~green & (phase < 0.66)
+    adjusted = np.where(purple, (phase - 0.33) * 3, (phase - 0.66) * 3)
+    wave = np.sin(adjusted * math.pi)
+    r = np.select([green, purple], [50 + phase * 300, 120 + wave * 80], 50 + adjusted * 80)
+    g = np.select([green, purple], [150 + np.sin(phase * math.pi) * 80, 50 + adjusted * 100],
+                  100 + adjusted * 100)
+    b = np.select([green, purple], [100 + phase * 100, 150 + wave * 80], 180 + wave * 70)
+    rgb = np.stack([r, g, b], axis=1).astype(np.int64)  # int() truncation
+
+    table = np.stack([np.clip(rgb, 0, 255), np.minimum(255, rgb + 40), np.maximum(0, rgb - 30)], axis=1)
+    return [tuple(tuple(color) for color in step) for step in table.tolist()]
+
+
+def paint_aurora_indices(surface, width, height, steps=AURORA_PHASE_STEPS):
+    """
+    Paint palette indices for an aurora brick pattern into an 8-bit surface
+
+    Each brick gets the index of its static phase offset (from its column and
+    row); animating is then just rotating the palette.
+
+    Args:
+        surface: 8-bit surface of at least width x height
+        width: Platform width
+        height: Platform height
+        steps: Number of phase steps
+    """
+    bounds = pygame.Rect(0, 0, width, height)
+    cols = (width // BRICK_WIDTH) + 1
+    rows = (height // BRICK_HEIGHT) + 1
+
+    for row in range(rows):
+        for col in range(cols):
+            # Offset every other row for brick pattern
+            x_offset = (BRICK_WIDTH // 2) if row % 2 == 1 else 0
+            brick_x = (col * BRICK_WIDTH) + x_offset
+            brick_y = row * BRICK_HEIGHT
+
+            if brick_x + BRICK_WIDTH < 0 or brick_x > width:
+                continue
+            if brick_y + BRICK_HEIGHT < 0 or brick_y > height:
+                continue
+
+            clip_rect = pygame.Rect(brick_x, brick_y, BRICK_WIDTH, BRICK_HEIGHT).clip(bounds)
+            if clip_rect.width <= 0 or clip_rect.height <= 0:
+                continue
+
+            offset = int(round(((col * 0.3 + row * 0.2) % 1.0) * steps)) % steps
+
+            pygame.draw.rect(surface, BASE * steps + offset, clip_rect)
+
+            # Glow effect (lighter center)
+            if clip_rect.width > 4 and clip_rect.height > 4:
+                glow_rect = pygame.Rect(clip_rect.x + 2, clip_rect.y + 2, clip_rect.width - 4, clip_rect.height - 4)
+                pygame.draw.rect(surface, GLOW * steps + offset, glow_rect)
+
+            # Subtle brick outline
+            pygame.draw.rect(surface, OUTLINE * steps + offset, clip_rect, 1)
+
+
+class AuroraTextureCache:
+    """
+    Caches one palettized aurora texture per platform size
+
+    Textures hold palette indices, not colours. Every frame the palette for
+    the current time step is picked from a precomputed set, so animating a
+    platform costs one set_palette per texture instead of trig per brick.
+    """
+
+    # key: (width, height), value: 8-bit pygame.Surface
+    _textures = {}
+    # key: (width, height), value: phase step the texture's palette is set to
+    _applied_steps = {}
+    _palettes = None
+    _hits = 0
+    _misses = 0
+
+    @classmethod
+    def get_palettes(cls):
+        """One 256-colour palette per phase step (built on first use)"""
+        if cls._palettes is None:
+            steps = AURORA_PHASE_STEPS
+            table = build_aurora_table(steps)
+            palettes = []
+            for shift in range(steps):
+                palette = [(0, 0, 0)] * 256
+                for part in (BASE, GLOW, OUTLINE):
+                    for offset in range(steps):
+                        palette[part * steps + offset] = table[(offset + shift) % steps][part]
+                palette[TRANSPARENT_INDEX] = (255, 0, 255)
+                palettes.append(palette)
+            cls._palettes = palettes
+        return cls._palettes
+
+    @staticmethod
+    def get_phase_step(ticks=None):
+        """
+        Get the palette step for a point in time
+
+        Args:
+            ticks: Milliseconds (defaults to pygame.time.get_ticks())
+
+        Returns:
+            int: Phase step in [0, AURORA_PHASE_STEPS)
+        """
+        if ticks is None:
+            ticks = pygame.time.get_ticks()
+        return int(ticks / 1000.0 * AURORA_SPEED * AURORA_PHASE_STEPS) % AURORA_PHASE_STEPS
+
+    @classmethod
+    def get_texture(cls, width, height, step):
+        """
+        Get the aurora texture for a platform size with its palette set to a phase step
+
+        Args:
+            width: Platform width in pixels
+            height: Platform height in pixels
+            step: Phase step (see get_phase_step)
+
+        Returns:
+            pygame.Surface: 8-bit texture with a colour key for brick gaps
+        """
+        key = (width, height)
+        texture = cls._textures.get(key)
+        if texture is None:
+            cls._misses += 1
+            texture = pygame.Surface((max(1, width), max(1, height)), depth=8)
+            texture.set_palette(cls.get_palettes()[step])
+            texture.fill(TRANSPARENT_INDEX)
+            texture.set_colorkey(TRANSPARENT_INDEX)
+            paint_aurora_indices(texture, width, height)
+            cls._textures[key] = texture
+            cls._applied_steps[key] = step
+        else:
+            cls._hits += 1
+            if cls._applied_steps[key] != step:
+                texture.set_palette(cls.get_palettes()[step])
+                cls._applied_steps[key] = step
+        return texture
+
+    @classmethod
+    def draw(cls, screen, rect, camera_x, step=None):
+        """
+        Draw an aurora platform
+
+        Args:
+            screen: Surface to draw on
+            rect: Platform rectangle in world space
+            camera_x: Camera X offset
+            step: Phase step (defaults to the current time)
+        """
+        if rect.width <= 0 or rect.height <= 0:
+            return
+        if step is None:
+            step = cls.get_phase_step()
+        screen.blit(cls.get_texture(rect.width, rect.height, step), (rect.x - camera_x, rect.y))
+
+    @classmethod
+    def prewarm(cls, rects):
+        """
+        Paint textures for a set of platforms ahead of time (call at level load)
+
+        Args:
+            rects: Platform rectangles that will be drawn with the aurora style
+        """
+        step = cls.get_phase_step()
+        for rect in rects:
+            if rect.width > 0 and rect.height > 0:
+                cls.get_texture(rect.width, rect.height, step)
+
+    @classmethod
+    def clear_cache(cls):
+        """Clear the texture cache (useful for testing or memory management)"""
+        cls._textures.clear()
+        cls._applied_steps.clear()
+        cls._hits = 0
+        cls._misses = 0
+        logger.info("Aurora texture cache cleared")
+
+    @classmethod
+    def get_cache_info(cls):
+        """
+        Get information about the texture cache
+
+        Returns:
+            dict: Cache statistics
+        """
+        return {
+            'size': len(cls._textures),
+            'bytes': sum(t.get_width() * t.get_height() for t in cls._textures.values()),
+            'hits': cls._hits,
+            'misses': cls._misses,
+        }
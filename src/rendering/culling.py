@@ -0,0 +1,140 @@
+"""
+View Culling
+Selects only the world-space drawables that are inside the camera view
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+def _rect_of(item):
+    """Return the world-space rect of a drawable (a Rect or anything with .rect)"""
+    return getattr(item, 'rect', item)
+
+
+class CullingIndex:
+    """
+    X-sorted index of drawables that never move (platforms, hazards, coins, checkpoints)
+
+    Lookups bisect on the left edge, widened by the widest item, so only the
+    handful of candidates near the view are touched. Results keep the original
+    draw order so overlapping sprites layer exactly as before.
+    """
+
+    def __init__(self, items, rect_of=_rect_of):
+        """
+        Build the index
+
+        Args:
+            items: Drawables in draw order
+            rect_of: Function returning an item's world-space rect
+        """
+        entries = []
+        for order, item in enumerate(items):
+            rect = rect_of(item)
+            entries.append((rect.left, order, rect.right, item))
+        entries.sort(key=lambda entry: (entry[0], entry[1]))
+
+        self.lefts = [entry[0] for entry in entries]
+        self.entries = entries
+        self.max_width = max((entry[2] - entry[0] for entry in entries), default=0)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def query(self, left, right):
+        """
+        Find items overlapping the X range [left, right]
+
+        Args:
+            left: Left edge of the range (world space)
+            right: Right edge of the range (world space)
+
+        Returns:
+            list: Matching items in their original draw order
+        """
+        lo = bisect_left(self.lefts, left - self.max_width)
+        hi = bisect_right(self.lefts, right)
+        hits = [entry for entry in self.entries[lo:hi] if entry[2] >= left]
+        hits.sort(key=lambda entry: entry[1])
+        return [entry[3] for entry in hits]
+
+
+class FrustumCuller:
+    """
+    Per-frame view culling with drawn/culled counters for each layer
+
+    Static layers go through a CullingIndex; moving layers (enemies,
+    projectiles, dynamic platforms) are filtered directly since they would
+    need re-sorting every frame anyway.
+    """
+
+    def __init__(self, view_width, monitor=None):
+        """
+        Args:
+            view_width: Width of the view in world pixels
+            monitor: Optional PerformanceMonitor that receives the counters
+        """
+        self.view_width = view_width
+        self.monitor = monitor
+        self.left = 0
+        self.right = view_width
+        self.counts = {}
+
+    def begin_frame(self, camera_x):
+        """Set the camera position for this frame and reset the counters"""
+        self.left = camera_x
+        self.right = camera_x + self.view_width
+        self.counts = {}
+
+    def _count(self, layer, drawn, total):
+        counts = self.counts.setdefault(layer, [0, 0])
+        counts[0] += drawn
+        counts[1] += total - drawn
+
+    def visible(self, layer, drawables, margin=0, rect_of=_rect_of):
+        """
+        Select the on-screen drawables of a layer
+
+        Args:
+            layer: Layer name used for the counters (e.g. "platforms")
+            drawables: A CullingIndex, or any iterable of Rects / objects with .rect
+            margin: Extra world pixels on each side (for sprites that draw
+                outside their rect, like health hearts or flame tiles)
+            rect_of: Function returning an item's world-space rect (iterables only)
+
+        Returns:
+            list: Visible drawables in draw order
+        """
+        left = self.left - margin
+        right = self.right + margin
+
+        if isinstance(drawables, CullingIndex):
+            visible = drawables.query(left, right)
+            self._count(layer, len(visible), len(drawables))
+            return visible
+
+        visible = []
+        total = 0
+        for item in drawables:
+            total += 1
+            rect = rect_of(item)
+            if rect.right >= left and rect.left <= right:
+                visible.append(item)
+        self._count(layer, len(visible), total)
+        return visible
+
+    def end_frame(self):
+        """Send this frame's counters to the performance monitor"""
+        if self.monitor is not None:
+            self.monitor.record_culling(self.counts)
+
+    def get_totals(self):
+        """
+        Get drawn/culled totals for the current frame
+
+        Returns:
+            tuple: (drawn, culled)
+        """
+        drawn = sum(counts[0] for counts in self.counts.values())
+        culled = sum(counts[1] for counts in self.counts.values())
+        return drawn, culled
@@ -7,6 +7,7 @@ import sys
 import pygame
 from src.utils import settings as S
 from src.core.audio_manager import get_audio_manager
+from src.core.tracing import trace_span
 from src.rendering.screens.title_screen import TitleScreen, LevelSelectScreen, GuideScreen
 from src.ui.scoreboard import show_scoreboard
 from src.ui.username_input import PlayerProfileScreen
@@ -42,19 +43,20 @@ def draw_story_scene(screen, scene_data):
             # Fill screen with black first (for letterboxing)
             screen.fill((0, 0, 0))
 
-            # Load the background image
-            bg_image = pygame.image.load(scene_data['background_image'])
-            img_width, img_height = bg_image.get_size()
+            with trace_span("cutscene.image", 'load', path=scene_data['background_image']):
+                # Load the background image
+                bg_image = pygame.image.load(scene_data['background_image'])
+                img_width, img_height = bg_image.get_size()
 
-            # Calculate scaling to fit entire image (letterbox style)
-            scale_x = S.WINDOW_WIDTH / img_width
-            scale_y = S.WINDOW_HEIGHT / img_height
-            scale = min(scale_x, scale_y)  # Use min to fit entire image
+                # Calculate scaling to fit entire image (letterbox style)
+                scale_x = S.WINDOW_WIDTH / img_width
+                scale_y = S.WINDOW_HEIGHT / img_height
+                scale = min(scale_x, scale_y)  # Use min to fit entire image
 
-            # Scale the image using high-quality smoothscale
-            new_width = int(img_width * scale)
-            new_height = int(img_height * scale)
-            bg_image = pygame.transform.smoothscale(bg_image, (new_width, new_height))
+                # Scale the image using high-quality smoothscale
+                new_width = int(img_width * scale)
+                new_height = int(img_height * scale)
+                bg_image = pygame.transform.smoothscale(bg_image, (new_width, new_height))
 
             # Center the image (creates black bars on sides or top/bottom)
             offset_x = (S.WINDOW_WIDTH - new_width) // 2
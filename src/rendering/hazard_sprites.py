@@ -0,0 +1,214 @@
+"""
+Hazard Sprites
+Preprocessed flame frames and pre-tiled flame strips for spiky hazards
+"""
+
+import pygame
+from src.core.game_logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+FIRE_SHEET_PATH = "assets/images/objects/Fiyah.png"
+
+# Sprite sheet has 6 frames: 3 on top row, 3 on bottom row
+FIRE_SHEET_COLUMNS = 3
+FIRE_SHEET_ROWS = 2
+FIRE_FRAME_COUNT = FIRE_SHEET_COLUMNS * FIRE_SHEET_ROWS
+FIRE_FRAME_DURATION = 100  # milliseconds per frame
+
+# Grey sheet background (165, 165, 165) +/- tolerance becomes transparent
+BACKGROUND_GREY = 165
+BACKGROUND_TOLERANCE = 10
+
+
+def remove_grey_background(surface):
+    """
+    Make the grey sprite sheet background transparent (in place)
+
+    Args:
+        surface: Per-pixel alpha surface
+    """
+    if np is not None:
+        rgb = pygame.surfarray.pixels3d(surface)
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        grey = (np.abs(rgb.astype(np.int16) - BACKGROUND_GREY) < BACKGROUND_TOLERANCE).all(axis=2)
+        alpha[grey] = 0
+        del rgb, alpha  # Unlock the surface
+        return
+
+    width, height = surface.get_size()
+    for x in range(width):
+        for y in range(height):
+            r, g, b, a = surface.get_at((x, y))
+            if (abs(r - BACKGROUND_GREY) < BACKGROUND_TOLERANCE and
+                    abs(g - BACKGROUND_GREY) < BACKGROUND_TOLERANCE and
+                    abs(b - BACKGROUND_GREY) < BACKGROUND_TOLERANCE):
+                surface.set_at((x, y), (r, g, b, 0))
+
+
+class HazardSpriteCache:
+    """
+    Caches flame frames scaled per hazard height and flame strips per hazard size
+
+    The sheet is loaded and keyed once, the 6 frames are scaled once for each
+    distinct hazard height, and each hazard's row of tiled flames is built
+    once per frame index, so drawing a hazard is a single blit.
+    """
+
+    _sheet = None
+    _sheet_loaded = False
+    # key: height, value: list of scaled frames
+    _frames = {}
+    # key: (width, height), value: list of tiled strips (one per frame)
+    _strips = {}
+    _hits = 0
+    _misses = 0
+
+    @classmethod
+    def get_sheet(cls):
+        """Get the flame sprite sheet with its background removed (None if it failed to load)"""
+        if not cls._sheet_loaded:
+            cls._sheet_loaded = True
+            try:
+                sheet = pygame.image.load(FIRE_SHEET_PATH).convert_alpha()
+                remove_grey_background(sheet)
+                cls._sheet = sheet
+            except Exception as e:
+                logger.error(f"Could not load fire sprite: {e}")
+                cls._sheet = None
+        return cls._sheet
+
+    @classmethod
+    def get_frames(cls, height):
+        """
+        Get the 6 flame frames scaled to a hazard height
+
+        Args:
+            height: Hazard height in pixels
+
+        Returns:
+            list: Scaled frames, or None if the sheet failed to load
+        """
+        frames = cls._frames.get(height)
+        if frames is not None:
+            return frames
+
+        sheet = cls.get_sheet()
+        if sheet is None:
+            return None
+
+        frame_width = sheet.get_width() // FIRE_SHEET_COLUMNS
+        frame_height = sheet.get_height() // FIRE_SHEET_ROWS
+        scaled_width = max(1, int(frame_width * (height / frame_height)))
+
+        frames = []
+        for frame_index in range(FIRE_FRAME_COUNT):
+            frame_x = (frame_index % FIRE_SHEET_COLUMNS) * frame_width
+            frame_y = (frame_index // FIRE_SHEET_COLUMNS) * frame_height
+            frame = sheet.subsurface((frame_x, frame_y, frame_width, frame_height))
+            frames.append(pygame.transform.scale(frame, (scaled_width, height)))
+        cls._frames[height] = frames
+        return frames
+
+    @classmethod
+    def get_strips(cls, width, height):
+        """
+        Get the tiled flame strips for a hazard size (one per frame)
+
+        Flames are tiled from the left edge; the last flame may overhang the
+        hazard's right edge by up to one flame width.
+
+        Args:
+            width: Hazard width in pixels
+            height: Hazard height in pixels
+
+        Returns:
+            list: Strip surfaces, or None if the sheet failed to load
+        """
+        key = (width, height)
+        strips = cls._strips.get(key)
+        if strips is not None:
+            cls._hits += 1
+            return strips
+
+        frames = cls.get_frames(height)
+        if frames is None:
+            return None
+
+        cls._misses += 1
+        scaled_width = frames[0].get_width()
+        num_fires = max(1, -(-width // scaled_width))  # Flames that start inside the hazard
+
+        strips = []
+        for frame in frames:
+            strip = pygame.Surface((num_fires * scaled_width, height), pygame.SRCALPHA)
+            for i in range(num_fires):
+                # Flames don't overlap; MAX against the cleared strip copies pixels unblended
+                strip.blit(frame, (i * scaled_width, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            strips.append(strip)
+        cls._strips[key] = strips
+        return strips
+
+    @classmethod
+    def draw(cls, screen, rect, camera_x):
+        """
+        Draw an animated flame hazard
+
+        Args:
+            screen: Surface to draw on
+            rect: Hazard rectangle in world space
+            camera_x: Camera X offset
+        """
+        draw_x = rect.x - camera_x
+        strips = cls.get_strips(rect.width, rect.height) if rect.width > 0 and rect.height > 0 else None
+        if strips is None:
+            # Fallback: draw a simple red rectangle if image fails to load
+            pygame.draw.rect(screen, (255, 100, 0), (draw_x, rect.y, rect.width, rect.height))
+            return
+
+        frame_index = (pygame.time.get_ticks() // FIRE_FRAME_DURATION) % FIRE_FRAME_COUNT
+        screen.blit(strips[frame_index], (draw_x, rect.y))
+
+    @classmethod
+    def prewarm(cls, rects):
+        """
+        Build frames and strips for a level's hazards ahead of time (call at level load)
+
+        Args:
+            rects: Hazard rectangles
+        """
+        for rect in rects:
+            if rect.width > 0 and rect.height > 0:
+                cls.get_strips(rect.width, rect.height)
+
+    @classmethod
+    def clear_cache(cls):
+        """Clear the cached frames and strips (the processed sheet is kept)"""
+        cls._frames.clear()
+        cls._strips.clear()
+        cls._hits = 0
+        cls._misses = 0
+        logger.info("Hazard sprite cache cleared")
+
+    @classmethod
+    def get_cache_info(cls):
+        """
+        Get information about the hazard sprite cache
+
+        Returns:
+            dict: Cache statistics
+        """
+        surfaces = [s for frames in cls._frames.values() for s in frames]
+        surfaces += [s for strips in cls._strips.values() for s in strips]
+        return {
+            'heights': len(cls._frames),
+            'strips': len(cls._strips),
+            'bytes': sum(s.get_bytesize() * s.get_width() * s.get_height() for s in surfaces),
+            'hits': cls._hits,
+            'misses': cls._misses,
+        }
@@ -0,0 +1,472 @@
+"""
+Level Renderer
+Draws one level's world, entities, particles and HUD for a LevelSimulation
+"""
+
+import random
+
+import pygame
+from src.core.font_manager import FontManager
+from src.core.game_logging import get_logger
+from src.utils import settings as S
+from src.utils.background import ParallaxBackground
+from src.ui.health_display import HealthDisplay
+from src.ui.enemy_health_display import EnemyHealthDisplay
+from src.ui.spin_charge_display import SpinChargeDisplay
+from src.ui.roll_stamina_display import RollStaminaDisplay
+from src.ui.game_hud import GameHUD
+from src.ui.hud_layer import HUDLayer
+from src.rendering.rendering import (
+    draw_spiky_hazard, draw_icy_brick_platform, draw_northern_lights_ground,
+    draw_debug_coordinates
+)
+from src.rendering.platform_textures import PlatformTextureCache
+from src.rendering.aurora import AuroraTextureCache
+from src.rendering.hazard_sprites import HazardSpriteCache
+from src.rendering.culling import CullingIndex, FrustumCuller
+from src.rendering.static_layer import StaticLayerRenderer
+from src.rendering.render_queue import RenderQueue
+
+logger = get_logger(__name__)
+
+
+class LevelRenderer:
+    """
+    Renders the game view of a level (everything below the menus and overlays)
+
+    Owns the per-level render state: pre-baked platform layers, culling
+    indexes, the parallax background and the health/ability displays. The
+    game loop and the headless benchmark draw through the same code.
+    """
+
+    def __init__(self, simulation, particle_mgr, performance_monitor, show_hitboxes=False,
+                 show_coordinates=False, show_enemies=True, show_platforms=True, show_hazards=True,
+                 use_static_layer=True):
+        """
+        Args:
+            simulation: LevelSimulation to draw
+            particle_mgr: ParticleManager whose particles are drawn over the world
+            performance_monitor: PerformanceMonitor that receives culling counts and draw scopes
+            show_hitboxes: Draw hitbox outlines (debug)
+            show_coordinates: Draw player/platform coordinates (debug)
+            show_enemies: Draw enemies and projectiles (debug toggle)
+            show_platforms: Draw platforms (debug toggle)
+            show_hazards: Draw hazards (debug toggle)
+            use_static_layer: Bake static platforms into chunk surfaces
+        """
+        self.simulation = simulation
+        self.particle_mgr = particle_mgr
+        self.performance_monitor = performance_monitor
+        self.show_hitboxes = show_hitboxes
+        self.show_coordinates = show_coordinates
+        self.show_enemies = show_enemies
+        self.show_platforms = show_platforms
+        self.show_hazards = show_hazards
+        self.effect_rng = random.Random()  # Render-only randomness (keeps the gameplay random sequence replayable)
+
+        world_name = simulation.world_name
+        static_platforms = simulation.static_platforms
+        moving_platforms = simulation.moving_platforms
+        disappearing_platforms = simulation.disappearing_platforms
+        appearing_platforms = simulation.appearing_platforms
+        hazards = simulation.hazards
+        coins = simulation.coins
+        checkpoints = simulation.checkpoints
+        background_layers = simulation.background_layers
+        level_width = simulation.level_width
+
+        # --- STATIC PLATFORM STYLES: (brick style, rect) in draw order ---
+        if world_name == "1-1":
+            # Skip first platform which is the invisible_ground at y=570
+            static_platform_styles = [('brick', platform) for platform in static_platforms[1:]]
+        elif world_name == "1-2":
+            # 6 snowy ground segments at Y=400, then wooden platforms above
+            static_platform_styles = ([('snowy', platform) for platform in static_platforms[:6]] +
+                                      [('wooden', platform) for platform in static_platforms[6:]])
+        elif world_name == "1-3":
+            # Dark blue icy bricks, including the ground
+            static_platform_styles = [('icy_brick', platform) for platform in static_platforms]
+            PlatformTextureCache.prewarm('icy_brick', [p.rect for p in moving_platforms + disappearing_platforms + appearing_platforms])
+        elif world_name == "1-4":
+            static_platform_styles = []  # Level 4 platforms are animated
+            AuroraTextureCache.prewarm(static_platforms + [p.rect for p in moving_platforms + disappearing_platforms + appearing_platforms])
+        else:
+            # Icy brick texture, skip invisible ground
+            static_platform_styles = [('brick', platform) for platform in static_platforms[1:]]
+
+        # --- PRE-RENDER HAZARD FLAMES (frames scaled per height, strips tiled per size) ---
+        HazardSpriteCache.prewarm(hazards)
+
+        # --- STATIC PLATFORM LAYER (baked into scrolling chunk surfaces as the camera approaches) ---
+        self.static_layer = None
+        if static_platform_styles and use_static_layer:
+            self.static_layer = StaticLayerRenderer(static_platform_styles, S.WINDOW_WIDTH, S.WINDOW_HEIGHT)
+        else:
+            for style, platform in static_platform_styles:
+                PlatformTextureCache.prewarm(style, [platform])
+
+        # --- LOAD PARALLAX BACKGROUND (now level-specific) ---
+        self.background = ParallaxBackground(background_layers, level_width)
+
+        # --- VIEW CULLING (X-sorted indexes for layers that never move) ---
+        self.culler = FrustumCuller(S.WINDOW_WIDTH, performance_monitor)
+        self.hazard_index = CullingIndex(hazards)
+        self.coin_index = CullingIndex(list(coins))  # Collected coins are skipped with alive()
+        self.checkpoint_index = CullingIndex(checkpoints)
+        if world_name == "1-4":
+            self.platform_index = CullingIndex(static_platforms)
+        else:
+            self.platform_index = CullingIndex(static_platform_styles, rect_of=lambda platform: platform[1])
+
+        # --- HUD AND HEALTH UI SETUP ---
+        self.health_ui = HealthDisplay()
+        self.enemy_health_ui = EnemyHealthDisplay()
+        self.roll_stamina_ui = RollStaminaDisplay()
+        self.spin_charge_ui = SpinChargeDisplay()
+        self.hud = GameHUD()
+        self.hud_layer = HUDLayer(self.health_ui, self.hud)
+
+        self.render_queue = RenderQueue()
+
+    def draw(self, screen, camera_x):
+        """
+        Draw the level as seen from a camera position
+
+        Args:
+            screen: Surface to draw on (S.WINDOW_WIDTH x S.WINDOW_HEIGHT)
+            camera_x: Camera X offset in world pixels
+        """
+        simulation = self.simulation
+        progression = simulation.progression
+        player = simulation.player
+        enemies = simulation.enemies
+        projectiles = simulation.projectiles
+        coins = simulation.coins
+        goal_npc = simulation.goal_npc
+        world_name = simulation.world_name
+        collision_world = simulation.collision_world
+        moving_platforms = simulation.moving_platforms
+        disappearing_platforms = simulation.disappearing_platforms
+        appearing_platforms = simulation.appearing_platforms
+        coins_collected = simulation.coins_collected
+        level_time = simulation.level_time
+
+        culler = self.culler
+        background = self.background
+        static_layer = self.static_layer
+        hazard_index = self.hazard_index
+        platform_index = self.platform_index
+        coin_index = self.coin_index
+        checkpoint_index = self.checkpoint_index
+        enemy_health_ui = self.enemy_health_ui
+        roll_stamina_ui = self.roll_stamina_ui
+        spin_charge_ui = self.spin_charge_ui
+        particle_mgr = self.particle_mgr
+        effect_rng = self.effect_rng
+        show_hitboxes = self.show_hitboxes
+        show_coordinates = self.show_coordinates
+        show_enemies = self.show_enemies
+        show_platforms = self.show_platforms
+        show_hazards = self.show_hazards
+        monitor = self.performance_monitor
+
+        culler.begin_frame(camera_x)
+        screen.fill((50, 50, 80))
+
+        with monitor.scope("background"):
+            background.draw(screen, camera_x)
+
+        with monitor.scope("hazards"):
+            # Draw hazard platforms (SPIKY ICE - deadly!) - only if enabled
+            if show_hazards:
+                # Flame tiles overhang the hazard rect by up to one frame width
+                for hazard in culler.visible('hazards', hazard_index, margin=128):
+                    draw_spiky_hazard(screen, hazard, camera_x)
+
+                    if show_hitboxes:
+                        # Draw hitbox outline
+                        draw_rect = pygame.Rect(hazard.x - camera_x, hazard.y, hazard.width, hazard.height)
+                        pygame.draw.rect(screen, (255, 0, 0), draw_rect, 3)  # Bright red outline
+
+        with monitor.scope("platforms"):
+            # Draw platforms with brick texture
+            if show_platforms:
+                # Level 1 and others: snowy/icy bricks, skipping the invisible ground
+                # Level 2: snowy ground + wooden platforms
+                # Level 3: dark blue icy bricks, including the ground
+                # Level 4: animated northern lights (drawn every frame below)
+                if world_name != "1-4":
+                    if static_layer is not None:
+                        # One or two pre-baked chunk blits regardless of platform count
+                        static_layer.draw(screen, camera_x)
+                    else:
+                        for style, platform in culler.visible('platforms', platform_index):
+                            PlatformTextureCache.draw(screen, style, platform, camera_x)
+
+                    # Optional: Draw platform outline for hitbox debugging
+                    if show_hitboxes:
+                        for _, platform in culler.visible('platforms', platform_index):
+                            draw_rect = pygame.Rect(platform.x - camera_x, platform.y, platform.width, platform.height)
+                            pygame.draw.rect(screen, (255, 255, 0), draw_rect, 2)
+
+                if world_name == "1-3":
+                    # LEVEL 3: Dynamic platforms with dark blue icy bricks
+                    for platform in culler.visible('platforms', collision_world.active_body_rects()):
+                        draw_icy_brick_platform(screen, platform, camera_x)
+
+                        if show_hitboxes:
+                            draw_rect = pygame.Rect(platform.x - camera_x, platform.y, platform.width, platform.height)
+                            pygame.draw.rect(screen, (255, 255, 0), draw_rect, 2)
+
+                    # Draw moving platforms
+                    for moving_platform in culler.visible('dynamic_platforms', moving_platforms):
+                        draw_icy_brick_platform(screen, moving_platform.rect, camera_x)
+
+                        if show_hitboxes:
+                            draw_rect = pygame.Rect(moving_platform.rect.x - camera_x, moving_platform.rect.y,
+                                                   moving_platform.rect.width, moving_platform.rect.height)
+                            pygame.draw.rect(screen, (0, 255, 255), draw_rect, 2)  # Cyan for moving platforms
+
+                    # Draw disappearing platforms (same style as Level 4)
+                    for disappearing_platform in culler.visible('dynamic_platforms', disappearing_platforms):
+                        if not disappearing_platform.disappeared:
+                            # Create a semi-transparent surface
+                            platform_surface = pygame.Surface((disappearing_platform.rect.width, disappearing_platform.rect.height))
+                            platform_surface.set_colorkey((0, 0, 0))
+
+                            # Fill with semi-transparent white/blue ice color
+                            ice_color = (180, 200, 220)
+                            pygame.draw.rect(platform_surface, ice_color, (0, 0, disappearing_platform.rect.width, disappearing_platform.rect.height))
+
+                            # Draw border (black/grey) to make it clear
+                            border_color = (50, 50, 50) if not disappearing_platform.should_shake() else (100, 100, 100)
+                            pygame.draw.rect(platform_surface, border_color, (0, 0, disappearing_platform.rect.width, disappearing_platform.rect.height), 3)
+
+                            # Apply transparency
+                            platform_surface.set_alpha(disappearing_platform.get_alpha())
+
+                            # Apply pulse effect if warning about state change
+                            pulse_offset = 0
+                            if disappearing_platform.should_shake():
+                                pulse_offset = effect_rng.randint(-1, 1)
+
+                            # Draw to screen
+                            screen.blit(platform_surface,
+                                       (disappearing_platform.rect.x - camera_x,
+                                        disappearing_platform.rect.y + pulse_offset))
+
+                            if show_hitboxes:
+                                draw_rect = pygame.Rect(disappearing_platform.rect.x - camera_x, disappearing_platform.rect.y,
+                                                       disappearing_platform.rect.width, disappearing_platform.rect.height)
+                                pygame.draw.rect(screen, (255, 0, 255), draw_rect, 2)  # Magenta for disappearing platforms
+                elif world_name == "1-4":
+                    # LEVEL 4: Glowing northern lights platforms with animated colors
+                    # Draw all platforms (including ground) with animated northern lights effect
+                    visible_platforms = (culler.visible('platforms', platform_index) +
+                                         culler.visible('platforms', collision_world.active_body_rects()))
+                    for platform in visible_platforms:
+                        draw_northern_lights_ground(screen, platform, camera_x)
+
+                        if show_hitboxes:
+                            draw_rect = pygame.Rect(platform.x - camera_x, platform.y, platform.width, platform.height)
+                            pygame.draw.rect(screen, (255, 255, 0), draw_rect, 2)
+
+                    # Draw moving platforms
+                    for moving_platform in culler.visible('dynamic_platforms', moving_platforms):
+                        draw_northern_lights_ground(screen, moving_platform.rect, camera_x)
+
+                        if show_hitboxes:
+                            draw_rect = pygame.Rect(moving_platform.rect.x - camera_x, moving_platform.rect.y,
+                                                    moving_platform.rect.width, moving_platform.rect.height)
+                            pygame.draw.rect(screen, (0, 255, 255), draw_rect, 2)  # Cyan for moving platforms
+
+                    # Draw disappearing platforms with same design as Level 4 appearing platforms
+                    for disappearing_platform in culler.visible('dynamic_platforms', disappearing_platforms):
+                        if not disappearing_platform.disappeared:
+                            # Create a semi-transparent surface (matching Level 4 style)
+                            platform_surface = pygame.Surface((disappearing_platform.rect.width, disappearing_platform.rect.height))
+                            platform_surface.set_colorkey((0, 0, 0))
+
+                            # Fill with semi-transparent white/blue ice color (same as Level 4)
+                            ice_color = (180, 200, 220)
+                            pygame.draw.rect(platform_surface, ice_color, (0, 0, disappearing_platform.rect.width, disappearing_platform.rect.height))
+
+                            # Draw solid border (not dashed) - matching Level 4 style
+                            # Use red warning color if about to disappear, otherwise black/grey
+                            if disappearing_platform.should_shake():
+                                border_color = (255, 50, 50)  # Red warning when shaking
+                            else:
+                                border_color = (50, 50, 50)  # Dark grey/black normally (matches Level 4)
+
+                            pygame.draw.rect(platform_surface, border_color, (0, 0, disappearing_platform.rect.width, disappearing_platform.rect.height), 3)
+
+                            # Apply alpha for fade effect
+                            platform_surface.set_alpha(disappearing_platform.get_alpha())
+
+                            # Apply pulse effect if warning (same as Level 4 appearing platforms)
+                            pulse_offset = 0
+                            if disappearing_platform.should_shake():
+                                pulse_offset = effect_rng.randint(-1, 1)
+
+                            # Draw to screen
+                            screen.blit(platform_surface,
+                                       (disappearing_platform.rect.x - camera_x,
+                                        disappearing_platform.rect.y + pulse_offset))
+
+                            if show_hitboxes:
+                                draw_rect = pygame.Rect(disappearing_platform.rect.x - camera_x, disappearing_platform.rect.y,
+                                                       disappearing_platform.rect.width, disappearing_platform.rect.height)
+                                pygame.draw.rect(screen, (255, 0, 255), draw_rect, 2)  # Magenta for disappearing platforms
+
+                    # Draw appearing platforms with transparency and border
+                    for appearing_platform in culler.visible('dynamic_platforms', appearing_platforms):
+                        if appearing_platform.get_alpha() > 0:  # Only draw if visible at all
+                            # Create a semi-transparent surface
+                            platform_surface = pygame.Surface((appearing_platform.rect.width, appearing_platform.rect.height))
+                            platform_surface.set_colorkey((0, 0, 0))
+
+                            # Fill with semi-transparent white/blue ice color
+                            ice_color = (180, 200, 220)
+                            pygame.draw.rect(platform_surface, ice_color, (0, 0, appearing_platform.rect.width, appearing_platform.rect.height))
+
+                            # Draw border (black/grey) to make it clear
+                            border_color = (50, 50, 50) if appearing_platform.is_solid() else (100, 100, 100)
+                            pygame.draw.rect(platform_surface, border_color, (0, 0, appearing_platform.rect.width, appearing_platform.rect.height), 3)
+
+                            # Apply transparency
+                            platform_surface.set_alpha(appearing_platform.get_alpha())
+
+                            # Apply pulse effect if warning about state change
+                            pulse_offset = 0
+                            if appearing_platform.should_pulse():
+                                pulse_offset = effect_rng.randint(-1, 1)
+
+                            # Draw to screen
+                            screen.blit(platform_surface,
+                                       (appearing_platform.rect.x - camera_x,
+                                        appearing_platform.rect.y + pulse_offset))
+
+                            if show_hitboxes:
+                                draw_rect = pygame.Rect(appearing_platform.rect.x - camera_x, appearing_platform.rect.y,
+                                                       appearing_platform.rect.width, appearing_platform.rect.height)
+                                color = (0, 255, 0) if appearing_platform.is_solid() else (128, 128, 128)
+                                pygame.draw.rect(screen, color, draw_rect, 2)
+
+        with monitor.scope("entities"):
+            # Sprites are queued per layer and drawn with one blits() call each;
+            # debug outlines go on top once their layer has been drawn
+            queue = self.render_queue
+
+            # Draw enemies - only if enabled
+            if show_enemies:
+                # Margin covers health hearts that are wider than the enemy sprite
+                visible_enemies = [enemy for enemy in culler.visible('enemies', enemies, margin=64)
+                                   # Skip drawing enemies that have completed their death animation
+                                   if not getattr(enemy, 'death_complete', False)]
+                for enemy in visible_enemies:
+                    queue.add(enemy.image, (enemy.rect.x - camera_x, enemy.rect.y))
+
+                    # Draw enemy health above them
+                    queue.extend(enemy_health_ui.heart_blits(enemy, camera_x))
+                queue.flush(screen)
+
+                if show_hitboxes:
+                    for enemy in visible_enemies:
+                        # Draw body hitbox (yellow)
+                        debug_hitbox = enemy.hitbox.copy()
+                        debug_hitbox.x -= camera_x
+                        pygame.draw.rect(screen, (255, 255, 0), debug_hitbox, 2)
+
+                        # Draw sword hitbox if active (for Swordsman) - red
+                        if hasattr(enemy, 'sword_hitbox_active') and enemy.sword_hitbox_active:
+                            debug_sword_hitbox = enemy.sword_hitbox.copy()
+                            debug_sword_hitbox.x -= camera_x
+                            pygame.draw.rect(screen, (255, 0, 0), debug_sword_hitbox, 2)
+
+                        # Draw punch hitbox if active (for Snowy) - red
+                        if hasattr(enemy, 'punch_hitbox_active') and enemy.punch_hitbox_active:
+                            debug_punch_hitbox = enemy.punch_hitbox.copy()
+                            debug_punch_hitbox.x -= camera_x
+                            pygame.draw.rect(screen, (255, 0, 0), debug_punch_hitbox, 2)
+
+            # Draw projectiles (snowballs, iceballs, fireballs, spikes) - only if enemies enabled
+            if show_enemies:
+                queue.extend([(projectile.image, (projectile.rect.x - camera_x, projectile.rect.y))
+                              for projectile in culler.visible('projectiles', projectiles)])
+                queue.flush(screen)
+
+            # Draw coins
+            visible_coins = [coin for coin in culler.visible('coins', coin_index) if coin.alive()]
+            queue.extend([(coin.image, (coin.rect.x - camera_x, coin.rect.y)) for coin in visible_coins])
+            queue.flush(screen)
+
+            if show_hitboxes:
+                for coin in visible_coins:
+                    coin.draw_hitbox(screen, camera_x)
+
+            # Draw checkpoints (if enabled)
+            if progression.checkpoints_enabled:
+                for checkpoint in culler.visible('checkpoints', checkpoint_index):
+                    checkpoint.draw(screen, camera_x)
+
+            # Draw goal NPC (if exists) and player
+            if goal_npc:
+                queue.add(goal_npc.image, (goal_npc.rect.x - camera_x, goal_npc.rect.y))
+            queue.add(player.image, (player.rect.x - camera_x, player.rect.y))
+            queue.flush(screen)
+
+            if goal_npc and show_hitboxes:
+                goal_npc.draw_trigger_zone(screen, camera_x)
+
+            if show_hitboxes:
+                # Draw player hitbox (cyan)
+                debug_player_hitbox = player.hitbox.copy()
+                debug_player_hitbox.x -= camera_x
+                pygame.draw.rect(screen, (0, 255, 255), debug_player_hitbox, 2)
+
+                # Draw player rect outline (green)
+                debug_player_rect = player.rect.copy()
+                debug_player_rect.x -= camera_x
+                pygame.draw.rect(screen, (0, 255, 0), debug_player_rect, 2)
+
+            # Draw debug coordinates (if enabled)
+            if show_coordinates:
+                draw_debug_coordinates(screen, player, collision_world.iter_platforms(), camera_x, 0)
+
+        culler.end_frame()
+
+        # --- DRAW PARTICLES ---
+        with monitor.scope("particles.draw"):
+            particle_mgr.draw(screen, camera_x)
+
+        # --- DRAW UI ---
+        with monitor.scope("hud"):
+            roll_stamina_ui.draw(screen, player, camera_x)
+            spin_charge_ui.draw(screen, player, camera_x)
+
+            # Draw game HUD (coins, world, time, difficulty, coins needed, distance)
+            coins_requirement = progression.get_coin_requirement(progression.current_level)
+            coins_still_needed = max(0, coins_requirement - coins_collected)
+            coins_remaining_in_level = len(coins)  # Count uncollected coins still in the sprite group
+            distance_to_goal = 0
+            max_distance = 100  # Default for color scaling
+            if goal_npc:
+                # player.rect.x is already in world coordinates (camera_x is subtracted during rendering)
+                player_world_x = player.rect.x
+                goal_world_x = goal_npc.trigger_zone.left
+                distance_to_goal = max(0, int(goal_world_x - player_world_x - 102))  # Subtract 102 for accurate distance
+                # Calculate max_distance as the goal position (for color scaling)
+                max_distance = goal_world_x
+            # Hearts and HUD text are retained on one layer that only redraws when a value changes
+            self.hud_layer.draw(screen, player.health, player.max_health, coins_collected, level_time, world_name,
+                                progression.difficulty, coins_still_needed, coins_remaining_in_level,
+                                distance_to_goal, max_distance)
+
+            # --- DEBUG: DRAW PLAYER POSITION ---
+            if show_hitboxes:  # Only show when hitboxes are enabled
+                debug_font = FontManager.get_press_start_2p(12)
+
+                # Show player X and Y position
+                pos_text = debug_font.render(f"X: {int(player.rect.x)} Y: {int(player.rect.y)}", True, (255, 255, 0))
+                # Draw with black outline for visibility
+                screen.blit(pos_text, (10, S.WINDOW_HEIGHT - 30))
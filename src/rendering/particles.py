@@ -12,18 +12,116 @@ import pygame
 import random
 import math
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Particles are purely visual, so they draw from their own random stream and
+# never shift the gameplay sequence (enemy AI) that replays depend on
+_rng = random.Random()
+
+# Particle type -> colour range (darkest, lightest), size range, lifetime range and gravity
+PARTICLE_STYLES = {
+    # White fluffy particle for landing and rolling
+    'snow': {'colors': ((200, 220, 255), (255, 255, 255)), 'size': (2, 4), 'lifetime': (15, 30), 'gravity': 0.2},
+    # Golden sparkle for coins and power-ups
+    'sparkle': {'colors': ((255, 195, 0), (255, 215, 50)), 'size': (2, 5), 'lifetime': (20, 40), 'gravity': 0.15},
+    # Red/orange spark for damage effects
+    'hit': {'colors': ((255, 50, 0), (255, 150, 50)), 'size': (2, 4), 'lifetime': (10, 25), 'gravity': 0.25},
+    # White/blue particle for enemy defeats
+    'explosion': {'colors': ((200, 220, 255), (255, 255, 255)), 'size': (3, 6), 'lifetime': (20, 35),
+                  'gravity': 0.2},
+}
+
+COLOR_BANDS = 6  # Shades spread across each style's colour range
+ALPHA_LEVELS = 16  # Fade steps baked into the atlas
+MAX_RADIUS = max(style['size'][1] for style in PARTICLE_STYLES.values())
+CELL_SIZE = MAX_RADIUS * 2
+
+# Atlas row of each style's first colour band
+_STYLE_ROWS = {name: i * COLOR_BANDS for i, name in enumerate(PARTICLE_STYLES)}
+
+
+def _band_color(low, high, band):
+    """Colour of one band between a style's darkest and lightest colour"""
+    t = band / (COLOR_BANDS - 1)
+    return tuple(round(a + (b - a) * t) for a, b in zip(low, high))
+
+
+class ParticleAtlas:
+    """
+    Every particle sprite pre-rendered into one surface
+
+    The atlas has a row per colour band of each particle type and, in each
+    row, a cell per radius (1..MAX_RADIUS) and alpha level, with the fade
+    baked into the per-pixel alpha. Drawing a frame of particles is then a
+    single Surface.blits() call of sub-rectangles from this one surface.
+    """
+
+    _atlas = None
+    _areas = None
+
+    @classmethod
+    def get_atlas(cls):
+        """
+        Get the atlas surface, building it on first use
+
+        Returns:
+            tuple: (pygame.Surface, areas) where areas[area_index(row, radius, level)]
+                is the (x, y, w, h) of that sprite
+        """
+        if cls._atlas is None:
+            rows = len(PARTICLE_STYLES) * COLOR_BANDS
+            atlas = pygame.Surface((MAX_RADIUS * ALPHA_LEVELS * CELL_SIZE, rows * CELL_SIZE), pygame.SRCALPHA)
+            areas = []
+            for style in PARTICLE_STYLES.values():
+                for band in range(COLOR_BANDS):
+                    color = _band_color(*style['colors'], band)
+                    top = len(areas) // (MAX_RADIUS * ALPHA_LEVELS) * CELL_SIZE
+                    for radius in range(1, MAX_RADIUS + 1):
+                        for level in range(ALPHA_LEVELS):
+                            left = len(areas) % (MAX_RADIUS * ALPHA_LEVELS) * CELL_SIZE
+                            alpha = level * 255 // (ALPHA_LEVELS - 1)
+                            pygame.draw.circle(atlas, (*color, alpha), (left + radius, top + radius), radius)
+                            areas.append((left, top, radius * 2, radius * 2))
+            if pygame.display.get_surface() is not None:
+                atlas = atlas.convert_alpha()
+            cls._atlas = atlas
+            cls._areas = areas
+        return cls._atlas, cls._areas
+
+    @staticmethod
+    def area_index(row, radius, level):
+        """Index into the areas list for a colour row, radius and alpha level"""
+        return (row * MAX_RADIUS + radius - 1) * ALPHA_LEVELS + level
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop the atlas (it is rebuilt on next use)"""
+        cls._atlas = None
+        cls._areas = None
+
+
+def _alpha_level(ratio, radius):
+    """Atlas alpha level for a particle faded by ratio (remaining life / lifetime)"""
+    # Small particles are drawn solid, larger ones fade out
+    if radius <= 2:
+        return ALPHA_LEVELS - 1
+    return (int(255 * ratio) * (ALPHA_LEVELS - 1) + 127) // 255
+
 
 class Particle:
-    """Base particle class with physics and rendering."""
+    """Single particle with physics and rendering (used when NumPy is not installed)."""
 
-    def __init__(self, x, y, vx, vy, lifetime, color, size=3, gravity=0.3):
+    def __init__(self, x, y, vx, vy, lifetime, row, size=3, gravity=0.3):
         self.x = x
         self.y = y
         self.vx = vx
         self.vy = vy
         self.lifetime = lifetime
         self.max_lifetime = lifetime
-        self.color = color
+        self.row = row  # Atlas colour row
         self.size = size
         self.gravity = gravity
 
@@ -36,81 +134,181 @@ class Particle:
         self.lifetime -= 1
         return self.lifetime > 0
 
-    def draw(self, screen, camera_x):
-        """Draw particle with fade-out effect."""
-        if self.lifetime <= 0:
-            return
+    def blit_args(self, atlas, areas, camera_x, width, height):
+        """
+        Get this particle's Surface.blits() entry
 
-        alpha = self.lifetime / self.max_lifetime
-        current_size = max(1, int(self.size * alpha))
+        Returns:
+            tuple: (atlas, dest, area), or None if the particle is off-screen or dead
+        """
+        if self.lifetime <= 0:
+            return None
+        ratio = self.lifetime / self.max_lifetime
+        current_size = max(1, int(self.size * ratio))
         screen_x = int(self.x - camera_x)
         screen_y = int(self.y)
 
         # Skip off-screen particles
-        if not (-current_size <= screen_x <= screen.get_width() + current_size):
-            return
-        if not (-current_size <= screen_y <= screen.get_height() + current_size):
-            return
+        if not (-current_size <= screen_x <= width + current_size):
+            return None
+        if not (-current_size <= screen_y <= height + current_size):
+            return None
 
-        # For small particles, draw directly (faster)
-        if current_size <= 2:
-            pygame.draw.circle(screen, self.color, (screen_x, screen_y), current_size)
-        else:
-            # For larger particles, use surface with alpha (cached approach)
-            surf = pygame.Surface((current_size * 2, current_size * 2))
-            surf.set_colorkey((0, 0, 0))
-            pygame.draw.circle(surf, self.color, (current_size, current_size), current_size)
-            surf.set_alpha(int(255 * alpha))
-            screen.blit(surf, (screen_x - current_size, screen_y - current_size))
+        area = areas[ParticleAtlas.area_index(self.row, current_size, _alpha_level(ratio, current_size))]
+        return atlas, (screen_x - current_size, screen_y - current_size), area
 
+    def draw(self, screen, camera_x):
+        """Draw particle with fade-out effect."""
+        atlas, areas = ParticleAtlas.get_atlas()
+        args = self.blit_args(atlas, areas, camera_x, *screen.get_size())
+        if args is not None:
+            screen.blit(*args)
 
-class SnowPuffParticle(Particle):
-    """White fluffy particle for landing and rolling."""
-
-    def __init__(self, x, y, vx, vy):
-        color = (200 + random.randint(0, 55), 220 + random.randint(0, 35), 255)
-        size = random.randint(2, 4)
-        lifetime = random.randint(15, 30)
-        super().__init__(x, y, vx, vy, lifetime, color, size, gravity=0.2)
 
+class ParticlePool:
+    """
+    Fixed-capacity structure-of-arrays particle storage (requires NumPy)
 
-class SparkleParticle(Particle):
-    """Golden sparkle for coins and power-ups."""
+    Every particle property is a column in a NumPy array, so the whole
+    system integrates, ages and culls in a handful of array operations
+    instead of a Python call per particle. Dead slots go on a free-list and
+    are reused by the next spawn; nothing is allocated after construction.
+    """
 
-    def __init__(self, x, y, vx, vy):
-        color = (255, 215 + random.randint(-20, 0), random.randint(0, 50))
-        size = random.randint(2, 5)
-        lifetime = random.randint(20, 40)
-        super().__init__(x, y, vx, vy, lifetime, color, size, gravity=0.15)
+    def __init__(self, capacity):
+        """
+        Args:
+            capacity: Most particles alive at once
+        """
+        self.capacity = capacity
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.gravity = np.zeros(capacity)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.life = np.zeros(capacity, dtype=np.int32)
+        self.max_life = np.ones(capacity, dtype=np.int32)
+        self.row = np.zeros(capacity, dtype=np.int32)  # Atlas colour row
+        self.alive = np.zeros(capacity, dtype=bool)
+
+        self.free = list(range(capacity - 1, -1, -1))  # pop() hands out the lowest free slot
+        self.high = 0  # Slots at and above this index have never been used
+        self.active = 0
+
+    def add(self, x, y, vx, vy, lifetime, row, size, gravity):
+        """
+        Spawn one particle in a free slot
 
+        Returns:
+            bool: False if the pool is full (the particle is dropped)
+        """
+        if not self.free:
+            return False
+        i = self.free.pop()
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.life[i] = lifetime
+        self.max_life[i] = lifetime
+        self.row[i] = row
+        self.size[i] = size
+        self.gravity[i] = gravity
+        self.alive[i] = True
+        self.active += 1
+        if i >= self.high:
+            self.high = i + 1
+        return True
 
-class HitSparkParticle(Particle):
-    """Red/orange spark for damage effects."""
+    def update(self):
+        """Integrate and age every particle, freeing the ones that expired"""
+        if not self.active:
+            return
+        n = self.high
+        # Dead slots are integrated too; it is cheaper than masking and they are reset on reuse
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vy[:n] += self.gravity[:n]
+        self.vx[:n] *= 0.98  # Air resistance
+        self.life[:n] -= 1
+
+        expired = np.flatnonzero(self.alive[:n] & (self.life[:n] <= 0))
+        if expired.size:
+            self.alive[expired] = False
+            self.free.extend(expired[::-1].tolist())
+            self.active -= expired.size
+            if not self.active:
+                self.high = 0
 
-    def __init__(self, x, y, vx, vy):
-        color = (255, random.randint(50, 150), random.randint(0, 50))
-        size = random.randint(2, 4)
-        lifetime = random.randint(10, 25)
-        super().__init__(x, y, vx, vy, lifetime, color, size, gravity=0.25)
+    def draw(self, screen, camera_x):
+        """Draw every live particle that is on screen in one batched blit"""
+        if not self.active:
+            return
+        live = np.flatnonzero(self.alive[:self.high])
+        ratio = self.life[live] / self.max_life[live]
+        current_size = np.maximum(1, (self.size[live] * ratio).astype(np.int32))
+        screen_x = (self.x[live] - camera_x).astype(np.int32)
+        screen_y = self.y[live].astype(np.int32)
+
+        # Cull off-screen particles in one pass
+        width, height = screen.get_size()
+        visible = ((screen_x >= -current_size) & (screen_x <= width + current_size) &
+                   (screen_y >= -current_size) & (screen_y <= height + current_size))
+        if not visible.any():
+            return
 
+        radii = current_size[visible]
+        # Small particles are drawn solid, larger ones fade out
+        levels = np.where(radii <= 2, ALPHA_LEVELS - 1,
+                          ((255 * ratio[visible]).astype(np.int32) * (ALPHA_LEVELS - 1) + 127) // 255)
+        area_indices = ((self.row[live[visible]] * MAX_RADIUS + radii - 1) * ALPHA_LEVELS + levels).tolist()
 
-class ExplosionParticle(Particle):
-    """White/blue particle for enemy defeats."""
+        atlas, areas = ParticleAtlas.get_atlas()
+        dests = zip((screen_x[visible] - radii).tolist(), (screen_y[visible] - radii).tolist())
+        screen.blits([(atlas, dest, areas[i]) for dest, i in zip(dests, area_indices)], doreturn=False)
 
-    def __init__(self, x, y, vx, vy):
-        color = (random.randint(200, 255), random.randint(220, 255), 255)
-        size = random.randint(3, 6)
-        lifetime = random.randint(20, 35)
-        super().__init__(x, y, vx, vy, lifetime, color, size, gravity=0.2)
+    def clear(self):
+        """Free every slot"""
+        self.alive[:] = False
+        self.free = list(range(self.capacity - 1, -1, -1))
+        self.high = 0
+        self.active = 0
 
 
 class ParticleManager:
-    """Manages all particles in the game."""
+    """
+    Manages all particles in the game.
+
+    Particles live in a NumPy ParticlePool when NumPy is installed; without
+    it they fall back to a list of Particle objects with a much lower cap.
+    """
 
-    MAX_PARTICLES = 150  # Limit to prevent performance issues
+    MAX_PARTICLES = 4000  # Pool capacity with NumPy
+    FALLBACK_MAX_PARTICLES = 150  # Limit for the per-object fallback
 
     def __init__(self):
-        self.particles = []
+        # Build the sprite atlas up front rather than on the first burst
+        ParticleAtlas.get_atlas()
+        if np is not None:
+            self.pool = ParticlePool(self.MAX_PARTICLES)
+            self.particles = None
+            self.capacity = self.MAX_PARTICLES
+        else:
+            self.pool = None
+            self.particles = []
+            self.capacity = self.FALLBACK_MAX_PARTICLES
+
+    def _emit(self, particle_type, x, y, vx, vy):
+        """Spawn one particle of a type (dropped if the system is full)"""
+        style = PARTICLE_STYLES[particle_type]
+        row = _STYLE_ROWS[particle_type] + _rng.randrange(COLOR_BANDS)
+        size = _rng.randint(*style['size'])
+        lifetime = _rng.randint(*style['lifetime'])
+        if self.pool is not None:
+            self.pool.add(x, y, vx, vy, lifetime, row, size, style['gravity'])
+        elif len(self.particles) < self.capacity:
+            self.particles.append(Particle(x, y, vx, vy, lifetime, row, size, style['gravity']))
 
     def spawn_burst(self, x, y, count=8, particle_type='snow', direction=None, speed_range=(1, 3)):
         """
@@ -123,52 +321,43 @@ class ParticleManager:
             direction: Angle in radians (None = all directions)
             speed_range: (min_speed, max_speed) tuple
         """
-        # Limit particle count to prevent lag
-        if len(self.particles) >= self.MAX_PARTICLES:
-            return
-
-        particle_class = {
-            'snow': SnowPuffParticle,
-            'sparkle': SparkleParticle,
-            'hit': HitSparkParticle,
-            'explosion': ExplosionParticle
-        }.get(particle_type, SnowPuffParticle)
+        if particle_type not in PARTICLE_STYLES:
+            particle_type = 'snow'
 
         # Reduce count if we're near the limit
-        available_slots = self.MAX_PARTICLES - len(self.particles)
-        count = min(count, available_slots)
+        count = min(count, self.capacity - self.count())
 
         for _ in range(count):
             if direction is None:
                 # Random full circle
-                angle = random.uniform(0, 2 * math.pi)
+                angle = _rng.uniform(0, 2 * math.pi)
             else:
                 # Cone around direction (±45 degrees)
-                angle = direction + random.uniform(-math.pi/4, math.pi/4)
+                angle = direction + _rng.uniform(-math.pi/4, math.pi/4)
 
-            speed = random.uniform(*speed_range)
+            speed = _rng.uniform(*speed_range)
             vx = speed * math.cos(angle)
-            vy = speed * math.sin(angle) - random.uniform(1, 2)  # Upward bias
+            vy = speed * math.sin(angle) - _rng.uniform(1, 2)  # Upward bias
 
-            self.particles.append(particle_class(x, y, vx, vy))
+            self._emit(particle_type, x, y, vx, vy)
 
     def spawn_landing_puff(self, x, y, width):
         """Spawn snow puff when player/enemy lands."""
         # Spread across landing width
-        for _ in range(random.randint(3, 6)):
-            spawn_x = x + random.uniform(0, width)
-            vx = random.uniform(-1, 1)
-            vy = random.uniform(-3, -1)
-            self.particles.append(SnowPuffParticle(spawn_x, y, vx, vy))
+        for _ in range(_rng.randint(3, 6)):
+            spawn_x = x + _rng.uniform(0, width)
+            vx = _rng.uniform(-1, 1)
+            vy = _rng.uniform(-3, -1)
+            self._emit('snow', spawn_x, y, vx, vy)
 
     def spawn_coin_sparkles(self, x, y):
         """Spawn sparkle ring when coin collected."""
         for i in range(12):
             angle = (i / 12) * 2 * math.pi
-            speed = random.uniform(1.5, 2.5)
+            speed = _rng.uniform(1.5, 2.5)
             vx = speed * math.cos(angle)
             vy = speed * math.sin(angle)
-            self.particles.append(SparkleParticle(x, y, vx, vy))
+            self._emit('sparkle', x, y, vx, vy)
 
     def spawn_enemy_defeat(self, x, y, width, height):
         """Spawn explosion when enemy defeated."""
@@ -187,10 +376,10 @@ class ParticleManager:
 
     def spawn_roll_trail(self, x, y):
         """Spawn small snow trail while rolling."""
-        if random.random() < 0.3:  # Only spawn 30% of frames
-            vx = random.uniform(-0.5, 0.5)
-            vy = random.uniform(-0.5, 0)
-            self.particles.append(SnowPuffParticle(x, y, vx, vy))
+        if _rng.random() < 0.3:  # Only spawn 30% of frames
+            vx = _rng.uniform(-0.5, 0.5)
+            vy = _rng.uniform(-0.5, 0)
+            self._emit('snow', x, y, vx, vy)
 
     def spawn_spin_ring(self, x, y, radius):
         """Spawn particle ring during spin attack."""
@@ -200,21 +389,34 @@ class ParticleManager:
             spawn_y = y + radius * math.sin(angle)
             vx = math.cos(angle) * 2
             vy = math.sin(angle) * 2
-            self.particles.append(SparkleParticle(spawn_x, spawn_y, vx, vy))
+            self._emit('sparkle', spawn_x, spawn_y, vx, vy)
 
     def update(self):
         """Update all particles and remove dead ones."""
-        self.particles = [p for p in self.particles if p.update()]
+        if self.pool is not None:
+            self.pool.update()
+        else:
+            self.particles = [p for p in self.particles if p.update()]
 
     def draw(self, screen, camera_x):
         """Draw all particles."""
-        for particle in self.particles:
-            particle.draw(screen, camera_x)
+        if self.pool is not None:
+            self.pool.draw(screen, camera_x)
+        else:
+            atlas, areas = ParticleAtlas.get_atlas()
+            width, height = screen.get_size()
+            blits = [particle.blit_args(atlas, areas, camera_x, width, height) for particle in self.particles]
+            screen.blits([args for args in blits if args is not None], doreturn=False)
 
     def clear(self):
         """Remove all particles (e.g., on level transition)."""
-        self.particles.clear()
+        if self.pool is not None:
+            self.pool.clear()
+        else:
+            self.particles.clear()
 
     def count(self):
         """Return number of active particles (for debugging)."""
+        if self.pool is not None:
+            return self.pool.active
         return len(self.particles)
@@ -0,0 +1,201 @@
+"""
+Platform Textures
+Pre-rendered brick textures for platforms, cached by style and size
+"""
+
+from collections import OrderedDict
+
+import pygame
+from src.core.config_loader import get_config
+from src.core.game_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Brick dimensions shared by every brick style
+BRICK_WIDTH = 32
+BRICK_HEIGHT = 16
+
+# Brick palettes: (base, top highlight, left highlight, shadow, outline)
+BRICK_STYLES = {
+    # Snowy/icy light blue-white bricks (Level 1 and default)
+    'brick': ((200, 220, 240), (240, 250, 255), (240, 250, 255), (120, 140, 170), (100, 120, 150)),
+    # Dark blue icy bricks (Level 3)
+    'icy_brick': ((50, 100, 150), (70, 120, 180), (70, 120, 180), (30, 70, 110), (20, 50, 90)),
+    # Pure white snow bricks (Level 2 ground)
+    'snowy': ((255, 255, 255), (255, 255, 255), (245, 250, 255), (220, 230, 240), (200, 210, 220)),
+    # Brown wooden bricks (Level 2 platforms)
+    'wooden': ((139, 90, 60), (180, 120, 80), (180, 120, 80), (80, 50, 30), (60, 40, 20)),
+}
+
+
+def paint_bricks(surface, draw_x, draw_y, width, height, style):
+    """
+    Paint a brick pattern into a rectangle of a surface
+
+    Odd rows are offset by half a brick, and every brick is clipped to the
+    rectangle, so the left end of odd rows is left unpainted.
+
+    Args:
+        surface: Surface to draw on
+        draw_x: Left edge of the rectangle on the surface
+        draw_y: Top edge of the rectangle on the surface
+        width: Rectangle width
+        height: Rectangle height
+        style: Key into BRICK_STYLES
+    """
+    brick_color, highlight_color, left_highlight_color, shadow_color, outline_color = BRICK_STYLES[style]
+    bounds = pygame.Rect(draw_x, draw_y, width, height)
+
+    # Calculate how many bricks fit
+    cols = (width // BRICK_WIDTH) + 1
+    rows = (height // BRICK_HEIGHT) + 1
+
+    for row in range(rows):
+        for col in range(cols):
+            # Offset every other row for brick pattern
+            x_offset = (BRICK_WIDTH // 2) if row % 2 == 1 else 0
+
+            brick_x = draw_x + (col * BRICK_WIDTH) + x_offset
+            brick_y = draw_y + (row * BRICK_HEIGHT)
+
+            # Only draw if brick is within platform bounds
+            if brick_x + BRICK_WIDTH < draw_x or brick_x > draw_x + width:
+                continue
+            if brick_y + BRICK_HEIGHT < draw_y or brick_y > draw_y + height:
+                continue
+
+            # Clip brick to platform boundaries
+            clip_rect = pygame.Rect(brick_x, brick_y, BRICK_WIDTH, BRICK_HEIGHT).clip(bounds)
+            if clip_rect.width <= 0 or clip_rect.height <= 0:
+                continue
+
+            # Main brick color
+            pygame.draw.rect(surface, brick_color, clip_rect)
+
+            # Top highlight
+            if clip_rect.height > 2:
+                pygame.draw.rect(surface, highlight_color, (clip_rect.x, clip_rect.y, clip_rect.width, 2))
+
+            # Left highlight
+            if clip_rect.width > 2:
+                pygame.draw.rect(surface, left_highlight_color, (clip_rect.x, clip_rect.y, 2, clip_rect.height))
+
+            # Bottom shadow
+            if clip_rect.height > 2:
+                pygame.draw.rect(surface, shadow_color, (clip_rect.x, clip_rect.bottom - 2, clip_rect.width, 2))
+
+            # Right shadow
+            if clip_rect.width > 2:
+                pygame.draw.rect(surface, shadow_color, (clip_rect.right - 2, clip_rect.y, 2, clip_rect.height))
+
+            # Brick outline
+            pygame.draw.rect(surface, outline_color, clip_rect, 1)
+
+
+class PlatformTextureCache:
+    """Caches one pre-rendered texture per (style, width, height) with LRU eviction"""
+
+    # key: (style, width, height), value: pygame.Surface (most recently used last)
+    _textures = OrderedDict()
+    _bytes = 0
+    _max_bytes = None
+    _hits = 0
+    _misses = 0
+
+    @classmethod
+    def get_max_bytes(cls):
+        """Memory budget for cached textures (rendering.platform_texture_cache_mb)"""
+        if cls._max_bytes is None:
+            cls._max_bytes = int(get_config().get('rendering.platform_texture_cache_mb', 32) * 1024 * 1024)
+        return cls._max_bytes
+
+    @classmethod
+    def get_texture(cls, style, width, height):
+        """
+        Get the texture for a platform, rendering and caching it if necessary
+
+        Args:
+            style: Key into BRICK_STYLES
+            width: Platform width in pixels
+            height: Platform height in pixels
+
+        Returns:
+            pygame.Surface: Per-pixel alpha texture (gaps in the brick pattern are transparent)
+        """
+        key = (style, width, height)
+        texture = cls._textures.get(key)
+        if texture is not None:
+            cls._textures.move_to_end(key)
+            cls._hits += 1
+            return texture
+
+        cls._misses += 1
+        texture = pygame.Surface((max(1, width), max(1, height)), pygame.SRCALPHA)
+        paint_bricks(texture, 0, 0, width, height, style)
+
+        cls._textures[key] = texture
+        cls._bytes += texture.get_bytesize() * texture.get_width() * texture.get_height()
+        cls._evict()
+        return texture
+
+    @classmethod
+    def _evict(cls):
+        """Drop least recently used textures until the cache fits its budget"""
+        max_bytes = cls.get_max_bytes()
+        while cls._bytes > max_bytes and len(cls._textures) > 1:
+            key, texture = cls._textures.popitem(last=False)
+            cls._bytes -= texture.get_bytesize() * texture.get_width() * texture.get_height()
+            logger.debug(f"Evicted platform texture {key}")
+
+    @classmethod
+    def draw(cls, screen, style, rect, camera_x):
+        """
+        Draw a platform with a cached texture
+
+        Args:
+            screen: Surface to draw on
+            style: Key into BRICK_STYLES
+            rect: Platform rectangle in world space
+            camera_x: Camera X offset
+        """
+        if rect.width <= 0 or rect.height <= 0:
+            return
+        screen.blit(cls.get_texture(style, rect.width, rect.height), (rect.x - camera_x, rect.y))
+
+    @classmethod
+    def prewarm(cls, style, rects):
+        """
+        Render textures for a set of platforms ahead of time (call at level load)
+
+        Args:
+            style: Key into BRICK_STYLES
+            rects: Platform rectangles that will be drawn with this style
+        """
+        for rect in rects:
+            if rect.width > 0 and rect.height > 0:
+                cls.get_texture(style, rect.width, rect.height)
+
+    @classmethod
+    def clear_cache(cls):
+        """Clear the texture cache (useful for testing or memory management)"""
+        cls._textures.clear()
+        cls._bytes = 0
+        cls._hits = 0
+        cls._misses = 0
+        logger.info("Platform texture cache cleared")
+
+    @classmethod
+    def get_cache_info(cls):
+        """
+        Get information about the texture cache
+
+        Returns:
+            dict: Cache statistics
+        """
+        return {
+            'size': len(cls._textures),
+            'bytes': cls._bytes,
+            'max_bytes': cls.get_max_bytes(),
+            'hits': cls._hits,
+            'misses': cls._misses,
+        }
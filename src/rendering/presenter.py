@@ -0,0 +1,123 @@
+"""
+Presenter
+Scales the fixed-size render surface onto the resizable window each frame
+"""
+
+import pygame
+
+from src.core.game_logging import get_logger
+from src.utils import settings as S
+
+logger = get_logger(__name__)
+
+# display.scaling options, cheapest first
+SCALING_MODES = ('integer', 'fit', 'smooth')
+
+
+class Presenter:
+    """
+    Copies the internal render surface to the display surface
+
+    pygame.transform.scale() without a destination allocates a new
+    window-sized surface every frame (1400x840 at display_scale 1.4). The
+    presenter scales straight into the display surface while the frame sits
+    still, and into one reused surface while screen shake offsets it; only
+    then (or after a resize) does the window need clearing to black.
+
+    Scaling modes (display.scaling):
+        integer: Nearest-neighbour at the largest whole factor that fits,
+            centred with black bars (falls back to fit below 1x)
+        fit: Nearest-neighbour stretched to fill the window
+        smooth: Filtered smoothscale to fill the window (slowest)
+    """
+
+    def __init__(self, scaling='fit'):
+        """
+        Args:
+            scaling: One of SCALING_MODES
+        """
+        if scaling not in SCALING_MODES:
+            logger.warning(f"Unknown display.scaling '{scaling}', using 'fit' (choose from {', '.join(SCALING_MODES)})")
+            scaling = 'fit'
+        self.scaling = scaling
+        self.scaled = None  # Reused scale destination for offset frames
+        self.direct = True  # Cleared if the display surface cannot be a scale destination
+        self._layout = None  # (window size, frame rect) the window was last cleared for
+        S.display_viewport = None  # Until the first frame, the mouse maps by current_display_scale
+
+    def frame_rect(self, window_size, render_size):
+        """
+        Get where the frame goes in the window for the scaling mode
+
+        Args:
+            window_size: (width, height) of the display surface
+            render_size: (width, height) of the render surface
+
+        Returns:
+            pygame.Rect: Scaled frame position and size in window pixels
+        """
+        window_width, window_height = window_size
+        render_width, render_height = render_size
+        if self.scaling == 'integer':
+            factor = min(window_width // render_width, window_height // render_height)
+            if factor >= 1:
+                width, height = render_width * factor, render_height * factor
+                return pygame.Rect((window_width - width) // 2, (window_height - height) // 2, width, height)
+        return pygame.Rect(0, 0, window_width, window_height)
+
+    def _scale(self, screen, dest):
+        """Scale the render surface into dest (which sets the size)"""
+        size = dest.get_size()
+        if self.scaling == 'smooth':
+            return pygame.transform.smoothscale(screen, size, dest)
+        if self.scaling == 'integer' and size[0] % screen.get_width() == 0:
+            return pygame.transform.scale_by(screen, size[0] // screen.get_width(), dest)
+        return pygame.transform.scale(screen, size, dest)
+
+    def _scaled_surface(self, screen, size):
+        """Get the reused destination, reallocated only when the frame size changes"""
+        if self.scaled is None or self.scaled.get_size() != size:
+            self.scaled = pygame.Surface(size, 0, screen)
+        return self.scaled
+
+    def present(self, display_screen, screen, offset=(0, 0)):
+        """
+        Draw the render surface scaled into the display surface
+
+        Also records the frame's position in S.display_viewport so mouse
+        positions can be mapped back with S.window_to_render().
+
+        Args:
+            display_screen: Window surface from pygame.display.set_mode
+            screen: Internal render surface (S.WINDOW_WIDTH x S.WINDOW_HEIGHT)
+            offset: Screen shake offset in window pixels
+        """
+        window_size = display_screen.get_size()
+        rect = self.frame_rect(window_size, screen.get_size())
+        S.display_viewport = (rect.x, rect.y, rect.width / screen.get_width())
+        shaking = offset != (0, 0)
+
+        # Black bars only need drawing once per layout; a shaking frame leaves gaps every time
+        # and draws over the bars, so the next still frame has to clear them again
+        layout = (window_size, tuple(rect))
+        if shaking or (layout != self._layout and rect.size != window_size):
+            display_screen.fill((0, 0, 0))
+        self._layout = None if shaking else layout
+        position = (rect.x + offset[0], rect.y + offset[1])
+
+        if rect.size == screen.get_size():
+            # Frame at 1x: no scaling needed
+            display_screen.blit(screen, position)
+            return
+
+        if not shaking and self.direct:
+            try:
+                dest = display_screen if rect.size == window_size else display_screen.subsurface(rect)
+                self._scale(screen, dest)
+                return
+            except ValueError as e:
+                # Display surface format differs from the render surface
+                logger.debug(f"Scaling into the display surface failed ({e}), using an offscreen surface")
+                self.direct = False
+
+        display_screen.blit(self._scale(screen, self._scaled_surface(screen, rect.size)), position)
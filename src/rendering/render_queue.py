@@ -0,0 +1,49 @@
+"""
+Render Queue
+Collects the sprite blits of a draw layer and submits them in one Surface.blits() call
+"""
+
+
+class RenderQueue:
+    """
+    Batches the blits of one draw layer
+
+    Every screen.blit() is a separate call into pygame; with many coins or
+    enemies on screen that per-call overhead outweighs the copying itself.
+    Queued (surface, dest) pairs are drawn by Surface.blits() in the order
+    they were added, so flushing a layer looks exactly like blitting each
+    sprite as it was queued.
+    """
+
+    def __init__(self):
+        self.blits = []
+        self.submitted = 0  # Sprites drawn through this queue (for profiling)
+
+    def add(self, surface, dest):
+        """
+        Queue one sprite
+
+        Args:
+            surface: Surface to draw
+            dest: Top-left screen position
+        """
+        self.blits.append((surface, dest))
+
+    def extend(self, blits):
+        """Queue (surface, dest) pairs in order"""
+        self.blits.extend(blits)
+
+    def flush(self, screen):
+        """
+        Draw everything queued and empty the queue
+
+        Args:
+            screen: Surface to draw on
+        """
+        if self.blits:
+            screen.blits(self.blits, doreturn=False)
+            self.submitted += len(self.blits)
+            self.blits.clear()
+
+    def __len__(self):
+        return len(self.blits)
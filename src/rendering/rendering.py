@@ -5,6 +5,9 @@ Contains all drawing functions for the game including screens, platforms, hazard
 
 import pygame
 from src.utils import settings as S
+from src.rendering.platform_textures import PlatformTextureCache
+from src.rendering.aurora import AuroraTextureCache
+from src.rendering.hazard_sprites import HazardSpriteCache
 
 
 def draw_level_complete_screen(screen, level_num, coins, time, username="Player", selected_button="continue"):
@@ -829,75 +832,8 @@ from src.core.audio_manager import AudioManager
 DISABLE_ALL_AUDIO = not S.MASTER_AUDIO_ENABLED
 
 def draw_spiky_hazard(screen, rect, camera_x):
-    """Draw an animated flame hazard using Fiyah.png sprite sheet"""
-    import time
-
-    draw_x = rect.x - camera_x
-    draw_y = rect.y
-
-    # Load fire sprite sheet (cache it to avoid reloading every frame)
-    if not hasattr(draw_spiky_hazard, 'fire_sheet'):
-        try:
-            # Load image and convert to format with alpha channel
-            fire_img = pygame.image.load("assets/images/objects/Fiyah.png").convert_alpha()
-
-            # Manually replace all gray pixels with transparency
-            width, height = fire_img.get_size()
-            for x in range(width):
-                for y in range(height):
-                    r, g, b, a = fire_img.get_at((x, y))
-                    # If pixel is gray (close to 165, 165, 165), make it transparent
-                    if abs(r - 165) < 10 and abs(g - 165) < 10 and abs(b - 165) < 10:
-                        fire_img.set_at((x, y), (r, g, b, 0))  # Set alpha to 0
-
-            draw_spiky_hazard.fire_sheet = fire_img
-        except Exception as e:
-            print(f"Could not load fire sprite: {e}")
-            draw_spiky_hazard.fire_sheet = None
-
-    fire_sheet = draw_spiky_hazard.fire_sheet
-
-    if fire_sheet:
-        # Sprite sheet has 6 frames: 3 on top row, 3 on bottom row
-        sheet_width = fire_sheet.get_width()
-        sheet_height = fire_sheet.get_height()
-
-        # Each frame is 1/3 of width and 1/2 of height
-        frame_width = sheet_width // 3
-        frame_height = sheet_height // 2
-
-        # Animate through the 6 frames
-        current_time = pygame.time.get_ticks()
-        frame_duration = 100  # milliseconds per frame
-        frame_index = (current_time // frame_duration) % 6
-
-        # Calculate which row and column
-        frame_row = frame_index // 3  # 0 for top row, 1 for bottom row
-        frame_col = frame_index % 3   # 0, 1, or 2
-
-        # Extract the current frame
-        frame_x = frame_col * frame_width
-        frame_y = frame_row * frame_height
-        frame = fire_sheet.subsurface((frame_x, frame_y, frame_width, frame_height))
-
-        # Scale frame to fit hazard height
-        scale_factor = rect.height / frame_height
-        scaled_width = int(frame_width * scale_factor)
-        scaled_height = rect.height
-        scaled_frame = pygame.transform.scale(frame, (scaled_width, scaled_height))
-
-        # Tile fire sprites across the hazard width
-        num_fires = (rect.width // scaled_width) + 1
-
-        for i in range(num_fires):
-            fire_x = draw_x + (i * scaled_width)
-
-            # Don't draw beyond the hazard bounds
-            if fire_x < draw_x + rect.width:
-                screen.blit(scaled_frame, (fire_x, draw_y))
-    else:
-        # Fallback: draw a simple red rectangle if image fails to load
-        pygame.draw.rect(screen, (255, 100, 0), (draw_x, draw_y, rect.width, rect.height))
+    """Draw an animated flame hazard using Fiyah.png sprite sheet (pre-tiled cached strips)"""
+    HazardSpriteCache.draw(screen, rect, camera_x)
 
     # ORIGINAL FIRE HAZARD CODE (commented out for easy restoration):
     # """Draw an animated fire hazard"""
@@ -989,328 +925,28 @@ def draw_spiky_hazard(screen, rect, camera_x):
 
 
 def draw_brick_platform(screen, rect, camera_x):
-    """Draw a snowy/icy brick platform with individual blocks"""
-    # Brick dimensions
-    brick_width = 32
-    brick_height = 16
-    
-    # Offset for camera
-    draw_x = rect.x - camera_x
-    draw_y = rect.y
-    
-    # Calculate how many bricks fit
-    cols = (rect.width // brick_width) + 1
-    rows = (rect.height // brick_height) + 1
-    
-    for row in range(rows):
-        for col in range(cols):
-            # Offset every other row for brick pattern
-            x_offset = (brick_width // 2) if row % 2 == 1 else 0
-            
-            brick_x = draw_x + (col * brick_width) + x_offset
-            brick_y = draw_y + (row * brick_height)
-            
-            # Only draw if brick is within platform bounds and on screen
-            if brick_x + brick_width < draw_x or brick_x > draw_x + rect.width:
-                continue
-            if brick_y + brick_height < draw_y or brick_y > draw_y + rect.height:
-                continue
-            
-            # Clip brick to platform boundaries
-            brick_rect = pygame.Rect(brick_x, brick_y, brick_width, brick_height)
-            clip_rect = brick_rect.clip(pygame.Rect(draw_x, draw_y, rect.width, rect.height))
-            
-            if clip_rect.width <= 0 or clip_rect.height <= 0:
-                continue
-            
-            # Draw snowy/icy brick with shading for 3D effect
-            # Main brick color (light blue-white ice)
-            brick_color = (200, 220, 240)  # Icy blue-white
-            pygame.draw.rect(screen, brick_color, clip_rect)
-            
-            # Top highlight (bright white snow/ice)
-            highlight_color = (240, 250, 255)  # Almost pure white
-            if clip_rect.height > 2:
-                pygame.draw.rect(screen, highlight_color, (clip_rect.x, clip_rect.y, clip_rect.width, 2))
-            
-            # Left highlight
-            if clip_rect.width > 2:
-                pygame.draw.rect(screen, highlight_color, (clip_rect.x, clip_rect.y, 2, clip_rect.height))
-            
-            # Bottom shadow (darker blue-grey)
-            shadow_color = (120, 140, 170)  # Cool shadow
-            if clip_rect.height > 2:
-                pygame.draw.rect(screen, shadow_color, (clip_rect.x, clip_rect.bottom - 2, clip_rect.width, 2))
-            
-            # Right shadow
-            if clip_rect.width > 2:
-                pygame.draw.rect(screen, shadow_color, (clip_rect.right - 2, clip_rect.y, 2, clip_rect.height))
-            
-            # Brick outline (medium blue-grey for icy definition)
-            pygame.draw.rect(screen, (100, 120, 150), clip_rect, 1)
+    """Draw a snowy/icy brick platform with individual blocks (pre-rendered and cached per size)"""
+    PlatformTextureCache.draw(screen, 'brick', rect, camera_x)
 
 
 def draw_icy_brick_platform(screen, rect, camera_x):
-    """Draw a dark blue icy brick platform with individual blocks"""
-    # Brick dimensions
-    brick_width = 32
-    brick_height = 16
-
-    # Offset for camera
-    draw_x = rect.x - camera_x
-    draw_y = rect.y
-
-    # Calculate how many bricks fit
-    cols = (rect.width // brick_width) + 1
-    rows = (rect.height // brick_height) + 1
-
-    for row in range(rows):
-        for col in range(cols):
-            # Offset every other row for brick pattern
-            x_offset = (brick_width // 2) if row % 2 == 1 else 0
-
-            brick_x = draw_x + (col * brick_width) + x_offset
-            brick_y = draw_y + (row * brick_height)
-
-            # Only draw if brick is within platform bounds and on screen
-            if brick_x + brick_width < draw_x or brick_x > draw_x + rect.width:
-                continue
-            if brick_y + brick_height < draw_y or brick_y > draw_y + rect.height:
-                continue
-
-            # Clip brick to platform boundaries
-            brick_rect = pygame.Rect(brick_x, brick_y, brick_width, brick_height)
-            clip_rect = brick_rect.clip(pygame.Rect(draw_x, draw_y, rect.width, rect.height))
-
-            if clip_rect.width <= 0 or clip_rect.height <= 0:
-                continue
-
-            # Draw dark blue icy brick with shading for 3D effect
-            # Main brick color (dark blue ice)
-            brick_color = (50, 100, 150)  # Dark blue ice
-            pygame.draw.rect(screen, brick_color, clip_rect)
-
-            # Top highlight (lighter blue)
-            highlight_color = (70, 120, 180)  # Lighter blue highlight
-            if clip_rect.height > 2:
-                pygame.draw.rect(screen, highlight_color, (clip_rect.x, clip_rect.y, clip_rect.width, 2))
-
-            # Left highlight
-            if clip_rect.width > 2:
-                pygame.draw.rect(screen, highlight_color, (clip_rect.x, clip_rect.y, 2, clip_rect.height))
-
-            # Bottom shadow (darker blue)
-            shadow_color = (30, 70, 110)  # Very dark blue shadow
-            if clip_rect.height > 2:
-                pygame.draw.rect(screen, shadow_color, (clip_rect.x, clip_rect.bottom - 2, clip_rect.width, 2))
-
-            # Right shadow
-            if clip_rect.width > 2:
-                pygame.draw.rect(screen, shadow_color, (clip_rect.right - 2, clip_rect.y, 2, clip_rect.height))
-
-            # Brick outline (deep blue for definition)
-            pygame.draw.rect(screen, (20, 50, 90), clip_rect, 1)
+    """Draw a dark blue icy brick platform with individual blocks (pre-rendered and cached per size)"""
+    PlatformTextureCache.draw(screen, 'icy_brick', rect, camera_x)
 
 
 def draw_northern_lights_ground(screen, rect, camera_x):
-    """Draw glowing northern lights ground with animated aurora colors"""
-    import math
-
-    # Brick dimensions
-    brick_width = 32
-    brick_height = 16
-
-    # Offset for camera
-    draw_x = rect.x - camera_x
-    draw_y = rect.y
-
-    # Calculate how many bricks fit
-    cols = (rect.width // brick_width) + 1
-    rows = (rect.height // brick_height) + 1
-
-    # Animated color cycle based on time
-    time = pygame.time.get_ticks() / 1000.0  # Time in seconds
-
-    for row in range(rows):
-        for col in range(cols):
-            # Offset every other row for brick pattern
-            x_offset = (brick_width // 2) if row % 2 == 1 else 0
-
-            brick_x = draw_x + (col * brick_width) + x_offset
-            brick_y = draw_y + (row * brick_height)
-
-            # Only draw if brick is within platform bounds and on screen
-            if brick_x + brick_width < draw_x or brick_x > draw_x + rect.width:
-                continue
-            if brick_y + brick_height < draw_y or brick_y > draw_y + rect.height:
-                continue
-
-            # Clip brick to platform boundaries
-            brick_rect = pygame.Rect(brick_x, brick_y, brick_width, brick_height)
-            clip_rect = brick_rect.clip(pygame.Rect(draw_x, draw_y, rect.width, rect.height))
-
-            if clip_rect.width <= 0 or clip_rect.height <= 0:
-                continue
-
-            # Create animated aurora colors (green/purple/blue)
-            # Use position and time for wave effect
-            phase = (col * 0.3 + row * 0.2 + time * 0.8) % 1.0
-
-            if phase < 0.33:
-                # Green aurora
-                r = int(50 + phase * 300)
-                g = int(150 + math.sin(phase * math.pi) * 80)
-                b = int(100 + phase * 100)
-            elif phase < 0.66:
-                # Purple aurora
-                adjusted_phase = (phase - 0.33) * 3
-                r = int(120 + math.sin(adjusted_phase * math.pi) * 80)
-                g = int(50 + adjusted_phase * 100)
-                b = int(150 + math.sin(adjusted_phase * math.pi) * 80)
-            else:
-                # Blue aurora
-                adjusted_phase = (phase - 0.66) * 3
-                r = int(50 + adjusted_phase * 80)
-                g = int(100 + adjusted_phase * 100)
-                b = int(180 + math.sin(adjusted_phase * math.pi) * 70)
-
-            # Clamp values
-            brick_color = (min(255, max(0, r)), min(255, max(0, g)), min(255, max(0, b)))
-            pygame.draw.rect(screen, brick_color, clip_rect)
-
-            # Add glow effect (lighter center)
-            glow_color = (min(255, r + 40), min(255, g + 40), min(255, b + 40))
-            if clip_rect.width > 4 and clip_rect.height > 4:
-                glow_rect = pygame.Rect(clip_rect.x + 2, clip_rect.y + 2, clip_rect.width - 4, clip_rect.height - 4)
-                pygame.draw.rect(screen, glow_color, glow_rect)
-
-            # Subtle brick outline
-            outline_color = (max(0, r - 30), max(0, g - 30), max(0, b - 30))
-            pygame.draw.rect(screen, outline_color, clip_rect, 1)
+    """Draw glowing northern lights ground with animated aurora colors (palette-cycled cached texture)"""
+    AuroraTextureCache.draw(screen, rect, camera_x)
 
 
 def draw_snowy_ground(screen, rect, camera_x):
-    """Draw snowy ground blocks with brick texture"""
-    # Brick dimensions
-    brick_width = 32
-    brick_height = 16
-
-    # Offset for camera
-    draw_x = rect.x - camera_x
-    draw_y = rect.y
-
-    # Calculate how many bricks fit
-    cols = (rect.width // brick_width) + 1
-    rows = (rect.height // brick_height) + 1
-
-    for row in range(rows):
-        for col in range(cols):
-            # Offset every other row for brick pattern
-            x_offset = (brick_width // 2) if row % 2 == 1 else 0
-
-            brick_x = draw_x + (col * brick_width) + x_offset
-            brick_y = draw_y + (row * brick_height)
-
-            # Only draw if brick is within platform bounds and on screen
-            if brick_x + brick_width < draw_x or brick_x > draw_x + rect.width:
-                continue
-            if brick_y + brick_height < draw_y or brick_y > draw_y + rect.height:
-                continue
-
-            # Clip brick to platform boundaries
-            brick_rect = pygame.Rect(brick_x, brick_y, brick_width, brick_height)
-            clip_rect = brick_rect.clip(pygame.Rect(draw_x, draw_y, rect.width, rect.height))
-
-            if clip_rect.width <= 0 or clip_rect.height <= 0:
-                continue
-
-            # Draw snowy white brick with shading
-            # Main brick color (pure white snow)
-            brick_color = (255, 255, 255)
-            pygame.draw.rect(screen, brick_color, clip_rect)
-            
-            # Top highlight (bright sparkly snow)
-            highlight_color = (255, 255, 255)
-            if clip_rect.height > 2:
-                pygame.draw.rect(screen, highlight_color, (clip_rect.x, clip_rect.y, clip_rect.width, 2))
-            
-            # Left highlight (bright)
-            if clip_rect.width > 2:
-                pygame.draw.rect(screen, (245, 250, 255), (clip_rect.x, clip_rect.y, 2, clip_rect.height))
-            
-            # Bottom shadow (light blue-grey snow shadow)
-            shadow_color = (220, 230, 240)
-            if clip_rect.height > 2:
-                pygame.draw.rect(screen, shadow_color, (clip_rect.x, clip_rect.bottom - 2, clip_rect.width, 2))
-            
-            # Right shadow
-            if clip_rect.width > 2:
-                pygame.draw.rect(screen, shadow_color, (clip_rect.right - 2, clip_rect.y, 2, clip_rect.height))
-            
-            # Brick outline (light grey for snow definition)
-            pygame.draw.rect(screen, (200, 210, 220), clip_rect, 1)
+    """Draw snowy ground blocks with brick texture (pre-rendered and cached per size)"""
+    PlatformTextureCache.draw(screen, 'snowy', rect, camera_x)
 
 
 def draw_wooden_platform(screen, rect, camera_x):
-    """Draw wooden platforms with brick texture"""
-    # Brick dimensions
-    brick_width = 32
-    brick_height = 16
-    
-    # Offset for camera
-    draw_x = rect.x - camera_x
-    draw_y = rect.y
-    
-    # Calculate how many bricks fit
-    cols = (rect.width // brick_width) + 1
-    rows = (rect.height // brick_height) + 1
-    
-    for row in range(rows):
-        for col in range(cols):
-            # Offset every other row for brick pattern
-            x_offset = (brick_width // 2) if row % 2 == 1 else 0
-            
-            brick_x = draw_x + (col * brick_width) + x_offset
-            brick_y = draw_y + (row * brick_height)
-            
-            # Only draw if brick is within platform bounds and on screen
-            if brick_x + brick_width < draw_x or brick_x > draw_x + rect.width:
-                continue
-            if brick_y + brick_height < draw_y or brick_y > draw_y + rect.height:
-                continue
-            
-            # Clip brick to platform boundaries
-            brick_rect = pygame.Rect(brick_x, brick_y, brick_width, brick_height)
-            clip_rect = brick_rect.clip(pygame.Rect(draw_x, draw_y, rect.width, rect.height))
-            
-            if clip_rect.width <= 0 or clip_rect.height <= 0:
-                continue
-            
-            # Draw wooden brick with shading
-            # Main brick color (brown wood)
-            brick_color = (139, 90, 60)  # Medium brown wood
-            pygame.draw.rect(screen, brick_color, clip_rect)
-            
-            # Top highlight (lighter brown)
-            highlight_color = (180, 120, 80)
-            if clip_rect.height > 2:
-                pygame.draw.rect(screen, highlight_color, (clip_rect.x, clip_rect.y, clip_rect.width, 2))
-            
-            # Left highlight
-            if clip_rect.width > 2:
-                pygame.draw.rect(screen, highlight_color, (clip_rect.x, clip_rect.y, 2, clip_rect.height))
-            
-            # Bottom shadow (dark brown)
-            shadow_color = (80, 50, 30)
-            if clip_rect.height > 2:
-                pygame.draw.rect(screen, shadow_color, (clip_rect.x, clip_rect.bottom - 2, clip_rect.width, 2))
-            
-            # Right shadow
-            if clip_rect.width > 2:
-                pygame.draw.rect(screen, shadow_color, (clip_rect.right - 2, clip_rect.y, 2, clip_rect.height))
-            
-            # Brick outline (dark brown)
-            pygame.draw.rect(screen, (60, 40, 20), clip_rect, 1)
+    """Draw wooden platforms with brick texture (pre-rendered and cached per size)"""
+    PlatformTextureCache.draw(screen, 'wooden', rect, camera_x)
 
 
 def draw_death_screen(screen):
@@ -1338,92 +974,6 @@ def draw_death_screen(screen):
     screen.blit(text1, text1_rect)
     screen.blit(text2, text2_rect)
 
-def draw_game_hud(screen, coins_collected, level_time, world_name, difficulty="Medium", coins_still_needed=0, coins_remaining_in_level=0, distance_to_goal=0, max_distance=5500):
-    """Draw the top HUD with coins, world, and time like Super Mario"""
-    # Load Fixedsys font
-    try:
-        font = pygame.font.Font("assets/fonts/Fixedsys500c.ttf", 24)
-        small_font = pygame.font.Font("assets/fonts/Fixedsys500c.ttf", 18)
-    except:
-        try:
-            font = pygame.font.SysFont('arial', 36, bold=True)
-            small_font = pygame.font.SysFont('arial', 24, bold=True)
-        except:
-            font = pygame.font.Font(None, 36)
-            small_font = pygame.font.Font(None, 24)
-
-    # Calculate time in seconds
-    time_seconds = level_time // 60
-
-    # Use white text for levels 2 and 4 due to dark/snowy backgrounds
-    text_color = (255, 255, 255) if world_name in ["1-2", "1-4"] else (0, 0, 0)
-
-    # Create HUD text
-    coins_text = font.render(f"COINS", True, text_color)
-    coins_value = font.render(f"{coins_collected}", True, text_color)
-
-    world_text = font.render(f"WORLD", True, text_color)
-    world_value = font.render(f"{world_name}", True, text_color)
-
-    time_text = font.render(f"TIME", True, text_color)
-    time_value = font.render(f"{time_seconds}", True, text_color)
-
-    # Position HUD elements - adjusted to accommodate hearts while keeping TIME visible
-    screen_width = S.WINDOW_WIDTH
-
-    # Left-center section - COINS (moved a bit more right)
-    coins_label_x = screen_width // 2 - 30
-    screen.blit(coins_text, (coins_label_x, 10))
-    # Center the value under the label
-    coins_value_x = coins_label_x + (coins_text.get_width() - coins_value.get_width()) // 2
-    screen.blit(coins_value, (coins_value_x, 40))
-
-    # Center section - WORLD (moved a bit more right)
-    world_label_x = screen_width // 2 + 170
-    screen.blit(world_text, (world_label_x, 10))
-    # Center the value under the label
-    world_value_x = world_label_x + (world_text.get_width() - world_value.get_width()) // 2
-    screen.blit(world_value, (world_value_x, 40))
-
-    # Right-center section - TIME (moved a few pixels left)
-    time_label_x = screen_width // 2 + 340
-    screen.blit(time_text, (time_label_x, 10))
-    # Center the value under the label
-    time_value_x = time_label_x + (time_text.get_width() - time_value.get_width()) // 2
-    screen.blit(time_value, (time_value_x, 40))
-
-    # Difficulty and coins needed (top left, below hearts)
-    difficulty_text = small_font.render(f"Difficulty: {difficulty.upper()}", True, text_color)
-    screen.blit(difficulty_text, (20, 75))
-
-    # Coins needed on second line - color based on goal completion
-    if coins_still_needed > 0:
-        coins_needed_color = (255, 50, 50)  # Red - goal not reached
-    else:
-        coins_needed_color = (50, 255, 50)  # Green - goal reached
-
-    coins_needed_text = small_font.render(f"Coins Needed: {coins_still_needed}/{coins_remaining_in_level}", True, coins_needed_color)
-    screen.blit(coins_needed_text, (20, 95))
-
-    # Distance to finish on third line with color gradient (red -> yellow -> green)
-    # Calculate color based on distance (0% = green, 100% = red)
-    distance_ratio = min(1.0, distance_to_goal / max_distance) if max_distance > 0 else 0
-
-    if distance_ratio > 0.5:
-        # Red to Yellow transition (far away)
-        # distance_ratio: 0.5 to 1.0 -> red to yellow
-        t = (distance_ratio - 0.5) * 2  # 0.0 to 1.0
-        distance_color = (255, int(255 * (1 - t)), 0)  # Red to Yellow
-    else:
-        # Yellow to Green transition (getting close)
-        # distance_ratio: 0.0 to 0.5 -> green to yellow
-        t = distance_ratio * 2  # 0.0 to 1.0
-        distance_color = (int(255 * t), 255, 0)  # Green to Yellow
-
-    distance_text = small_font.render(f"{distance_to_goal}m to finish", True, distance_color)
-    screen.blit(distance_text, (20, 115))
-
-
 def draw_debug_coordinates(screen, player, platforms, camera_x, camera_y):
     """Draw coordinate indicators for the player and nearby platforms for debugging"""
     try:
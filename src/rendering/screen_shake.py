@@ -10,6 +10,9 @@ Used for:
 
 import random
 
+# Separate generator: shaking must not consume the global random numbers used by enemy AI
+_rng = random.Random()
+
 
 class ScreenShake:
     """Manages screen shake effects with intensity and duration."""
@@ -38,8 +41,8 @@ class ScreenShake:
             self.duration -= 1
 
             # Generate random offset based on intensity
-            self.offset_x = random.randint(-self.intensity, self.intensity)
-            self.offset_y = random.randint(-self.intensity, self.intensity)
+            self.offset_x = _rng.randint(-self.intensity, self.intensity)
+            self.offset_y = _rng.randint(-self.intensity, self.intensity)
 
             # Reduce intensity over time for smoother end
             if self.duration < 5:
@@ -0,0 +1,148 @@
+"""
+Static Layer
+Bakes static level platforms into fixed-width chunk surfaces that scroll with the camera
+"""
+
+from collections import OrderedDict
+
+import pygame
+from src.core.config_loader import get_config
+from src.core.game_logging import get_logger
+from src.rendering.culling import CullingIndex
+from src.rendering.platform_textures import PlatformTextureCache
+
+logger = get_logger(__name__)
+
+
+class StaticLayerRenderer:
+    """
+    Draws a level's static platforms from pre-baked chunk surfaces
+
+    The level is split into vertical strips (rendering.static_chunk_width
+    pixels wide). A strip is baked the first time the camera comes near it,
+    so each frame blits one or two chunk surfaces no matter how many
+    platforms the level has. Chunks away from the camera are evicted when
+    the layer goes over rendering.static_layer_cache_mb.
+    """
+
+    def __init__(self, platforms, view_width, view_height, chunk_width=None, max_bytes=None):
+        """
+        Set up the layer (nothing is baked until the camera approaches)
+
+        Args:
+            platforms: List of (style, rect) pairs in draw order, style is a key into BRICK_STYLES
+            view_width: Width of the view in world pixels
+            view_height: Height of the view (chunk surfaces are this tall)
+            chunk_width: Chunk width in pixels (defaults to rendering.static_chunk_width)
+            max_bytes: Memory budget for baked chunks (defaults to rendering.static_layer_cache_mb)
+        """
+        config = get_config()
+        if chunk_width is None:
+            chunk_width = config.get('rendering.static_chunk_width', 1024)
+        if max_bytes is None:
+            max_bytes = int(config.get('rendering.static_layer_cache_mb', 16) * 1024 * 1024)
+
+        self.index = CullingIndex(platforms, rect_of=lambda platform: platform[1])
+        self.view_width = view_width
+        self.view_height = view_height
+        self.chunk_width = max(1, int(chunk_width))
+        self.max_bytes = max_bytes
+
+        # key: chunk number, value: pygame.Surface or None for empty chunks (most recently used last)
+        self.chunks = OrderedDict()
+        self.bytes = 0
+        self.bakes = 0
+        self.evictions = 0
+
+    def _bake(self, chunk):
+        """Render every platform overlapping a chunk into a new surface"""
+        chunk_left = chunk * self.chunk_width
+        platforms = self.index.query(chunk_left, chunk_left + self.chunk_width - 1)
+        self.bakes += 1
+        if not platforms:
+            return None
+
+        surface = pygame.Surface((self.chunk_width, self.view_height), pygame.SRCALPHA)
+        for style, rect in platforms:
+            if rect.width > 0 and rect.height > 0:
+                texture = PlatformTextureCache.get_texture(style, rect.width, rect.height)
+                surface.blit(texture, (rect.x - chunk_left, rect.y))
+        return surface
+
+    def _get_chunk(self, chunk):
+        """Get a chunk surface, baking it if necessary"""
+        if chunk in self.chunks:
+            self.chunks.move_to_end(chunk)
+            return self.chunks[chunk]
+
+        surface = self._bake(chunk)
+        self.chunks[chunk] = surface
+        if surface is not None:
+            self.bytes += surface.get_bytesize() * surface.get_width() * surface.get_height()
+        return surface
+
+    def _evict(self, first, last):
+        """Drop chunks furthest from the view until the layer fits its budget"""
+        if self.bytes <= self.max_bytes:
+            return
+        for chunk in sorted(self.chunks, key=lambda c: -max(first - c, c - last)):
+            if self.bytes <= self.max_bytes or first <= chunk <= last:
+                break
+            surface = self.chunks.pop(chunk)
+            if surface is not None:
+                self.bytes -= surface.get_bytesize() * surface.get_width() * surface.get_height()
+                self.evictions += 1
+                logger.debug(f"Evicted static layer chunk {chunk}")
+
+    def draw(self, screen, camera_x):
+        """
+        Draw the visible part of the layer
+
+        Also bakes the next chunk ahead of the view so it is ready before it scrolls in.
+
+        Args:
+            screen: Surface to draw on
+            camera_x: Camera X offset
+
+        Returns:
+            int: Number of chunk surfaces blitted
+        """
+        camera_x = int(camera_x)
+        first = camera_x // self.chunk_width
+        last = (camera_x + self.view_width - 1) // self.chunk_width
+
+        drawn = 0
+        for chunk in range(first, last + 1):
+            surface = self._get_chunk(chunk)
+            if surface is not None:
+                screen.blit(surface, (chunk * self.chunk_width - camera_x, 0))
+                drawn += 1
+
+        # Bake at most one chunk per frame on the side the camera is approaching
+        for ahead in (last + 1, first - 1):
+            if ahead not in self.chunks:
+                self._get_chunk(ahead)
+                break
+
+        self._evict(first - 1, last + 1)
+        return drawn
+
+    def clear(self):
+        """Drop every baked chunk"""
+        self.chunks.clear()
+        self.bytes = 0
+
+    def get_cache_info(self):
+        """
+        Get information about the baked chunks
+
+        Returns:
+            dict: Layer statistics
+        """
+        return {
+            'chunks': sum(1 for surface in self.chunks.values() if surface is not None),
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+            'bakes': self.bakes,
+            'evictions': self.evictions,
+        }
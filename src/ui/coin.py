@@ -1,4 +1,5 @@
 import pygame
+from src.core.sprite_cache import SpriteSheetCache
 
 class Coin(pygame.sprite.Sprite):
     """Collectible coin that animates and can be picked up by the player"""
@@ -37,21 +38,7 @@ class Coin(pygame.sprite.Sprite):
     
     def load_sprite_sheet(self, path, frame_count, target_size=(40, 40)):
         """Load and split a horizontal sprite sheet into frames"""
-        sheet = pygame.image.load(path).convert_alpha()
-        sheet_width, sheet_height = sheet.get_size()
-        frame_width = sheet_width // frame_count
-        
-        frames = []
-        for i in range(frame_count):
-            # Extract frame from sheet
-            frame = pygame.Surface((frame_width, sheet_height), pygame.SRCALPHA)
-            frame.blit(sheet, (0, 0), (i * frame_width, 0, frame_width, sheet_height))
-            
-            # Scale to target size
-            scaled = pygame.transform.scale(frame, target_size)
-            frames.append(scaled)
-        
-        return frames
+        return SpriteSheetCache.get_frames(path, frame_count, target_size)
     
     def create_fallback_sprite(self):
         """Create a simple fallback coin sprite"""
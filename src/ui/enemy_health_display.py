@@ -40,8 +40,20 @@ class EnemyHealthDisplay:
             enemy: enemy sprite with health and max_health attributes
             camera_x: camera offset for scrolling
         """
+        screen.blits(self.heart_blits(enemy, camera_x), doreturn=False)
+
+    def heart_blits(self, enemy, camera_x):
+        """Get the hearts above an enemy as blits, for batching with other sprites
+        
+        Args:
+            enemy: enemy sprite with health and max_health attributes
+            camera_x: camera offset for scrolling
+        
+        Returns:
+            list: (surface, (x, y)) pairs in draw order (empty for dead enemies)
+        """
         if enemy.is_dead:
-            return  # Don't show health for dead enemies
+            return []  # Don't show health for dead enemies
         
         # Get enemy's max health (or default to current health if no max_health)
         max_health = getattr(enemy, 'max_health', enemy.health)
@@ -56,14 +68,9 @@ class EnemyHealthDisplay:
         start_x = int(enemy.hitbox.centerx - (total_width / 2.0) - camera_x)
         start_y = int(enemy.hitbox.top - 28)
         
-        # Draw hearts
-        for i in range(max_health):
-            x = int(start_x + (i * (heart_size + heart_spacing)))
-            y = start_y
-            
-            if i < current_health:
-                # Full heart
-                screen.blit(self.heart_full, (x, y))
-            else:
-                # Empty heart
-                screen.blit(self.heart_empty, (x, y))
\ No newline at end of file
+        # Full hearts first, then empty ones
+        return [
+            (self.heart_full if i < current_health else self.heart_empty,
+             (int(start_x + (i * (heart_size + heart_spacing))), start_y))
+            for i in range(max_health)
+        ]
@@ -0,0 +1,135 @@
+"""
+Game HUD
+Top-of-screen level HUD (coins, world, time, difficulty, coins needed, distance) with cached text
+"""
+
+from collections import OrderedDict
+
+from src.core.font_manager import FontManager
+from src.utils import settings as S
+
+
+class GameHUD:
+    """
+    Draws the in-level HUD like Super Mario
+
+    Fonts come from FontManager (loaded once per process), and every
+    rendered string is cached by (text, colour, size), so labels render once
+    and values only render again when they change. The cache is bounded so
+    a long level's ever-changing timer and distance don't grow it forever.
+    """
+
+    LARGE_SIZE = 24
+    SMALL_SIZE = 18
+    MAX_CACHED_TEXT = 256
+
+    def __init__(self):
+        self.fonts = {
+            self.LARGE_SIZE: FontManager.get_fixedsys(self.LARGE_SIZE),
+            self.SMALL_SIZE: FontManager.get_fixedsys(self.SMALL_SIZE),
+        }
+        self._text_cache = OrderedDict()  # (text, color, size) -> Surface, least recently used first
+        self.text_renders = 0
+
+    def render_text(self, text, color, size):
+        """
+        Get a rendered text surface, rendering it only on first use
+
+        Args:
+            text: String to draw
+            color: RGB tuple
+            size: LARGE_SIZE or SMALL_SIZE
+
+        Returns:
+            pygame.Surface: Antialiased text
+        """
+        key = (text, color, size)
+        cache = self._text_cache
+        surface = cache.get(key)
+        if surface is None:
+            surface = self.fonts[size].render(text, True, color)
+            self.text_renders += 1
+            cache[key] = surface
+            if len(cache) > self.MAX_CACHED_TEXT:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return surface
+
+    def draw(self, screen, coins_collected, level_time, world_name, difficulty="Medium", coins_still_needed=0,
+             coins_remaining_in_level=0, distance_to_goal=0, max_distance=5500):
+        """Draw the top HUD with coins, world, and time"""
+        large = self.LARGE_SIZE
+        small = self.SMALL_SIZE
+
+        # Calculate time in seconds
+        time_seconds = level_time // 60
+
+        # Use white text for levels 2 and 4 due to dark/snowy backgrounds
+        text_color = (255, 255, 255) if world_name in ["1-2", "1-4"] else (0, 0, 0)
+
+        # Create HUD text
+        coins_text = self.render_text("COINS", text_color, large)
+        coins_value = self.render_text(f"{coins_collected}", text_color, large)
+
+        world_text = self.render_text("WORLD", text_color, large)
+        world_value = self.render_text(f"{world_name}", text_color, large)
+
+        time_text = self.render_text("TIME", text_color, large)
+        time_value = self.render_text(f"{time_seconds}", text_color, large)
+
+        # Position HUD elements - adjusted to accommodate hearts while keeping TIME visible
+        screen_width = S.WINDOW_WIDTH
+
+        # Left-center section - COINS (moved a bit more right)
+        coins_label_x = screen_width // 2 - 30
+        screen.blit(coins_text, (coins_label_x, 10))
+        # Center the value under the label
+        coins_value_x = coins_label_x + (coins_text.get_width() - coins_value.get_width()) // 2
+        screen.blit(coins_value, (coins_value_x, 40))
+
+        # Center section - WORLD (moved a bit more right)
+        world_label_x = screen_width // 2 + 170
+        screen.blit(world_text, (world_label_x, 10))
+        # Center the value under the label
+        world_value_x = world_label_x + (world_text.get_width() - world_value.get_width()) // 2
+        screen.blit(world_value, (world_value_x, 40))
+
+        # Right-center section - TIME (moved a few pixels left)
+        time_label_x = screen_width // 2 + 340
+        screen.blit(time_text, (time_label_x, 10))
+        # Center the value under the label
+        time_value_x = time_label_x + (time_text.get_width() - time_value.get_width()) // 2
+        screen.blit(time_value, (time_value_x, 40))
+
+        # Difficulty and coins needed (top left, below hearts)
+        difficulty_text = self.render_text(f"Difficulty: {difficulty.upper()}", text_color, small)
+        screen.blit(difficulty_text, (20, 75))
+
+        # Coins needed on second line - color based on goal completion
+        if coins_still_needed > 0:
+            coins_needed_color = (255, 50, 50)  # Red - goal not reached
+        else:
+            coins_needed_color = (50, 255, 50)  # Green - goal reached
+
+        coins_needed_text = self.render_text(f"Coins Needed: {coins_still_needed}/{coins_remaining_in_level}",
+                                             coins_needed_color, small)
+        screen.blit(coins_needed_text, (20, 95))
+
+        # Distance to finish on third line with color gradient (red -> yellow -> green)
+        # Calculate color based on distance (0% = green, 100% = red)
+        distance_ratio = min(1.0, distance_to_goal / max_distance) if max_distance > 0 else 0
+
+        if distance_ratio > 0.5:
+            # Red to Yellow transition (far away)
+            # distance_ratio: 0.5 to 1.0 -> red to yellow
+            t = (distance_ratio - 0.5) * 2  # 0.0 to 1.0
+            distance_color = (255, int(255 * (1 - t)), 0)  # Red to Yellow
+        else:
+            # Yellow to Green transition (getting close)
+            # distance_ratio: 0.0 to 0.5 -> green to yellow
+            t = distance_ratio * 2  # 0.0 to 1.0
+            distance_color = (int(255 * t), 255, 0)  # Green to Yellow
+
+        distance_text = self.render_text(f"{distance_to_goal}m to finish", distance_color, small)
+        screen.blit(distance_text, (20, 115))
@@ -0,0 +1,51 @@
+"""
+HUD Layer
+Retained screen-space HUD (hearts and level HUD) recomposed only when its contents change
+"""
+
+import pygame
+from src.utils import settings as S
+
+
+class HUDLayer:
+    """
+    Keeps the hearts and the level HUD on one transparent surface
+
+    Each frame the values shown are compared with the last composed ones;
+    only when something changed (health, coin count, the timer's second,
+    distance, ...) is the surface cleared and redrawn. Every other frame
+    costs a single blit. The HUD has to fit in the top HEIGHT pixels.
+    """
+
+    HEIGHT = 140
+
+    def __init__(self, health_ui, game_hud):
+        """
+        Args:
+            health_ui: HealthDisplay drawn into the layer
+            game_hud: GameHUD drawn into the layer
+        """
+        self.health_ui = health_ui
+        self.game_hud = game_hud
+        self.surface = pygame.Surface((S.WINDOW_WIDTH, self.HEIGHT), pygame.SRCALPHA)
+        self._shown = None  # Values the surface currently shows
+        self.recomposes = 0
+
+    def mark_dirty(self):
+        """Force a redraw on the next frame"""
+        self._shown = None
+
+    def draw(self, screen, health, max_health, coins_collected, level_time, world_name, difficulty,
+             coins_still_needed, coins_remaining_in_level, distance_to_goal, max_distance):
+        """Recompose the layer if any shown value changed, then blit it"""
+        shown = (health, max_health, coins_collected, level_time // 60, world_name, difficulty,
+                 coins_still_needed, coins_remaining_in_level, distance_to_goal, max_distance)
+        if shown != self._shown:
+            self._shown = shown
+            self.recomposes += 1
+            surface = self.surface
+            surface.fill((0, 0, 0, 0))
+            self.health_ui.draw(surface, health, max_health)
+            self.game_hud.draw(surface, coins_collected, level_time, world_name, difficulty, coins_still_needed,
+                               coins_remaining_in_level, distance_to_goal, max_distance)
+        screen.blit(self.surface, (0, 0))
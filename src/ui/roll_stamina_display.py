@@ -1,4 +1,5 @@
 import pygame
+from src.core.font_manager import FontManager
 
 class RollStaminaDisplay:
     """Displays the player's roll stamina as a bar above their head"""
@@ -20,6 +21,10 @@ class RollStaminaDisplay:
         self.fade_duration = 120  # Show for 2 seconds after stamina changes
         self.alpha = 0  # Current transparency (0-255)
         self.always_show_when_rolling = True  # Always visible while rolling
+
+        # Built bar and "EMPTY" surfaces, reused until the fill, colour or fade changes
+        self._bar_cache = {}
+        self._empty_text_cache = {}
         
     def draw(self, screen, player, camera_x):
         """Draw the stamina bar above the player
@@ -78,6 +83,22 @@ class RollStaminaDisplay:
         else:
             stamina_color = self.stamina_color_low
         
+        # Blit to screen
+        screen.blit(self._get_bar_surface(fill_width, stamina_color), (bar_x - 2, bar_y - 2))
+        
+        # Draw "EMPTY" text if stamina depleted
+        if player.roll_stamina <= 0:
+            text = self._get_empty_text()
+            text_rect = text.get_rect(center=(bar_x + self.bar_width // 2, bar_y - 12))
+            screen.blit(text, text_rect)
+
+    def _get_bar_surface(self, fill_width, stamina_color):
+        """Get the bar for a fill width, colour and the current alpha, building it on first use"""
+        key = (fill_width, stamina_color, self.alpha)
+        bar_surface = self._bar_cache.get(key)
+        if bar_surface is not None:
+            return bar_surface
+
         # Create surfaces with alpha support
         bar_surface = pygame.Surface((self.bar_width + 4, self.bar_height + 4), pygame.SRCALPHA)
         
@@ -93,14 +114,18 @@ class RollStaminaDisplay:
         # Draw border
         pygame.draw.rect(bar_surface, (*self.border_color, self.alpha), 
                         (2, 2, self.bar_width, self.bar_height), 1)
-        
-        # Blit to screen
-        screen.blit(bar_surface, (bar_x - 2, bar_y - 2))
-        
-        # Draw "EMPTY" text if stamina depleted
-        if player.roll_stamina <= 0:
-            font = pygame.font.Font(None, 16)
-            text = font.render("EMPTY", True, (255, 100, 100))
+
+        # Recharging walks through every fill width and fade step, so keep the cache small
+        if len(self._bar_cache) >= 512:
+            self._bar_cache.clear()
+        self._bar_cache[key] = bar_surface
+        return bar_surface
+
+    def _get_empty_text(self):
+        """Get the "EMPTY" label at the current alpha"""
+        text = self._empty_text_cache.get(self.alpha)
+        if text is None:
+            text = FontManager.get_default_font(16).render("EMPTY", True, (255, 100, 100))
             text.set_alpha(self.alpha)
-            text_rect = text.get_rect(center=(bar_x + self.bar_width // 2, bar_y - 12))
-            screen.blit(text, text_rect)
\ No newline at end of file
+            self._empty_text_cache[self.alpha] = text
+        return text
\ No newline at end of file
@@ -22,6 +22,9 @@ class SpinChargeDisplay:
         self.fade_timer = 0
         self.fade_duration = 120  # Show for 2 seconds after using a spin
         self.alpha = 0  # Current transparency (0-255)
+
+        # Built dot surfaces keyed by everything that changes how they look
+        self._dot_cache = {}
         
     def draw(self, screen, player, camera_x):
         """Draw the spin charge dots above the player
@@ -108,13 +111,31 @@ class SpinChargeDisplay:
     
     def _draw_available_dot(self, screen, x, y, pulse):
         """Draw an available charge dot with glow effect"""
-        # Create surface for this dot with alpha
-        dot_surface = pygame.Surface((self.dot_radius * 4, self.dot_radius * 4), pygame.SRCALPHA)
-        center = (self.dot_radius * 2, self.dot_radius * 2)
-        
         # Draw outer glow (pulsing)
         glow_radius = int(self.dot_radius * (1.5 + pulse * 0.3))
         glow_alpha = int(100 * (1 - pulse * 0.3) * (self.alpha / 255))
+
+        # The pulse only takes a few distinct glow sizes/strengths, so built dots are reused
+        key = ('available', glow_radius, glow_alpha, self.alpha)
+        dot_surface = self._dot_cache.get(key)
+        if dot_surface is None:
+            dot_surface = self._build_available_dot(glow_radius, glow_alpha)
+            self._cache_dot(key, dot_surface)
+
+        # Blit to screen
+        screen.blit(dot_surface, (x - self.dot_radius * 2, y - self.dot_radius * 2))
+
+    def _cache_dot(self, key, dot_surface):
+        """Keep a built dot (the fade-out walks through many alphas, so the cache is capped)"""
+        if len(self._dot_cache) >= 512:
+            self._dot_cache.clear()
+        self._dot_cache[key] = dot_surface
+
+    def _build_available_dot(self, glow_radius, glow_alpha):
+        """Draw an available dot with its glow onto a new surface"""
+        # Create surface for this dot with alpha
+        dot_surface = pygame.Surface((self.dot_radius * 4, self.dot_radius * 4), pygame.SRCALPHA)
+        center = (self.dot_radius * 2, self.dot_radius * 2)
         
         for r in range(glow_radius, self.dot_radius, -1):
             alpha = int(glow_alpha * (glow_radius - r) / (glow_radius - self.dot_radius))
@@ -128,9 +149,7 @@ class SpinChargeDisplay:
         # Draw bright center highlight
         highlight_color = (200, 240, 255, self.alpha)
         pygame.draw.circle(dot_surface, highlight_color, center, self.dot_radius // 2)
-        
-        # Blit to screen
-        screen.blit(dot_surface, (x - self.dot_radius * 2, y - self.dot_radius * 2))
+        return dot_surface
     
     def _draw_recharging_dot(self, screen, x, y, progress):
         """Draw a recharging/empty dot (always gray, no progress indicator)
@@ -138,6 +157,17 @@ class SpinChargeDisplay:
         Args:
             progress: 0.0 to 1.0, how much recharged (not used, kept for compatibility)
         """
+        key = ('empty', self.alpha)
+        dot_surface = self._dot_cache.get(key)
+        if dot_surface is None:
+            dot_surface = self._build_recharging_dot()
+            self._cache_dot(key, dot_surface)
+
+        # Blit to screen
+        screen.blit(dot_surface, (x - self.dot_radius * 2, y - self.dot_radius * 2))
+
+    def _build_recharging_dot(self):
+        """Draw a gray empty dot onto a new surface"""
         # Create surface for this dot with alpha
         dot_surface = pygame.Surface((self.dot_radius * 4, self.dot_radius * 4), pygame.SRCALPHA)
         center = (self.dot_radius * 2, self.dot_radius * 2)
@@ -149,6 +179,4 @@ class SpinChargeDisplay:
         # Draw outer ring
         pygame.draw.circle(dot_surface, (80, 80, 100, self.alpha), 
                           center, self.dot_radius, 1)
-        
-        # Blit to screen
-        screen.blit(dot_surface, (x - self.dot_radius * 2, y - self.dot_radius * 2))
\ No newline at end of file
+        return dot_surface
\ No newline at end of file
@@ -36,6 +36,28 @@ DISPLAY_SCALE = 0.8  # Default: smaller window that works on any Mac
 # This is the live scale factor that should be used for coordinate conversions
 current_display_scale = DISPLAY_SCALE
 
+# Where the in-level frame sits in the window: (x offset, y offset, scale)
+# Set by the Presenter each frame; None until a level frame has been presented
+display_viewport = None
+
+
+def window_to_render(pos):
+    """
+    Convert a window position (e.g. the mouse) to render surface coordinates
+
+    Accounts for the letterbox bars of integer display scaling.
+
+    Args:
+        pos: (x, y) in window pixels
+
+    Returns:
+        tuple: (x, y) in render surface pixels
+    """
+    if display_viewport is None:
+        return (int(pos[0] / current_display_scale), int(pos[1] / current_display_scale))
+    offset_x, offset_y, scale = display_viewport
+    return (int((pos[0] - offset_x) / scale), int((pos[1] - offset_y) / scale))
+
 
 def enforce_aspect_ratio(requested_width, requested_height):
     """
@@ -0,0 +1,15 @@
+"""
+Shared test fixtures
+"""
+
+import os
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+@pytest.fixture
+def repo_cwd(monkeypatch):
+    """Run from the repository root, which levels, images and fonts are loaded relative to"""
+    monkeypatch.chdir(ROOT)
@@ -0,0 +1,41 @@
+"""
+Unit tests for the aurora texture module
+Tests the precomputed palette table and palette-cycled drawing
+"""
+
+import sys
+import os
+
+import pygame
+import pytest
+
+# Add parent directory to path so we can import our modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.rendering import aurora
+
+
+class TestAuroraPalette:
+    """Test the aurora colour table and palette cycling"""
+
+    def test_numpy_table_matches_python_formulas(self, monkeypatch):
+        """The vectorized table is identical to the scalar fallback"""
+        pytest.importorskip("numpy")
+        vectorized = aurora.build_aurora_table()
+        monkeypatch.setattr(aurora, 'np', None)
+        assert aurora.build_aurora_table() == vectorized
+
+    def test_draw_uses_palette_for_phase_step(self):
+        """A brick centre is drawn with the glow colour of its phase step"""
+        aurora.AuroraTextureCache.clear_cache()
+        table = aurora.build_aurora_table()
+        steps = aurora.AURORA_PHASE_STEPS
+        rect = pygame.Rect(100, 50, 64, 32)
+
+        for step in (0, 17, steps - 1):
+            screen = pygame.Surface((300, 200))
+            aurora.AuroraTextureCache.draw(screen, rect, camera_x=100, step=step)
+            # Brick at column 0, row 0 has phase offset 0
+            assert tuple(screen.get_at((8, 58)))[:3] == table[step][aurora.GLOW]
+            # Odd rows start half a brick in, so the far left is a gap
+            assert tuple(screen.get_at((2, 74)))[:3] == (0, 0, 0)
@@ -0,0 +1,53 @@
+"""
+Integration tests for the frame-time benchmark
+Tests percentile reporting and regression detection against a baseline
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add parent directory to path so we can import our modules
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from src.core.benchmark import run_benchmark, compare_results
+from src.core.performance import PerformanceMonitor
+
+
+def make_results(update_p95, render_p95):
+    """Minimal benchmark results for one level"""
+    return {'levels': {'1': {
+        'update': {'p50': 1.0, 'p95': update_p95},
+        'render': {'p50': 5.0, 'p95': render_p95},
+    }}}
+
+
+class TestFrameBenchmark:
+    """Test the per-level frame-time benchmark"""
+
+    def test_percentiles_nearest_rank(self):
+        """Percentiles are measured samples picked by nearest rank"""
+        monitor = PerformanceMonitor(sample_size=100)
+        monitor.update_times.extend(range(1, 101))
+        percentiles = monitor.get_percentiles()
+        assert percentiles['update'] == {'p50': 50, 'p95': 95, 'p99': 99}
+        assert percentiles['render'] == {'p50': 0, 'p95': 0, 'p99': 0}
+
+    @pytest.mark.usefixtures('repo_cwd')
+    def test_level_reports_update_and_render_times(self):
+        """A short run records ordered percentiles for each phase"""
+        results = run_benchmark([1], frames=30, warmup=5)
+        level = results['levels']['1']
+        assert level['frames'] == 30
+        for phase in ('frame', 'update', 'render'):
+            assert 0 < level[phase]['p50'] <= level[phase]['p95'] <= level[phase]['p99']
+
+    def test_regression_threshold(self):
+        """Only slowdowns past both the relative and absolute threshold fail"""
+        baseline = make_results(2.0, 8.0)
+        assert compare_results(make_results(2.3, 9.0), baseline, threshold=0.2) == []
+        assert compare_results(make_results(2.1, 8.0), baseline, threshold=0.01, min_delta_ms=0.5) == []
+        regressions = compare_results(make_results(2.0, 10.0), baseline, threshold=0.2)
+        assert len(regressions) == 1 and 'render p95' in regressions[0]
@@ -12,6 +12,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.core import collision_physics as collision
+from src.core import batch_collision
 from src.core import constants as C
 
 
@@ -209,6 +210,282 @@ class TestPlatformCollisionEnemy:
         assert enemy.vel_y == 0
 
 
+class TestPlatformIndex:
+    """Tests for the static platform spatial index"""
+
+    def test_query_returns_only_nearby_platforms(self):
+        """Test that far away platforms are not returned"""
+        platforms = [
+            pygame.Rect(0, 400, 300, 30),
+            pygame.Rect(2000, 400, 300, 30),
+            pygame.Rect(5000, 300, 100, 30),
+        ]
+        index = collision.PlatformIndex(platforms, cell_size=256)
+
+        nearby = index.query(pygame.Rect(100, 360, 40, 45))
+
+        assert nearby == [platforms[0]]
+
+    def test_query_preserves_original_order(self):
+        """Test that candidates keep level order so resolution is unchanged"""
+        platforms = [
+            pygame.Rect(500, 400, 600, 30),  # Spans several columns
+            pygame.Rect(100, 400, 500, 30),
+            pygame.Rect(520, 380, 50, 30),
+        ]
+        index = collision.PlatformIndex(platforms, cell_size=128)
+
+        nearby = index.query(pygame.Rect(510, 360, 40, 45), margin=20)
+
+        assert nearby == platforms
+
+    def test_query_margin_includes_touching_platforms(self):
+        """Test that platforms just outside the hitbox are found with a margin"""
+        platform = pygame.Rect(200, 150, 100, 30)
+        index = collision.PlatformIndex([platform])
+        hitbox = pygame.Rect(100, 100, 40, 45)  # Bottom at 145, right at 140
+
+        assert index.query(hitbox) == []
+        assert index.query(hitbox, margin=64) == [platform]
+
+    def test_indexed_collision_matches_full_scan(self):
+        """Test that resolving against candidates gives the same result as the full list"""
+        platforms = [pygame.Rect(x, 400 - (x % 300), 180, 30) for x in range(0, 6000, 150)]
+        index = collision.PlatformIndex(platforms)
+
+        for x in range(0, 6000, 37):
+            full = MockPlayer(x=x, y=330)
+            full.vel_y = 4
+            indexed = MockPlayer(x=x, y=330)
+            indexed.vel_y = 4
+
+            full_result = collision.check_platform_collision_player(full, platforms)
+            candidates = index.query(indexed.hitbox, collision.BROADPHASE_MARGIN)
+            indexed_result = collision.check_platform_collision_player(indexed, candidates)
+
+            assert full_result == indexed_result
+            assert full.rect == indexed.rect
+            assert full.vel_y == indexed.vel_y
+
+
+class MockDynamicPlatform:
+    """Mock moving/disappearing platform for testing"""
+    def __init__(self, x, y, width=180, height=25):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.disappeared = False
+
+
+class TestCollisionWorld:
+    """Tests for the static + dynamic collision world"""
+
+    def test_dynamic_bodies_follow_static_platforms(self):
+        """Test that dynamic bodies are returned after static ones"""
+        ground = pygame.Rect(0, 400, 1000, 30)
+        body = MockDynamicPlatform(100, 380)
+        world = collision.CollisionWorld([ground])
+        world.add_body(body)
+
+        nearby = world.query(pygame.Rect(120, 340, 40, 45), margin=20)
+
+        assert nearby == [ground, body.rect]
+
+    def test_disappeared_body_toggles_in_place(self):
+        """Test that a disappeared body stops colliding and comes back after sync"""
+        body = MockDynamicPlatform(100, 300)
+        world = collision.CollisionWorld([])
+        world.add_body(body)
+        hitbox = pygame.Rect(120, 260, 40, 45)
+
+        body.disappeared = True
+        body.rect = pygame.Rect(-1000, -1000, 0, 0)
+        world.sync()
+        assert world.query(hitbox, margin=10) == []
+        assert list(world.iter_platforms()) == []
+
+        body.disappeared = False
+        body.rect = pygame.Rect(100, 300, 180, 25)
+        world.sync()
+        assert world.query(hitbox, margin=10) == [body.rect]
+
+    def test_moving_body_rebuckets_only_across_cells(self):
+        """Test that a body is re-bucketed only when it crosses a column boundary"""
+        body = MockDynamicPlatform(10, 300, width=50)
+        world = collision.CollisionWorld([], cell_size=256)
+        world.add_body(body)
+
+        body.rect.x += 20
+        assert world.update_body(0) == False
+
+        body.rect.x = 300
+        assert world.update_body(0) == True
+        assert world.query(pygame.Rect(20, 260, 40, 45)) == []
+        assert world.query(pygame.Rect(310, 260, 40, 45), margin=10) == [body.rect]
+
+
+class MockSweptEntity:
+    """Mock entity whose hitbox follows its rect (midbottom aligned)"""
+    def __init__(self, x, y, width=40, height=45):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.hitbox = pygame.Rect(x, y, width, height)
+        self.vel_y = 0
+        self.has_double_jump = True
+
+    def update_hitbox_position(self):
+        self.hitbox.midbottom = self.rect.midbottom
+
+
+class TestSweptCollision:
+    """Tests for the swept (time-of-impact) collision mode"""
+
+    def test_sweep_aabb_finds_time_of_impact(self):
+        """Test time of impact and normal for a falling box"""
+        box = pygame.Rect(100, 100, 40, 40)  # Bottom at 140
+        platform = pygame.Rect(80, 160, 100, 25)
+
+        hit = collision.sweep_aabb(box, 0, 40, platform)
+
+        assert hit == (0.5, 0, -1)
+
+    def test_sweep_aabb_misses(self):
+        """Test that a box moving away or beside a platform does not hit"""
+        box = pygame.Rect(100, 100, 40, 40)
+        platform = pygame.Rect(300, 160, 100, 25)
+
+        assert collision.sweep_aabb(box, 0, 40, platform) is None
+        assert collision.sweep_aabb(box, 0, -40, pygame.Rect(80, 160, 100, 25)) is None
+
+    def test_fast_fall_does_not_tunnel(self):
+        """Test that a fast-falling entity lands on a thin platform instead of passing through it"""
+        entity = MockSweptEntity(100, 100)
+        start = entity.hitbox.midbottom
+        platform = pygame.Rect(80, 200, 100, 25)
+
+        # Fell 150px this frame - ends completely below the 25px platform
+        entity.vel_y = 150
+        entity.rect.y += 150
+        entity.update_hitbox_position()
+        assert not entity.hitbox.colliderect(platform)
+
+        normal = collision.resolve_swept_motion(entity, start, [platform])
+        on_ground = collision.check_platform_collision_player(entity, [platform])
+
+        assert normal == (0, -1)
+        assert on_ground == True
+        assert entity.hitbox.bottom == platform.top
+
+    def test_fast_horizontal_move_stops_at_wall(self):
+        """Test that a fast horizontal move stops at the side of a platform"""
+        entity = MockSweptEntity(100, 100)
+        start = entity.hitbox.midbottom
+        wall = pygame.Rect(160, 50, 20, 200)
+
+        entity.rect.x += 120
+        entity.update_hitbox_position()
+
+        normal = collision.resolve_swept_motion(entity, start, [wall])
+
+        assert normal == (-1, 0)
+        assert entity.hitbox.right == wall.left
+
+    def test_landing_only_ignores_side_hits(self):
+        """Test that enemies (landing only) pass through platform sides"""
+        entity = MockSweptEntity(100, 100)
+        start = entity.hitbox.midbottom
+        wall = pygame.Rect(160, 50, 20, 200)
+
+        entity.rect.x += 120
+        entity.update_hitbox_position()
+
+        assert collision.resolve_swept_motion(entity, start, [wall], landing_only=True) is None
+        assert entity.rect.x == 220
+
+
+class MockWalkingEnemy:
+    """Mock patrolling enemy with a facing-dependent hitbox offset"""
+    def __init__(self, x, y, direction, patrol=True, avoids_hazards=False):
+        self.rect = pygame.Rect(x, y, 60, 50)
+        self.hitbox = pygame.Rect(0, 0, 40, 40)
+        self.direction = direction
+        self.facing_right = direction == 1
+        self.vel_y = 0
+        self.avoids_hazards = avoids_hazards
+        if patrol:
+            self.patrol_left = x - 100
+            self.patrol_right = x + 100
+        self.update_hitbox_position()
+
+    def update_hitbox_position(self):
+        self.hitbox.midbottom = self.rect.midbottom
+        self.hitbox.x += 5 if self.facing_right else -5
+
+    def state(self):
+        return (tuple(self.rect), tuple(self.hitbox), self.vel_y, self.direction,
+                self.facing_right, getattr(self, 'at_platform_edge', None))
+
+
+class TestBatchCollisionParity:
+    """The vectorized enemy pass must match the scalar functions exactly"""
+
+    def _make_level(self, seed):
+        import random
+        rng = random.Random(seed)
+        platforms = [pygame.Rect(x, 400, rng.randint(150, 500), 40) for x in range(0, 6000, 600)]
+        platforms += [pygame.Rect(rng.randint(0, 6000), rng.randint(150, 380), rng.randint(60, 300), 25)
+                      for _ in range(25)]
+        hazards = [pygame.Rect(rng.randint(0, 6000), 390, rng.randint(40, 120), 20) for _ in range(8)]
+        moving = [MockDynamicPlatform(rng.randint(0, 6000), rng.randint(150, 380)) for _ in range(4)]
+        moving[0].disappeared = True
+
+        def make_enemies():
+            enemy_rng = random.Random(seed + 1)
+            enemies = []
+            for _ in range(60):
+                target = enemy_rng.choice(platforms + [m.rect for m in moving])
+                enemy = MockWalkingEnemy(
+                    x=enemy_rng.randint(target.left - 40, target.right - 20),
+                    y=target.top - 50 + enemy_rng.randint(-25, 25),
+                    direction=enemy_rng.choice([-1, 1]),
+                    patrol=enemy_rng.random() < 0.7,
+                    avoids_hazards=enemy_rng.random() < 0.3,
+                )
+                enemy.vel_y = enemy_rng.choice([0, 0.6, 3, 12, -2])
+                enemies.append(enemy)
+            return enemies
+
+        world = collision.CollisionWorld(platforms)
+        world.add_bodies(moving)
+        return world, hazards, make_enemies
+
+    def test_ground_edge_parity(self):
+        """Test batched ground-edge + hazard-ahead checks against the scalar path"""
+        pytest.importorskip("numpy")
+        for seed in range(5):
+            world, hazards, make_enemies = self._make_level(seed)
+            scalar, batched = make_enemies(), make_enemies()
+
+            for enemy in scalar:
+                nearby = world.query(enemy.hitbox, collision.BROADPHASE_MARGIN)
+                collision.check_enemy_ground_edge(enemy, nearby, hazards)
+            batch_collision.EnemyBatchCollider(world, hazards).check_ground_edges(batched, hazards)
+
+            assert [e.state() for e in scalar] == [e.state() for e in batched]
+
+    def test_landing_and_patrol_parity(self):
+        """Test batched landing + patrol-edge checks against the scalar path"""
+        pytest.importorskip("numpy")
+        for seed in range(5):
+            world, hazards, make_enemies = self._make_level(seed)
+            scalar, batched = make_enemies(), make_enemies()
+
+            for enemy in scalar:
+                nearby = world.query(enemy.hitbox, collision.BROADPHASE_MARGIN)
+                if collision.check_platform_collision_enemy(enemy, nearby):
+                    collision.check_enemy_patrol_edge(enemy, nearby)
+            batch_collision.EnemyBatchCollider(world, hazards).land_and_check_patrol_edges(batched)
+
+            assert [e.state() for e in scalar] == [e.state() for e in batched]
+
+
 class TestHazardCollision:
     """Tests for hazard collision detection"""
 
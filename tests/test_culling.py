@@ -0,0 +1,65 @@
+"""
+Unit tests for the view culling module
+Tests that culled draw lists match a brute-force visibility check
+"""
+
+import random
+import sys
+import os
+
+import pygame
+
+# Add parent directory to path so we can import our modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.performance import PerformanceMonitor
+from src.rendering.culling import CullingIndex, FrustumCuller
+
+
+class MockSprite:
+    """Mock drawable with a world-space rect"""
+    def __init__(self, x, width):
+        self.rect = pygame.Rect(x, 300, width, 40)
+
+
+class TestCullingIndex:
+    """Test the X-sorted culling index"""
+
+    def test_matches_brute_force_in_draw_order(self):
+        """Index queries return exactly the overlapping items, in original order"""
+        rng = random.Random(7)
+        rects = [pygame.Rect(rng.randint(0, 8000), rng.randint(0, 500), rng.randint(1, 900), 20)
+                 for _ in range(300)]
+        index = CullingIndex(rects)
+
+        for camera_x in range(-200, 8200, 137):
+            left, right = camera_x, camera_x + 800
+            expected = [r for r in rects if r.right >= left and r.left <= right]
+            assert index.query(left, right) == expected
+
+    def test_empty_index(self):
+        """An empty layer returns nothing"""
+        index = CullingIndex([])
+        assert len(index) == 0
+        assert index.query(0, 800) == []
+
+
+class TestFrustumCuller:
+    """Test per-layer culling and counters"""
+
+    def test_counts_reach_performance_monitor(self):
+        """Drawn/culled counters are reported per layer at end of frame"""
+        monitor = PerformanceMonitor()
+        monitor.enabled = True
+        culler = FrustumCuller(800, monitor)
+        sprites = [MockSprite(x, 40) for x in (0, 400, 900, 2000)]
+
+        culler.begin_frame(camera_x=100)
+        visible = culler.visible('enemies', sprites)
+        visible_indexed = culler.visible('coins', CullingIndex(sprites), margin=1200)
+        culler.end_frame()
+
+        assert visible == sprites[1:3]
+        assert visible_indexed == sprites
+        assert culler.get_totals() == (6, 2)
+        assert monitor.get_culling_stats()['layers'] == {'enemies': (2, 2), 'coins': (4, 0)}
@@ -0,0 +1,68 @@
+"""
+Unit tests for the fixed timestep module
+Tests step accumulation, catch-up capping and render interpolation
+"""
+
+import sys
+import os
+
+import pygame
+
+# Add parent directory to path so we can import our modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.fixed_timestep import FixedTimestep, RenderInterpolator
+
+
+class MockSprite:
+    """Mock sprite with a rect"""
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 20, 20)
+
+
+class TestFixedTimestep:
+    """Test simulation step accounting"""
+
+    def test_same_steps_at_any_render_rate(self):
+        """One second of real time is 60 steps whether rendered at 30, 60 or 144 Hz"""
+        for render_hz in (30, 60, 144):
+            timestep = FixedTimestep(60)
+            steps = sum(timestep.advance(1000.0 / render_hz) for _ in range(render_hz))
+            assert abs(steps - 60) <= 1
+            assert 0.0 <= timestep.alpha <= 1.0
+
+    def test_catch_up_is_capped(self):
+        """A long stall runs at most max_steps and drops the rest"""
+        timestep = FixedTimestep(60, max_steps=5)
+        assert timestep.advance(1000) == 5
+        assert timestep.accumulator < timestep.step_ms
+        assert timestep.dropped_ms > 0
+        assert timestep.advance(1000.0 / 60) == 1
+
+
+class TestRenderInterpolator:
+    """Test drawing between simulation steps"""
+
+    def test_apply_and_restore(self):
+        """Sprites are drawn part way between steps and put back afterwards"""
+        walker = MockSprite(100, 200)
+        teleporter = MockSprite(0, 0)
+        interpolator = RenderInterpolator(teleport_distance=64)
+
+        interpolator.snapshot(walker, [teleporter])
+        walker.rect.x += 10
+        teleporter.rect.x += 500
+
+        interpolator.apply(0.5)
+        assert walker.rect.topleft == (105, 200)
+        assert teleporter.rect.topleft == (500, 0)
+
+        interpolator.restore()
+        assert walker.rect.topleft == (110, 200)
+
+    def test_camera_is_whole_pixels(self):
+        """The interpolated camera is rounded the same way as sprite positions"""
+        interpolator = RenderInterpolator()
+        assert interpolator.camera(10, 21, 0.5) == 16
+        assert interpolator.camera(10.0, 20.0, 0.26) == 13
+        assert isinstance(interpolator.camera(10.0, 20.0, 0.26), int)
@@ -0,0 +1,95 @@
+"""
+Unit tests for the in-level HUD
+Tests that HUD text and the retained HUD layer are only redrawn when they change
+"""
+
+import sys
+import os
+
+import pygame
+import pytest
+
+# Add parent directory to path so we can import our modules
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from src.ui.game_hud import GameHUD
+from src.ui.health_display import HealthDisplay
+from src.ui.hud_layer import HUDLayer
+from src.utils import settings as S
+
+
+# Fonts and heart sprites are loaded relative to the repository root
+pytestmark = pytest.mark.usefixtures('repo_cwd')
+
+
+@pytest.fixture(autouse=True)
+def pygame_initialized():
+    """HUD text needs pygame.font initialised"""
+    pygame.init()
+
+
+class TestGameHUD:
+    """Test HUD text caching"""
+
+    def test_unchanged_hud_renders_no_text(self):
+        """A second identical frame reuses every text surface"""
+        hud = GameHUD()
+        screen = pygame.Surface((S.WINDOW_WIDTH, S.WINDOW_HEIGHT))
+        hud.draw(screen, 3, 600, "1-1", "Hard", 2, 10, 340, 5000)
+        first_frame = hud.text_renders
+        hud.draw(screen, 3, 600, "1-1", "Hard", 2, 10, 340, 5000)
+        assert first_frame == 9
+        assert hud.text_renders == first_frame
+
+    def test_only_changed_values_render(self):
+        """A new time value renders just that value"""
+        hud = GameHUD()
+        screen = pygame.Surface((S.WINDOW_WIDTH, S.WINDOW_HEIGHT))
+        hud.draw(screen, 3, 600, "1-1", "Hard", 2, 10, 340, 5000)
+        renders = hud.text_renders
+        hud.draw(screen, 3, 660, "1-1", "Hard", 2, 10, 340, 5000)
+        assert hud.text_renders == renders + 1
+
+    def test_text_cache_is_bounded(self):
+        """Old strings are evicted once the cache is full"""
+        hud = GameHUD()
+        for i in range(GameHUD.MAX_CACHED_TEXT + 50):
+            hud.render_text(str(i), (0, 0, 0), GameHUD.SMALL_SIZE)
+        assert len(hud._text_cache) == GameHUD.MAX_CACHED_TEXT
+        assert hud.render_text("COINS", (0, 0, 0), GameHUD.LARGE_SIZE) is \
+            hud.render_text("COINS", (0, 0, 0), GameHUD.LARGE_SIZE)
+
+
+class TestHUDLayer:
+    """Test the retained hearts + HUD layer"""
+
+    HUD_VALUES = (5, 6, 3, 125, "1-1", "Hard", 2, 10, 340, 5000)
+
+    def test_layer_matches_direct_drawing(self):
+        """Compositing through the layer gives the same pixels as drawing straight to the screen"""
+        health_ui, game_hud = HealthDisplay(), GameHUD()
+        direct = pygame.Surface((S.WINDOW_WIDTH, S.WINDOW_HEIGHT))
+        direct.fill((90, 120, 160))
+        layered = direct.copy()
+
+        health, max_health, *hud_values = self.HUD_VALUES
+        health_ui.draw(direct, health, max_health)
+        game_hud.draw(direct, *hud_values)
+        HUDLayer(health_ui, game_hud).draw(layered, *self.HUD_VALUES)
+
+        assert pygame.image.tobytes(direct, 'RGB') == pygame.image.tobytes(layered, 'RGB')
+
+    def test_recomposes_only_on_change(self):
+        """Frames within the same second with the same values reuse the layer"""
+        layer = HUDLayer(HealthDisplay(), GameHUD())
+        screen = pygame.Surface((S.WINDOW_WIDTH, S.WINDOW_HEIGHT))
+        values = list(self.HUD_VALUES)
+        for frame in range(120, 180):
+            values[3] = frame  # level_time ticks every frame, the shown second does not
+            layer.draw(screen, *values)
+        assert layer.recomposes == 1
+
+        values[0] = 4  # Took damage
+        layer.draw(screen, *values)
+        assert layer.recomposes == 2
@@ -0,0 +1,60 @@
+"""
+Unit tests for the hazard sprite module
+Tests background removal and flame strip tiling
+"""
+
+import random
+import sys
+import os
+
+import pygame
+import pytest
+
+# Add parent directory to path so we can import our modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.rendering import hazard_sprites
+
+
+def noisy_sheet(seed):
+    """Build a small sheet mixing grey background and flame-coloured pixels"""
+    rng = random.Random(seed)
+    sheet = pygame.Surface((30, 20), pygame.SRCALPHA)
+    for x in range(30):
+        for y in range(20):
+            if rng.random() < 0.5:
+                sheet.set_at((x, y), (165 + rng.randint(-12, 12), 165 + rng.randint(-12, 12),
+                                      165 + rng.randint(-12, 12), 255))
+            else:
+                sheet.set_at((x, y), (rng.randint(0, 255), rng.randint(0, 255), 0, rng.randint(1, 255)))
+    return sheet
+
+
+class TestHazardSprites:
+    """Test flame sheet preprocessing"""
+
+    def test_vectorized_background_removal_matches_pixel_loop(self, monkeypatch):
+        """surfarray keying makes exactly the same pixels transparent as the per-pixel loop"""
+        pytest.importorskip("numpy")
+        vectorized = noisy_sheet(seed=11)
+        hazard_sprites.remove_grey_background(vectorized)
+
+        looped = noisy_sheet(seed=11)
+        monkeypatch.setattr(hazard_sprites, 'np', None)
+        hazard_sprites.remove_grey_background(looped)
+
+        assert pygame.image.tobytes(vectorized, 'RGBA') == pygame.image.tobytes(looped, 'RGBA')
+
+    def test_strips_cover_hazard_width(self, monkeypatch):
+        """Each strip holds every flame that starts inside the hazard"""
+        sheet = pygame.Surface((30, 20), pygame.SRCALPHA)
+        sheet.fill((255, 120, 0, 255))
+        monkeypatch.setattr(hazard_sprites.HazardSpriteCache, '_sheet', sheet)
+        monkeypatch.setattr(hazard_sprites.HazardSpriteCache, '_sheet_loaded', True)
+        hazard_sprites.HazardSpriteCache.clear_cache()
+
+        # 10x10 frames scaled to height 40 are 40px wide: 95px needs 3 flames
+        strips = hazard_sprites.HazardSpriteCache.get_strips(95, 40)
+        assert len(strips) == hazard_sprites.FIRE_FRAME_COUNT
+        assert all(strip.get_size() == (120, 40) for strip in strips)
+        hazard_sprites.HazardSpriteCache.clear_cache()
@@ -0,0 +1,36 @@
+"""
+Integration tests for the headless runner
+Tests that levels simulate with scripted input and no window or audio
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add parent directory to path so we can import our modules
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from src.core.headless import HeadlessRunner
+
+
+@pytest.mark.usefixtures('repo_cwd')
+class TestHeadlessRunner:
+    """Test scripted headless simulation"""
+
+    def test_run_script_moves_player_and_camera(self):
+        """Holding right walks the player into the level and the camera follows"""
+        runner = HeadlessRunner(1, script='run', seed=0)
+        start_x = runner.simulation.player.rect.x
+        stats = runner.run(240)
+
+        assert stats['frames'] == 240
+        assert runner.simulation.level_time == 240
+        assert runner.simulation.player.rect.x > start_x
+        assert runner.simulation.camera_x > 0
+
+    def test_unknown_level_rejected(self):
+        """Levels must exist in LevelManager.LEVELS"""
+        with pytest.raises(ValueError):
+            HeadlessRunner(99)
@@ -0,0 +1,152 @@
+"""
+Unit tests for the particle system
+Tests the array-backed particle pool against the per-object fallback
+"""
+
+import sys
+import os
+
+import pygame
+import pytest
+
+# Add parent directory to path so we can import our modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.rendering import particles
+from src.rendering.particles import Particle, ParticleManager, ParticleAtlas, ALPHA_LEVELS
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture(autouse=True)
+def display():
+    """Particle sprites are plain surfaces, but pygame must be initialized"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.display.init()
+    ParticleAtlas.clear_cache()
+    yield
+    ParticleAtlas.clear_cache()
+
+
+def spawn_both(pool, objects, count=300):
+    """Add the same particles to a pool and to a list of Particle objects"""
+    for i in range(count):
+        args = (i * 4.3 - 20, 700 - i * 2.1, (i % 7) - 3, -(i % 5), 8 + i % 30,
+                i % 24, 1 + i % 6, 0.2)
+        pool.add(*args)
+        objects.append(Particle(*args))
+
+
+class TestParticlePool:
+    """Test the structure-of-arrays pool"""
+
+    def test_matches_particle_objects(self):
+        """Pool update and draw produce exactly what per-object particles do"""
+        pool = particles.ParticlePool(500)
+        objects = []
+        spawn_both(pool, objects)
+        expected = pygame.Surface((640, 480))
+        actual = pygame.Surface((640, 480))
+
+        for _ in range(40):
+            objects = [p for p in objects if p.update()]
+            pool.update()
+            assert pool.active == len(objects)
+
+            expected.fill((20, 30, 60))
+            actual.fill((20, 30, 60))
+            for particle in objects:
+                particle.draw(expected, 12.5)
+            pool.draw(actual, 12.5)
+            assert pygame.image.tobytes(actual, 'RGB') == pygame.image.tobytes(expected, 'RGB')
+
+    def test_free_slots_are_reused(self):
+        """Expired slots go back on the free-list and a full pool drops spawns"""
+        pool = particles.ParticlePool(4)
+        for lifetime in (1, 5, 5, 5):
+            assert pool.add(0, 0, 0, 0, lifetime, 0, 3, 0)
+        assert not pool.add(0, 0, 0, 0, 5, 0, 3, 0)
+
+        pool.update()
+        assert pool.active == 3
+        assert pool.add(0, 0, 0, 0, 5, 0, 3, 0)
+        assert pool.alive.all()
+
+        pool.clear()
+        assert (pool.active, pool.high, len(pool.free)) == (0, 0, 4)
+
+
+class TestParticleAtlas:
+    """Test the pre-rendered sprite atlas"""
+
+    def test_cells_bake_colour_and_alpha(self):
+        """Each cell holds a circle of its band colour at its alpha level"""
+        atlas, areas = ParticleAtlas.get_atlas()
+        left, top, width, height = areas[ParticleAtlas.area_index(6, 4, ALPHA_LEVELS - 1)]
+        assert (width, height) == (8, 8)
+        assert tuple(atlas.get_at((left + 4, top + 4))) == (255, 195, 0, 255)
+        assert atlas.get_at((left, top)).a == 0
+
+        left, top, _, _ = areas[ParticleAtlas.area_index(6, 4, 5)]
+        assert atlas.get_at((left + 4, top + 4)).a == 85
+
+    def test_atlas_is_built_once(self):
+        """Managers share the atlas built by the first one"""
+        ParticleManager()
+        atlas = ParticleAtlas.get_atlas()[0]
+        ParticleManager()
+        assert ParticleAtlas.get_atlas()[0] is atlas
+
+
+class TestParticleManager:
+    """Test spawning through the manager"""
+
+    def test_burst_respects_capacity(self):
+        """Bursts are trimmed to the space left in the pool"""
+        manager = ParticleManager()
+        manager.capacity = manager.pool.capacity = 20
+        manager.pool.free = manager.pool.free[-20:]
+
+        manager.spawn_burst(100, 100, count=15, particle_type='explosion')
+        manager.spawn_burst(100, 100, count=15, particle_type='unknown')
+        assert manager.count() == 20
+
+        manager.clear()
+        assert manager.count() == 0
+
+    def test_frame_is_one_batched_blit(self):
+        """A burst of particles is drawn with a single Surface.blits() call"""
+        manager = ParticleManager()
+        for _ in range(50):
+            manager.spawn_coin_sparkles(300, 200)
+            manager.spawn_enemy_defeat(300, 200, 40, 40)
+        manager.update()
+
+        calls = []
+
+        class CountingSurface(pygame.Surface):
+            def blit(self, *args, **kwargs):
+                calls.append('blit')
+                return super().blit(*args, **kwargs)
+
+            def blits(self, *args, **kwargs):
+                calls.append('blits')
+                return super().blits(*args, **kwargs)
+
+        manager.draw(CountingSurface((640, 480)), 0)
+        assert manager.count() == 1350
+        assert calls == ['blits']
+
+    def test_fallback_without_numpy(self, monkeypatch):
+        """Without NumPy the manager keeps Particle objects and the old cap"""
+        monkeypatch.setattr(particles, 'np', None)
+        manager = ParticleManager()
+        assert manager.pool is None
+
+        for _ in range(20):
+            manager.spawn_enemy_defeat(100, 100, 40, 40)
+        assert manager.count() == ParticleManager.FALLBACK_MAX_PARTICLES
+
+        manager.update()
+        manager.draw(pygame.Surface((640, 480)), 0)
+        assert all(isinstance(p, Particle) for p in manager.particles)
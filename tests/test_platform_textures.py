@@ -0,0 +1,157 @@
+"""
+Unit tests for the platform texture cache
+Tests that cached brick textures match per-brick drawing and that the cache keeps to its budget
+"""
+
+import sys
+import os
+
+import pygame
+import pytest
+
+# Add parent directory to path so we can import our modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.rendering.platform_textures import PlatformTextureCache, BRICK_STYLES
+
+# Palettes of the per-brick draw_* functions the cache replaced: (base, top, left, shadow, outline)
+OLD_PALETTES = {
+    'brick': ((200, 220, 240), (240, 250, 255), (240, 250, 255), (120, 140, 170), (100, 120, 150)),
+    'icy_brick': ((50, 100, 150), (70, 120, 180), (70, 120, 180), (30, 70, 110), (20, 50, 90)),
+    'snowy': ((255, 255, 255), (255, 255, 255), (245, 250, 255), (220, 230, 240), (200, 210, 220)),
+    'wooden': ((139, 90, 60), (180, 120, 80), (180, 120, 80), (80, 50, 30), (60, 40, 20)),
+}
+
+SCREEN_SIZE = (300, 120)
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    """Start each test with an empty cache and the default 32 MB budget"""
+    pygame.init()
+    monkeypatch.setattr(PlatformTextureCache, '_max_bytes', 32 * 1024 * 1024)
+    PlatformTextureCache.clear_cache()
+    yield
+    PlatformTextureCache.clear_cache()
+
+
+def draw_bricks_per_brick(screen, rect, camera_x, palette):
+    """The brick loop every draw_*_platform function ran on the screen each frame"""
+    brick_color, highlight_color, left_highlight_color, shadow_color, outline_color = palette
+    draw_x = rect.x - camera_x
+    draw_y = rect.y
+    for row in range(rect.height // 16 + 1):
+        for col in range(rect.width // 32 + 1):
+            brick_x = draw_x + col * 32 + (16 if row % 2 == 1 else 0)
+            brick_y = draw_y + row * 16
+            if brick_x + 32 < draw_x or brick_x > draw_x + rect.width:
+                continue
+            if brick_y + 16 < draw_y or brick_y > draw_y + rect.height:
+                continue
+            clip_rect = pygame.Rect(brick_x, brick_y, 32, 16).clip(pygame.Rect(draw_x, draw_y, rect.width, rect.height))
+            if clip_rect.width <= 0 or clip_rect.height <= 0:
+                continue
+            pygame.draw.rect(screen, brick_color, clip_rect)
+            if clip_rect.height > 2:
+                pygame.draw.rect(screen, highlight_color, (clip_rect.x, clip_rect.y, clip_rect.width, 2))
+            if clip_rect.width > 2:
+                pygame.draw.rect(screen, left_highlight_color, (clip_rect.x, clip_rect.y, 2, clip_rect.height))
+            if clip_rect.height > 2:
+                pygame.draw.rect(screen, shadow_color, (clip_rect.x, clip_rect.bottom - 2, clip_rect.width, 2))
+            if clip_rect.width > 2:
+                pygame.draw.rect(screen, shadow_color, (clip_rect.right - 2, clip_rect.y, 2, clip_rect.height))
+            pygame.draw.rect(screen, outline_color, clip_rect, 1)
+
+
+def render_both(style, rect, camera_x):
+    """Draw a platform both ways onto identical backgrounds"""
+    old = pygame.Surface(SCREEN_SIZE)
+    old.fill((9, 9, 9))
+    cached = old.copy()
+    draw_bricks_per_brick(old, rect, camera_x, OLD_PALETTES[style])
+    PlatformTextureCache.draw(cached, style, rect, camera_x)
+    return old, cached
+
+
+def interior(surface):
+    """Pixels inside the 1px screen border"""
+    return pygame.image.tobytes(surface.subsurface((1, 1, SCREEN_SIZE[0] - 2, SCREEN_SIZE[1] - 2)), 'RGB')
+
+
+class TestPlatformTextures:
+    """Test cached textures against per-brick drawing"""
+
+    def test_palettes_unchanged(self):
+        """Every brick style keeps the colours of the function it replaced"""
+        assert BRICK_STYLES == OLD_PALETTES
+
+    @pytest.mark.parametrize('style', sorted(BRICK_STYLES))
+    @pytest.mark.parametrize('rect, camera_x', [
+        (pygame.Rect(40, 30, 200, 50), 0),    # Whole platform on screen
+        (pygame.Rect(60, 20, 96, 32), 20),    # Width and height whole bricks
+        (pygame.Rect(10, 40, 37, 9), 0),      # Partial bricks, shorter than one row
+    ])
+    def test_matches_per_brick_drawing(self, style, rect, camera_x):
+        """A platform on screen is drawn pixel for pixel as before"""
+        old, cached = render_both(style, rect, camera_x)
+        assert pygame.image.tobytes(cached, 'RGB') == pygame.image.tobytes(old, 'RGB')
+
+    @pytest.mark.parametrize('style', sorted(BRICK_STYLES))
+    @pytest.mark.parametrize('rect, camera_x', [
+        (pygame.Rect(250, 22, 242, 36), 0),   # Cut off by the right edge
+        (pygame.Rect(40, 90, 200, 50), 60),   # Cut off by the left and bottom edges
+        (pygame.Rect(80, -20, 150, 40), 0),   # Cut off by the top edge
+    ])
+    def test_matches_inside_screen_edges(self, style, rect, camera_x):
+        """
+        A platform cut off by the screen edge matches everywhere but the edge itself
+
+        The old code clipped bricks to the screen as it drew, which drew the
+        outline of cut-off bricks along the outermost screen row or column.
+        The cached texture is drawn whole and clipped by the blit.
+        """
+        old, cached = render_both(style, rect, camera_x)
+        assert interior(cached) == interior(old)
+
+
+class TestPlatformTextureCache:
+    """Test caching and LRU eviction"""
+
+    def test_textures_are_shared(self):
+        """Platforms of the same style and size reuse one texture"""
+        first = PlatformTextureCache.get_texture('brick', 64, 32)
+        assert PlatformTextureCache.get_texture('brick', 64, 32) is first
+        assert PlatformTextureCache.get_texture('wooden', 64, 32) is not first
+
+        info = PlatformTextureCache.get_cache_info()
+        assert (info['size'], info['hits'], info['misses']) == (2, 1, 2)
+
+    def test_evicts_least_recently_used(self, monkeypatch):
+        """Past the budget the least recently used texture goes and the byte count follows"""
+        texture_bytes = 100 * 20 * 4
+        monkeypatch.setattr(PlatformTextureCache, '_max_bytes', texture_bytes * 2)
+
+        oldest = PlatformTextureCache.get_texture('brick', 100, 20)
+        PlatformTextureCache.get_texture('snowy', 100, 20)
+        PlatformTextureCache.get_texture('brick', 100, 20)  # Now more recent than 'snowy'
+        PlatformTextureCache.get_texture('wooden', 100, 20)
+
+        assert list(PlatformTextureCache._textures) == [('brick', 100, 20), ('wooden', 100, 20)]
+        assert PlatformTextureCache._textures[('brick', 100, 20)] is oldest
+        assert PlatformTextureCache.get_cache_info()['bytes'] == texture_bytes * 2
+
+        PlatformTextureCache.get_texture('icy_brick', 50, 20)
+        assert list(PlatformTextureCache._textures) == [('wooden', 100, 20), ('icy_brick', 50, 20)]
+        assert PlatformTextureCache._bytes == sum(
+            texture.get_bytesize() * texture.get_width() * texture.get_height()
+            for texture in PlatformTextureCache._textures.values()
+        )
+
+    def test_keeps_a_texture_larger_than_the_budget(self, monkeypatch):
+        """The texture just requested is never evicted, even if it alone exceeds the budget"""
+        monkeypatch.setattr(PlatformTextureCache, '_max_bytes', 1024)
+        PlatformTextureCache.get_texture('brick', 40, 20)
+        texture = PlatformTextureCache.get_texture('brick', 100, 20)
+
+        assert list(PlatformTextureCache._textures) == [('brick', 100, 20)]
+        assert PlatformTextureCache._bytes == texture.get_bytesize() * 100 * 20
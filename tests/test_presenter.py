@@ -0,0 +1,117 @@
+"""
+Unit tests for the presentation stage
+Tests that the render surface reaches the window as a plain scale-and-blit would, in each scaling mode
+"""
+
+import sys
+import os
+
+import pygame
+import pytest
+
+# Add parent directory to path so we can import our modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.rendering.presenter import Presenter
+from src.utils import settings as S
+
+
+@pytest.fixture
+def frame():
+    """A 100x60 render surface with a distinct pattern"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    screen = pygame.Surface((100, 60))
+    screen.fill((40, 90, 200))
+    screen.fill((250, 250, 0), (10, 5, 30, 20))
+    yield screen
+    S.display_viewport = None  # Presenting records the viewport for mouse mapping
+
+
+def reference(screen, size, offset):
+    """What the game loop drew before the presenter: scale, clear, blit"""
+    display = pygame.Surface(size)
+    display.fill((255, 0, 255))
+    display.fill((0, 0, 0))
+    display.blit(pygame.transform.scale(screen, size), offset)
+    return pygame.image.tobytes(display, 'RGB')
+
+
+class TestPresenter:
+    """Test presenting the render surface to the window"""
+
+    @pytest.mark.parametrize('size', [(140, 84), (100, 60), (75, 45)])
+    def test_still_frame_matches_scale(self, frame, size):
+        """Without shake the window shows the scaled frame and nothing else"""
+        display = pygame.Surface(size)
+        display.fill((255, 0, 255))
+        Presenter().present(display, frame)
+        assert pygame.image.tobytes(display, 'RGB') == reference(frame, size, (0, 0))
+
+    def test_shake_clears_the_gaps(self, frame):
+        """An offset frame leaves black edges instead of the previous frame"""
+        display = pygame.Surface((140, 84))
+        display.fill((255, 0, 255))
+        Presenter().present(display, frame, (3, -2))
+        assert pygame.image.tobytes(display, 'RGB') == reference(frame, (140, 84), (3, -2))
+
+    def test_destination_is_reused(self, frame):
+        """Shaking frames scale into one surface until the window size changes"""
+        presenter = Presenter()
+        presenter.present(pygame.Surface((140, 84)), frame, (1, 1))
+        scaled = presenter.scaled
+        presenter.present(pygame.Surface((140, 84)), frame, (-1, 0))
+        assert presenter.scaled is scaled
+
+        presenter.present(pygame.Surface((200, 120)), frame, (1, 1))
+        assert presenter.scaled.get_size() == (200, 120)
+
+
+class TestScalingModes:
+    """Test the display.scaling options"""
+
+    def test_integer_letterboxes(self, frame):
+        """Integer mode draws at a whole factor centred between black bars"""
+        display = pygame.Surface((260, 140))
+        display.fill((255, 0, 255))
+        Presenter('integer').present(display, frame)
+
+        expected = pygame.Surface((260, 140))
+        expected.blit(pygame.transform.scale(frame, (200, 120)), (30, 10))
+        assert pygame.image.tobytes(display, 'RGB') == pygame.image.tobytes(expected, 'RGB')
+
+    def test_integer_clears_bars_after_shake(self, frame):
+        """The first still frame after a shake repaints the bars the shake drew over"""
+        presenter = Presenter('integer')
+        display = pygame.Surface((260, 140))
+        presenter.present(display, frame)
+        presenter.present(display, frame, (-25, 0))
+        presenter.present(display, frame)
+
+        expected = pygame.Surface((260, 140))
+        Presenter('integer').present(expected, frame)
+        assert pygame.image.tobytes(display, 'RGB') == pygame.image.tobytes(expected, 'RGB')
+
+    def test_integer_below_1x_fits(self, frame):
+        """A window smaller than the render size is filled as in fit mode"""
+        display = pygame.Surface((75, 45))
+        Presenter('integer').present(display, frame)
+        assert pygame.image.tobytes(display, 'RGB') == reference(frame, (75, 45), (0, 0))
+
+    def test_smooth_filters(self, frame):
+        """Smooth mode matches smoothscale"""
+        display = pygame.Surface((140, 84))
+        Presenter('smooth').present(display, frame)
+        expected = pygame.transform.smoothscale(frame, (140, 84))
+        assert pygame.image.tobytes(display, 'RGB') == pygame.image.tobytes(expected, 'RGB')
+
+    def test_unknown_mode_fits(self, frame):
+        """A misspelt mode falls back to fit"""
+        assert Presenter('pixel-perfect').scaling == 'fit'
+
+    def test_mouse_maps_through_letterbox(self, frame):
+        """Window positions map back to render pixels past the black bars"""
+        Presenter('integer').present(pygame.Surface((260, 140)), frame)
+        assert S.window_to_render((30, 10)) == (0, 0)
+        assert S.window_to_render((229, 129)) == (99, 59)
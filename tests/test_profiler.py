@@ -0,0 +1,107 @@
+"""
+Unit tests for PerformanceMonitor profiling scopes
+Tests nested scope paths, session histograms and spike capture
+"""
+
+import sys
+import os
+import json
+import time
+
+import pytest
+
+# Add parent directory to path so we can import our modules
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from src.core.performance import PerformanceMonitor, LatencyHistogram, SessionProfile
+
+
+def run_frame(monitor, sections):
+    """Run one monitored frame that enters each (outer, inner) section once"""
+    monitor.start_frame()
+    for outer, inner in sections:
+        with monitor.scope(outer):
+            if inner:
+                with monitor.scope(inner):
+                    time.sleep(0.001)
+    monitor.end_frame()
+
+
+class TestProfileScopes:
+    """Test named, nestable profiling scopes"""
+
+    def test_nested_scopes_use_paths(self):
+        """Inner scopes are recorded under the outer scope's path"""
+        monitor = PerformanceMonitor()
+        monitor.enabled = True
+        run_frame(monitor, [("enemies", "ai"), ("hud", None)])
+
+        stats = {path: avg for path, avg, _ in monitor.get_scope_stats()}
+        assert set(stats) == {"enemies", "enemies/ai", "hud"}
+        assert stats["enemies"] >= stats["enemies/ai"] >= 1.0
+
+    def test_repeated_scope_adds_up_within_frame(self):
+        """A scope entered twice in a frame reports one combined time"""
+        monitor = PerformanceMonitor()
+        monitor.enabled = True
+        run_frame(monitor, [("enemies", "collision"), ("enemies", "collision")])
+
+        (path, avg, worst), = [stat for stat in monitor.get_scope_stats() if stat[0] == "enemies/collision"]
+        assert avg == worst >= 2.0
+
+    def test_top_scopes_slowest_first(self):
+        """get_scope_stats(top) returns the slowest scopes in order"""
+        monitor = PerformanceMonitor()
+        monitor.enabled = True
+        run_frame(monitor, [("a", "slow"), ("a", "slow"), ("b", None)])
+
+        top = monitor.get_scope_stats(top=2)
+        assert [path for path, _, _ in top] == ["a", "a/slow"]
+
+    def test_disabled_monitor_records_nothing(self):
+        """Scopes are free no-ops while the monitor is disabled"""
+        monitor = PerformanceMonitor()
+        assert monitor.scope("enemies") is monitor.scope("hud")
+        run_frame(monitor, [("enemies", "ai")])
+        assert monitor.get_scope_stats() == []
+
+
+class TestSessionProfile:
+    """Test whole-session histograms and spike capture"""
+
+    def test_histogram_percentiles_within_bucket_precision(self):
+        """Percentiles land within the histogram's ~3% bucket width"""
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 10)  # 0.1ms .. 100ms
+        assert histogram.total == 1000
+        assert histogram.percentile(50) == pytest.approx(50, rel=0.04)
+        assert histogram.percentile(99) == pytest.approx(99, rel=0.04)
+        assert histogram.percentile(100) == histogram.max_ms == 100
+
+    def test_spikes_capture_scopes_and_context(self, tmp_path):
+        """Frames over budget are captured with their scopes and saved as JSON"""
+        monitor = PerformanceMonitor()
+        monitor.enabled = True
+        monitor.session = SessionProfile(spike_budget_ms=3)
+        monitor.context_provider = lambda: {'level': 2, 'camera_x': 480}
+
+        run_frame(monitor, [("hud", None)])  # ~1ms, under budget
+        monitor.start_frame()
+        with monitor.scope("hazards"):
+            time.sleep(0.005)
+        monitor.end_frame()
+
+        session = monitor.session
+        assert session.frames == 2 and session.spike_count == 1
+        spike = session.spikes[0]
+        assert spike['frame'] == 2
+        assert list(spike['scopes_ms']) == ["hazards"]
+        assert spike['context'] == {'level': 2, 'camera_x': 480}
+
+        path = tmp_path / "profiles" / "session.json"
+        session.save(path)
+        saved = json.loads(path.read_text())
+        assert saved['histograms']['frame']['count'] == 2
+        assert saved['spikes'][0]['context']['level'] == 2
@@ -0,0 +1,96 @@
+"""
+Unit tests for batched sprite drawing
+Tests that queued blits draw in order and that entity layers go through the queue
+"""
+
+import sys
+import os
+
+import pygame
+import pytest
+
+# Add parent directory to path so we can import our modules
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from src.core.headless import HeadlessRunner
+from src.core.performance import PerformanceMonitor
+from src.rendering.level_renderer import LevelRenderer
+from src.rendering.render_queue import RenderQueue
+from src.ui.enemy_health_display import EnemyHealthDisplay
+from src.utils import settings as S
+
+
+def solid(color):
+    """A 10x10 sprite of one colour"""
+    surface = pygame.Surface((10, 10))
+    surface.fill(color)
+    return surface
+
+
+class TestRenderQueue:
+    """Test queued blits"""
+
+    def test_flush_keeps_order(self):
+        """Later sprites cover earlier ones, as with individual blits"""
+        screen = pygame.Surface((40, 20))
+        queue = RenderQueue()
+        queue.add(solid((255, 0, 0)), (0, 0))
+        queue.extend([(solid((0, 255, 0)), (5, 0)), (solid((0, 0, 255)), (20, 5))])
+        assert len(queue) == 3
+
+        queue.flush(screen)
+        assert tuple(screen.get_at((2, 2)))[:3] == (255, 0, 0)
+        assert tuple(screen.get_at((7, 2)))[:3] == (0, 255, 0)
+        assert tuple(screen.get_at((22, 7)))[:3] == (0, 0, 255)
+        assert (len(queue), queue.submitted) == (0, 3)
+
+    @pytest.mark.usefixtures('repo_cwd')
+    def test_heart_blits_match_draw(self):
+        """Queued enemy hearts land where the per-heart blits of EnemyHealthDisplay.draw put them"""
+        runner = HeadlessRunner(1)
+        enemy = runner.simulation.enemies.sprites()[0]
+        enemy.max_health = 3
+        enemy.health = 2  # Both full and empty hearts
+        display = EnemyHealthDisplay()
+        camera_x = 12.5
+
+        # Hearts 20px wide with 4px gaps, centred on the hitbox, 28px above it
+        start_x = int(enemy.hitbox.centerx - (3 * 20 + 2 * 4) / 2.0 - camera_x)
+        start_y = enemy.hitbox.top - 28
+        blits = display.heart_blits(enemy, camera_x)
+        assert [dest for _, dest in blits] == [(start_x, start_y), (start_x + 24, start_y), (start_x + 48, start_y)]
+        assert [surface for surface, _ in blits] == [display.heart_full, display.heart_full, display.heart_empty]
+
+        # The loop draw() ran before hearts were batched
+        drawn = pygame.Surface((S.WINDOW_WIDTH, S.WINDOW_HEIGHT))
+        for i in range(enemy.max_health):
+            heart = display.heart_full if i < enemy.health else display.heart_empty
+            drawn.blit(heart, (int(start_x + i * 24), start_y))
+
+        queued = pygame.Surface((S.WINDOW_WIDTH, S.WINDOW_HEIGHT))
+        queue = RenderQueue()
+        queue.extend(blits)
+        queue.flush(queued)
+        assert pygame.image.tobytes(queued, 'RGB') == pygame.image.tobytes(drawn, 'RGB')
+
+    @pytest.mark.usefixtures('repo_cwd')
+    def test_dead_enemy_has_no_hearts(self):
+        """Nothing is queued above a defeated enemy"""
+        runner = HeadlessRunner(1)
+        enemy = runner.simulation.enemies.sprites()[0]
+        enemy.is_dead = True
+        assert EnemyHealthDisplay().heart_blits(enemy, 0) == []
+
+    @pytest.mark.usefixtures('repo_cwd')
+    def test_level_entities_are_batched(self):
+        """A level frame draws its enemies, coins and player through the queue"""
+        runner = HeadlessRunner(1)
+        simulation = runner.simulation
+        monitor = PerformanceMonitor()
+        monitor.enabled = False
+        renderer = LevelRenderer(simulation, simulation.particle_mgr, monitor)
+
+        renderer.draw(pygame.Surface((S.WINDOW_WIDTH, S.WINDOW_HEIGHT)), simulation.camera_x)
+        assert renderer.render_queue.submitted > 1
+        assert len(renderer.render_queue) == 0
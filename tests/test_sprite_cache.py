@@ -0,0 +1,102 @@
+"""
+Unit tests for the sprite sheet cache
+Tests that sprite sheets are decoded once and shared between entities
+"""
+
+import sys
+import os
+
+import pygame
+import pytest
+
+# Add parent directory to path so we can import our modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.sprite_cache import SpriteSheetCache
+from src.entities.enemies.elkman import Snowball
+from src.entities.enemies.northerner import Pilos
+from src.entities.enemies.spiked_slime import Spike
+
+
+@pytest.fixture
+def sheet_path(tmp_path):
+    """Write a 4-frame 80x30 sprite sheet and open a hidden display for convert_alpha"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    sheet = pygame.Surface((80, 30), pygame.SRCALPHA)
+    for i in range(4):
+        sheet.fill((60 * i, 100, 200, 255), (i * 20, 0, 20, 30))
+    path = str(tmp_path / "sheet.png")
+    pygame.image.save(sheet, path)
+
+    SpriteSheetCache.clear_cache()
+    yield path
+    SpriteSheetCache.clear_cache()
+
+
+class TestSpriteSheetCache:
+    """Test sprite sheet loading and sharing"""
+
+    def test_frames_are_shared(self, sheet_path):
+        """Repeated loads return the same frame tuple and count as hits"""
+        first = SpriteSheetCache.get_frames(sheet_path, 4, (40, 40))
+        second = SpriteSheetCache.get_frames(sheet_path, 4, (40, 40))
+
+        assert first is second
+        assert len(first) == 4
+        assert all(frame.get_size() == (40, 40) for frame in first)
+        assert tuple(first[2].get_at((20, 20))) == (120, 100, 200, 255)
+
+        info = SpriteSheetCache.get_cache_info()
+        assert (info['size'], info['hits'], info['misses']) == (1, 1, 1)
+        assert info['bytes'] == 4 * 40 * 40 * 4
+
+    def test_target_height_keeps_aspect(self, sheet_path):
+        """An int target scales to that height and is cached separately from a size"""
+        frames = SpriteSheetCache.get_frames(sheet_path, 4, 60)
+        assert all(frame.get_size() == (40, 60) for frame in frames)
+        assert SpriteSheetCache.get_frames(sheet_path, 4, (40, 60)) is not frames
+
+    def test_missing_sheet_is_not_cached(self, tmp_path):
+        """Load errors propagate so entities can use their fallback sprite"""
+        with pytest.raises((FileNotFoundError, pygame.error)):
+            SpriteSheetCache.get_frames(str(tmp_path / "missing.png"), 4, 60)
+        assert SpriteSheetCache.get_cache_info()['size'] == 0
+
+    def test_mirrored_frames_built_at_load(self, sheet_path):
+        """Each frame has a mirrored copy ready before it is first requested"""
+        frames = SpriteSheetCache.get_frames(sheet_path, 4, (40, 40))
+        info = SpriteSheetCache.get_cache_info()
+        assert info['mirrored_frames'] == 4
+        assert info['mirrored_bytes'] == info['bytes']
+
+        frame = frames[1]
+        mirrored = SpriteSheetCache.get_mirrored(frame)
+        assert mirrored is SpriteSheetCache.get_mirrored(frame)
+        assert mirrored.get_size() == frame.get_size()
+        assert SpriteSheetCache.get_cache_info()['mirrored_frames'] == 4
+
+
+class TestProjectileSprites:
+    """Test that thrown projectiles share their sprites"""
+
+    @pytest.mark.parametrize('projectile', [Snowball, Spike, Pilos])
+    @pytest.mark.usefixtures('repo_cwd')
+    def test_projectiles_share_one_image(self, sheet_path, monkeypatch, projectile):
+        """Every throw reuses the loaded (or fallback) image, mirrored once for the left"""
+        monkeypatch.setattr(projectile, '_fallback_image', None)
+
+        right = [projectile(100, 100, 1) for _ in range(3)]
+        left = [projectile(100, 100, -1) for _ in range(3)]
+        assert all(p.image is right[0].image for p in right)
+        assert all(p.image is left[0].image for p in left)
+        assert SpriteSheetCache.get_cache_info()['size'] <= 1
+
+    @pytest.mark.usefixtures('repo_cwd')
+    def test_pilos_faces_its_direction(self, sheet_path):
+        """A spear thrown left is the mirrored right-facing spear"""
+        right = Pilos(100, 100, 1).image
+        left = Pilos(100, 100, -1).image
+        assert left is SpriteSheetCache.get_mirrored(right)
@@ -0,0 +1,78 @@
+"""
+Unit tests for the static layer renderer
+Tests that baked chunks draw the same pixels as per-platform drawing
+"""
+
+import random
+import sys
+import os
+
+import pygame
+
+# Add parent directory to path so we can import our modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.fixed_timestep import RenderInterpolator
+from src.rendering.platform_textures import PlatformTextureCache
+from src.rendering.static_layer import StaticLayerRenderer
+
+
+def random_platforms(seed, count=40, level_width=6000):
+    """Build a random level of overlapping brick platforms"""
+    rng = random.Random(seed)
+    styles = ['brick', 'icy_brick', 'snowy', 'wooden']
+    return [(rng.choice(styles),
+             pygame.Rect(rng.randint(-50, level_width), rng.randint(150, 560),
+                         rng.randint(40, 1500), rng.randint(16, 80)))
+            for _ in range(count)]
+
+
+class TestStaticLayerRenderer:
+    """Test chunk baking, drawing and eviction"""
+
+    def test_matches_per_platform_drawing(self):
+        """Chunk blits produce the same pixels as drawing every platform"""
+        platforms = random_platforms(seed=3)
+        layer = StaticLayerRenderer(platforms, 800, 600, chunk_width=512)
+
+        for camera_x in (0, 300, 511, 512, 1999, 4321, 5600):
+            baked = pygame.Surface((800, 600))
+            baked.fill((50, 50, 80))
+            direct = baked.copy()
+
+            layer.draw(baked, camera_x)
+            for style, rect in platforms:
+                PlatformTextureCache.draw(direct, style, rect, camera_x)
+
+            assert pygame.image.tobytes(baked, 'RGB') == pygame.image.tobytes(direct, 'RGB')
+
+    def test_sprites_stay_on_baked_ground_between_steps(self):
+        """An interpolated camera scrolls the baked layer and sprite blits by the same pixel"""
+        platform = pygame.Rect(100, 300, 64, 32)
+        layer = StaticLayerRenderer([('brick', platform)], 800, 600, chunk_width=512)
+        sprite = pygame.Surface((1, 1))
+        sprite.fill((255, 0, 0))
+
+        for alpha in (0.25, 0.5, 0.75):
+            camera_x = RenderInterpolator().camera(10.0, 21.0, alpha)  # 12.75, 15.5, 18.25 before rounding
+            screen = pygame.Surface((800, 600))
+            layer.draw(screen, camera_x)
+            screen.blit(sprite, (platform.x - camera_x, platform.y - 1))  # Sprite standing on the left edge
+
+            ground_x = next(x for x in range(800) if tuple(screen.get_at((x, platform.y + 8)))[:3] != (0, 0, 0))
+            sprite_x = next(x for x in range(800) if tuple(screen.get_at((x, platform.y - 1)))[:3] == (255, 0, 0))
+            assert sprite_x == ground_x
+
+    def test_evicts_chunks_away_from_camera(self):
+        """Scrolling across the level keeps the layer near its memory budget"""
+        platforms = random_platforms(seed=5)
+        chunk_bytes = 512 * 600 * 4
+        layer = StaticLayerRenderer(platforms, 800, 600, chunk_width=512, max_bytes=4 * chunk_bytes)
+
+        for camera_x in range(0, 6000, 64):
+            layer.draw(pygame.Surface((800, 600)), camera_x)
+            assert layer.bytes <= 5 * chunk_bytes
+
+        info = layer.get_cache_info()
+        assert info['evictions'] > 0
+        assert info['bytes'] == info['chunks'] * chunk_bytes
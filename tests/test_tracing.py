@@ -0,0 +1,74 @@
+"""
+Unit tests for Chrome trace-event export
+Tests the trace file format, the bounded event buffer and PerformanceMonitor integration
+"""
+
+import sys
+import os
+import json
+
+# Add parent directory to path so we can import our modules
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from src.core.tracing import TraceWriter, trace_span
+from src.core.performance import PerformanceMonitor
+
+
+class TestTraceWriter:
+    """Test streaming trace events to a file"""
+
+    def test_trace_file_is_chrome_trace_json(self, tmp_path):
+        """Spans and markers are written as trace events with microsecond times"""
+        tracer = TraceWriter(tmp_path / "trace.json")
+        with tracer.span("level.load", 'load', level=3):
+            pass
+        tracer.instant("checkpoint")
+        tracer.close()
+        tracer.close()
+
+        events = json.loads((tmp_path / "trace.json").read_text())
+        names = [event['name'] for event in events]
+        assert names[:2] == ['process_name', 'thread_name']
+        load = events[names.index('level.load')]
+        assert load['ph'] == 'X' and load['dur'] >= 0 and load['args'] == {'level': 3}
+        assert events[names.index('checkpoint')]['ph'] == 'i'
+
+    def test_full_buffer_drops_events(self, tmp_path):
+        """Events past the buffer capacity are dropped and counted, never blocking"""
+        tracer = TraceWriter(tmp_path / "trace.json", capacity=3, flush_interval=60)
+        for i in range(5):
+            tracer.instant(f"event {i}")
+        assert tracer.dropped == 2
+        tracer.close()
+
+        events = json.loads((tmp_path / "trace.json").read_text())
+        assert [event['name'] for event in events if event.get('ph') == 'i'] == ['event 0', 'event 1', 'event 2']
+        assert events[-1]['name'] == 'dropped_events' and events[-1]['args']['count'] == 2
+
+    def test_trace_span_without_tracer_is_noop(self):
+        """trace_span is safe to use when tracing is off"""
+        with trace_span("score.submit"):
+            pass
+
+    def test_monitor_streams_frames_and_scopes(self, tmp_path):
+        """PerformanceMonitor phases and scopes become nested trace events"""
+        tracer = TraceWriter(tmp_path / "trace.json")
+        monitor = PerformanceMonitor()
+        monitor.enabled = True
+        monitor.tracer = tracer
+
+        monitor.start_frame()
+        monitor.start_update()
+        with monitor.scope("enemies"):
+            with monitor.scope("ai"):
+                pass
+        monitor.end_update()
+        monitor.end_frame()
+        tracer.close()
+
+        events = {event['name']: event for event in json.loads((tmp_path / "trace.json").read_text())}
+        frame, update, enemies, ai = events['frame'], events['update'], events['enemies'], events['ai']
+        assert frame['args'] == {'frame': 1}
+        assert frame['ts'] <= update['ts'] <= enemies['ts'] <= ai['ts']
+        assert ai['ts'] + ai['dur'] <= enemies['ts'] + enemies['dur'] + 0.2